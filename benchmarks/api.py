@@ -0,0 +1,128 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+CHARGE = {"amount": 1000, "currency": "EUR", "customerId": "cust_00000000"}
+CUSTOMER = {"email": "user@example.com", "metadata": {"note": "zamówienie"}}
+LIST = {"limit": 100}
+
+# resource -> operation -> call; every operation is measured against the stub
+# server at each concurrency level.
+OPERATIONS = {
+    "blacklist": {
+        "create": lambda c: c.blacklist.create({"ruleType": "email", "email": "x@y"}),
+        "get": lambda c: c.blacklist.get("blr_1"),
+        "list": lambda c: c.blacklist.list(LIST),
+    },
+    "cards": {
+        "create": lambda c: c.cards.create("cust_1", {"number": "4242424242424242"}),
+        "get": lambda c: c.cards.get("cust_1", "card_1"),
+        "list": lambda c: c.cards.list("cust_1", LIST),
+    },
+    "charges": {
+        "create": lambda c: c.charges.create(CHARGE),
+        "get": lambda c: c.charges.get("char_1"),
+        "list": lambda c: c.charges.list(LIST),
+    },
+    "credits": {
+        "create": lambda c: c.credits.create(CHARGE),
+        "get": lambda c: c.credits.get("cred_1"),
+        "list": lambda c: c.credits.list(LIST),
+    },
+    "customers": {
+        "create": lambda c: c.customers.create(CUSTOMER),
+        "get": lambda c: c.customers.get("cust_1"),
+        "list": lambda c: c.customers.list(LIST),
+    },
+    "disputes": {
+        "get": lambda c: c.disputes.get("dis_1"),
+        "list": lambda c: c.disputes.list(LIST),
+    },
+    "events": {
+        "get": lambda c: c.events.get("evt_1"),
+        "list": lambda c: c.events.list(LIST),
+    },
+    "file_uploads": {
+        "get": lambda c: c.file_uploads.get("file_1"),
+        "list": lambda c: c.file_uploads.list(LIST),
+    },
+    "fraud_warnings": {
+        "get": lambda c: c.fraud_warnings.get("fw_1"),
+        "list": lambda c: c.fraud_warnings.list(LIST),
+    },
+    "payment_methods": {
+        "create": lambda c: c.payment_methods.create({"type": "card"}),
+        "get": lambda c: c.payment_methods.get("pm_1"),
+        "list": lambda c: c.payment_methods.list(LIST),
+    },
+    "plans": {
+        "create": lambda c: c.plans.create({"amount": 1000, "currency": "EUR"}),
+        "get": lambda c: c.plans.get("plan_1"),
+        "list": lambda c: c.plans.list(LIST),
+    },
+    "subscriptions": {
+        "create": lambda c: c.subscriptions.create({"planId": "plan_1"}),
+        "get": lambda c: c.subscriptions.get("sub_1"),
+        "list": lambda c: c.subscriptions.list(LIST),
+    },
+    "tokens": {
+        "create": lambda c: c.tokens.create({"number": "4242424242424242"}),
+        "get": lambda c: c.tokens.get("tok_1"),
+    },
+}
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def measure(client, call, requests, concurrency):
+    latencies = []
+    lock = threading.Lock()
+
+    def worker(count):
+        local = []
+        for _ in range(count):
+            started = time.perf_counter()
+            call(client)
+            local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+
+    call(client)  # warm up the connection pool
+    shares = [requests // concurrency] * concurrency
+    started = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        for future in [executor.submit(worker, share) for share in shares]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+    }
+
+
+def run(client, concurrency_levels, requests, resources=None):
+    results = {}
+    for resource, operations in sorted(OPERATIONS.items()):
+        if resources and resource not in resources:
+            continue
+        for operation, call in sorted(operations.items()):
+            for concurrency in concurrency_levels:
+                name = "api/%s.%s/c%s" % (resource, operation, concurrency)
+                results[name] = measure(client, call, requests, concurrency)
+                print(
+                    "%-40s %9.1f req/s  p50 %7.3f ms  p99 %7.3f ms"
+                    % (
+                        name,
+                        results[name]["rps"],
+                        results[name]["p50_ms"],
+                        results[name]["p99_ms"],
+                    )
+                )
+    return results
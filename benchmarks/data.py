@@ -0,0 +1,14 @@
+# The response shapes are shared with the unit tests.
+from tests.unit.support.fixtures import card, charge, customer
+
+
+def obj(path, i=0):
+    if path.startswith("/customers") and "/cards" in path:
+        return card(i)
+    if path.startswith("/customers"):
+        return customer(i)
+    return dict(charge(i), id="%s_%08d" % (path.strip("/").split("/")[0][:4], i))
+
+
+def page(path, limit):
+    return {"list": [obj(path, i) for i in range(limit)], "hasMore": False}
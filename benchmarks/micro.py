@@ -0,0 +1,78 @@
+import json
+import timeit
+
+from benchmarks import data
+from benchmarks.api import CHARGE
+from shift4 import InProcessTransport, Shift4Client, Shift4Exception, checkout_request
+from shift4.transport import Response
+
+CHECKOUT_REQUEST = {
+    "charge": {"amount": 499, "currency": "EUR"},
+    "customerId": "cust_00000000",
+    "threeDSecure": {"enable": True},
+}
+ERROR = {"error": {"type": "card_error", "code": "card_declined", "message": "x"}}
+
+
+def _client():
+    charge = json.dumps(data.charge()).encode()
+    return Shift4Client(
+        "sk_test_benchmark",
+        transport=InProcessTransport(lambda request: Response(200, {}, charge)),
+    )
+
+
+def _prepare_request(client):
+    headers = client._create_headers({"idempotency_key": "key"})
+    client._prepare_request("/charges", None, CHARGE, None, None, headers)
+
+
+def _handle_error(client, response):
+    try:
+        client._handle_response(response)
+    except Shift4Exception:
+        pass
+
+
+def benchmarks():
+    client = _client()
+    list_page = Response(200, {}, json.dumps(data.page("/charges", 100)).encode())
+    charge = Response(200, {}, json.dumps(data.charge()).encode())
+    error = Response(402, {}, json.dumps(ERROR).encode())
+    signed = checkout_request.sign(CHECKOUT_REQUEST, secret_key="sk_test_benchmark")
+    return {
+        "micro/prepare_request": lambda: _prepare_request(client),
+        "micro/create_headers": lambda: client._create_headers(
+            {"idempotency_key": "key"}
+        ),
+        "micro/json_encode_charge": lambda: client.codec.dumps(CHARGE),
+        "micro/json_decode_charge": lambda: client._handle_response(charge),
+        "micro/json_decode_list_page": lambda: client._handle_response(list_page),
+        "micro/exception_from_response": lambda: _handle_error(client, error),
+        "micro/exception_construct": lambda: Shift4Exception(
+            "card_error", "card_declined", "Card declined", "char_1", None
+        ),
+        "micro/checkout_sign": lambda: checkout_request.sign(
+            CHECKOUT_REQUEST, secret_key="sk_test_benchmark"
+        ),
+        "micro/checkout_verify": lambda: checkout_request.verify(
+            signed, secret_key="sk_test_benchmark"
+        ),
+        "micro/in_process_get": lambda: client.charges.get("char_1"),
+    }
+
+
+def measure(function, min_time):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    number = max(1, int(number * min_time / 0.2))
+    best = min(timer.repeat(repeat=5, number=number))
+    return {"ns_per_op": round(best / number * 1e9, 1)}
+
+
+def run(min_time):
+    results = {}
+    for name, function in sorted(benchmarks().items()):
+        results[name] = measure(function, min_time)
+        print("%-40s %12.1f ns/op" % (name, results[name]["ns_per_op"]))
+    return results
@@ -0,0 +1,170 @@
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+from benchmarks import api, micro
+from benchmarks.stub_server import StubServer
+from shift4 import PooledTransport, Shift4Client
+from shift4.__version__ import __version__
+
+# metric -> True when a higher value is better
+METRICS = {"rps": True, "p50_ms": False, "p99_ms": False, "ns_per_op": False}
+# Tail latency varies far more between runs than medians and throughput, so
+# it is compared with --tail-threshold instead of --threshold.
+TAIL_METRICS = {"p99_ms"}
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Measure SDK overhead, throughput and latency offline."
+    )
+    parser.add_argument("--suite", choices=["all", "api", "micro"], default="all")
+    parser.add_argument("--quick", action="store_true", help="short run for CI")
+    parser.add_argument("--concurrency", default="1,8,32")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--repeats",
+        type=int,
+        help="runs whose median is reported (default 5, 3 with --quick)",
+    )
+    parser.add_argument("--resources", help="comma separated resource names")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON file to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="relative change reported as a regression (default 0.5)",
+    )
+    parser.add_argument(
+        "--tail-threshold",
+        type=float,
+        default=1.0,
+        help="relative p99 change reported as a regression (default 1.0)",
+    )
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.requests = min(args.requests, 640)
+    if args.repeats is None:
+        args.repeats = 3 if args.quick else 5
+    return args
+
+
+def run(args):
+    runs = []
+    for repeat in range(args.repeats):
+        print("# run %d/%d" % (repeat + 1, args.repeats))
+        runs.append(run_once(args))
+    return {
+        "meta": {
+            "shift4": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "repeats": args.repeats,
+            "requests": args.requests,
+        },
+        "results": median_results(runs),
+    }
+
+
+def run_once(args):
+    results = {}
+    if args.suite in ("all", "micro"):
+        results.update(micro.run(min_time=0.05 if args.quick else 0.5))
+    if args.suite in ("all", "api"):
+        concurrency_levels = [int(level) for level in args.concurrency.split(",")]
+        resources = args.resources.split(",") if args.resources else None
+        with StubServer() as server:
+            pool_size = max(concurrency_levels)
+            with Shift4Client(
+                "sk_test_benchmark",
+                api_url=server.url,
+                uploads_url=server.url,
+                transport=PooledTransport(pool_maxsize=pool_size),
+            ) as client:
+                results.update(
+                    api.run(client, concurrency_levels, args.requests, resources)
+                )
+    return results
+
+
+# Median of every metric across runs, so a single noisy run does not move
+# the reported value.
+def median_results(runs):
+    return {
+        name: {
+            metric: statistics.median(run[name][metric] for run in runs)
+            for metric in metrics
+        }
+        for name, metrics in runs[0].items()
+    }
+
+
+def compare(baseline, current, threshold, tail_threshold):
+    regressions = []
+    for name, metrics in sorted(current["results"].items()):
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            if metric not in metrics or not previous.get(metric):
+                continue
+            change = (metrics[metric] - previous[metric]) / previous[metric]
+            if higher_is_better:
+                change = -change
+            if change > (tail_threshold if metric in TAIL_METRICS else threshold):
+                regressions.append((name, metric, previous[metric], metrics[metric]))
+    return regressions
+
+
+# Measures the benchmarks that regressed once more and keeps only the
+# regressions that show up again, so a noisy moment on a shared machine does
+# not fail the comparison.
+def confirm(args, baseline, regressions):
+    names = {name for name, _, _, _ in regressions}
+    resources = sorted(
+        {name.split("/")[1].split(".")[0] for name in names if name.startswith("api/")}
+    )
+    micro = any(name.startswith("micro/") for name in names)
+    rerun_args = argparse.Namespace(**vars(args))
+    rerun_args.suite = "all" if resources and micro else "api" if resources else "micro"
+    rerun_args.resources = ",".join(resources) or None
+    print("# re-measuring %d regressed benchmarks" % len(names))
+    current = run(rerun_args)
+    flagged = {(name, metric) for name, metric, _, _ in regressions}
+    return [
+        regression
+        for regression in compare(
+            baseline, current, args.threshold, args.tail_threshold
+        )
+        if regression[:2] in flagged
+    ]
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    current = run(args)
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(current, output, indent=2, sort_keys=True)
+            output.write("\n")
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+        regressions = compare(baseline, current, args.threshold, args.tail_threshold)
+        if regressions:
+            regressions = confirm(args, baseline, regressions)
+        for name, metric, previous, value in regressions:
+            print("REGRESSION %s %s: %s -> %s" % (name, metric, previous, value))
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks import data
+
+# Paths of list endpoints, every other GET is treated as a single object.
+LIST_PATHS = (
+    "/blacklist",
+    "/charges",
+    "/credits",
+    "/customers",
+    "/disputes",
+    "/events",
+    "/files",
+    "/fraud-warnings",
+    "/payment-methods",
+    "/plans",
+    "/subscriptions",
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path in LIST_PATHS or url.path.endswith("/cards"):
+            limit = int(parse_qs(url.query).get("limit", ["10"])[0])
+            self._reply(self.server.page(url.path, limit))
+        else:
+            self._reply(self.server.object(url.path))
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        self._reply(self.server.object(urlsplit(self.path).path))
+
+    def do_DELETE(self):
+        self._reply(self.server.object(urlsplit(self.path).path))
+
+    def _reply(self, payload):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address):
+        ThreadingHTTPServer.__init__(self, address, _Handler)
+        self._cache = {}
+
+    # Responses are encoded once per path so that the server spends as
+    # little time as possible outside of the SDK being measured.
+    def object(self, path):
+        key = ("object", path.split("/")[1], "/cards" in path)
+        if key not in self._cache:
+            self._cache[key] = json.dumps(data.obj(path)).encode()
+        return self._cache[key]
+
+    def page(self, path, limit):
+        key = ("page", path, limit)
+        if key not in self._cache:
+            self._cache[key] = json.dumps(data.page(path, limit)).encode()
+        return self._cache[key]
+
+
+class StubServer(object):
+    def __init__(self, host="127.0.0.1", port=0):
+        self.address = (host, port)
+
+    def __enter__(self):
+        self.server = _Server(self.address)
+        self.url = "http://%s:%s" % self.server.server_address
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.server.shutdown()
+        self.server.server_close()
@@ -28,7 +28,14 @@ setup(
         "Programming Language :: Python :: 3.11",
     ],
     keywords="payment",
-    packages=find_packages(exclude=["tests*"]),
+    packages=find_packages(exclude=["tests*", "benchmarks*"]),
     install_requires=INSTALL_REQUIRES,
+    extras_require={
+        "async": ["httpx >= 0.23"],
+        "http2": ["httpx[http2] >= 0.23"],
+        "orjson": ["orjson >= 3.6"],
+        "prometheus": ["prometheus_client >= 0.12"],
+        "opentelemetry": ["opentelemetry-api >= 1.0"],
+    },
     test_suite="tests",
 )
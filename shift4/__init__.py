@@ -15,22 +15,97 @@ from shift4 import (
     subscriptions,
     tokens,
 )
-from shift4.exception import Shift4Exception
+from shift4.async_client import AsyncShift4Client
+from shift4.cache import ResponseCache
+from shift4.checkout_request import CheckoutRequestSigner
+from shift4.circuit_breaker import CircuitBreaker
+from shift4.client import API_URL, UPLOADS_URL, Shift4Client, _DefaultClient
+from shift4.codec import JsonCodec, OrjsonCodec, default_codec
+from shift4.event_consumer import (
+    AsyncEventConsumer,
+    EventConsumer,
+    FileCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from shift4.exception import (
+    Shift4CircuitOpenException,
+    Shift4CursorNotFoundException,
+    Shift4Exception,
+    Shift4TimeoutException,
+)
+from shift4.hooks import Hooks
+from shift4.httpx_transport import AsyncHttpxTransport, HttpxTransport
+from shift4.instrumentation import (
+    CompositeInstrumentation,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusInstrumentation,
+)
+from shift4.models import (
+    BlacklistRule,
+    Card,
+    Charge,
+    Credit,
+    Customer,
+    Dispute,
+    Event,
+    FileUpload,
+    FraudWarning,
+    ListResponse,
+    Model,
+    PaymentMethod,
+    Plan,
+    Subscription,
+    Token,
+)
+from shift4.rate_limit import RateLimiter, TokenBucket
+from shift4.retry import RetryPolicy
+from shift4.session_pool import SessionPool
+from shift4.single_flight import AsyncSingleFlight, SingleFlight
+from shift4.timeouts import DEFAULT_TIMEOUT, Timeout, deadline
+from shift4.transport import (
+    AsyncInProcessTransport,
+    AsyncTransport,
+    InProcessTransport,
+    PooledTransport,
+    RequestsTransport,
+    Transport,
+)
 
-api_url = "https://api.shift4.com"
-uploads_url = "https://uploads.api.shift4.com"
+api_url = API_URL
+uploads_url = UPLOADS_URL
 secret_key = None
+default_transport = PooledTransport()
+retry_policy = RetryPolicy()
+timeout = DEFAULT_TIMEOUT
+json_codec = default_codec()
+use_models = False
+response_cache = None
+default_single_flight = None
+rate_limiter = None
+default_circuit_breaker = None
+default_instrumentation = None
+default_hooks = Hooks()
+default_client = _DefaultClient()
+
+blacklist = default_client.blacklist
+cards = default_client.cards
+charges = default_client.charges
+credits = default_client.credits
+customers = default_client.customers
+disputes = default_client.disputes
+file_uploads = default_client.file_uploads
+events = default_client.events
+fraud_warnings = default_client.fraud_warnings
+payment_methods = default_client.payment_methods
+plans = default_client.plans
+subscriptions = default_client.subscriptions
+tokens = default_client.tokens
+
+
+def apply_events(events, replace=False):
+    default_client.apply_events(events, replace)
+
 
-blacklist = blacklist.Blacklist()
-cards = cards.Cards()
-charges = charges.Charges()
-credits = credits.Credits()
-customers = customers.Customers()
-disputes = disputes.Disputes()
-file_uploads = file_uploads.FileUploads()
-events = events.Events()
-fraud_warnings = fraud_warnings.FraudWarnings()
-payment_methods = payment_methods.PaymentMethods()
-plans = plans.Plans()
-subscriptions = subscriptions.Subscriptions()
-tokens = tokens.Tokens()
+def close():
+    default_client.close()
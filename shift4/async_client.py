@@ -0,0 +1,199 @@
+import asyncio
+import inspect
+import time
+
+import requests
+
+from shift4.bulk import DEFAULT_CONCURRENCY, async_get_many, async_run_many
+from shift4.client import API_URL, UPLOADS_URL, BaseClient
+from shift4.codec import default_codec
+from shift4.exception import Shift4TimeoutException
+from shift4.httpx_transport import AsyncHttpxTransport
+from shift4.hooks import Hooks
+from shift4.instrumentation import RequestCall
+from shift4.pagination import async_paginate
+from shift4.retry import RetryPolicy
+from shift4.timeouts import DEFAULT_TIMEOUT
+from shift4.transport import Request
+
+
+class AsyncShift4Client(BaseClient):
+    def __init__(
+        self,
+        secret_key=None,
+        api_url=API_URL,
+        uploads_url=UPLOADS_URL,
+        transport=None,
+        max_connections=100,
+        max_keepalive_connections=20,
+        retry_policy=None,
+        timeout=DEFAULT_TIMEOUT,
+        http2=False,
+        codec=None,
+        use_models=False,
+        cache=None,
+        single_flight=None,
+        rate_limiter=None,
+        circuit_breaker=None,
+        instrumentation=None,
+        hooks=None,
+    ):
+        if transport is None:
+            transport = AsyncHttpxTransport(
+                http2=http2,
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            )
+        self.secret_key = secret_key
+        self.api_url = api_url
+        self.uploads_url = uploads_url
+        self.transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self.codec = codec or default_codec()
+        self.use_models = use_models
+        self.cache = cache
+        self.single_flight = single_flight
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.instrumentation = instrumentation
+        self.hooks = Hooks() if hooks is None else hooks
+        self._init_resources()
+
+    async def request(
+        self,
+        method,
+        path,
+        params=None,
+        json=None,
+        files=None,
+        url=None,
+        request_options=None,
+        model=None,
+    ):
+        cache_key, cached = self._cache_lookup(method, path, params, url)
+        if cached is not None:
+            return self._handle_response(cached, model)
+        request_options = self._request_options(method, files, request_options)
+        headers = self._create_headers(request_options)
+        request_url, body = self._prepare_request(
+            path, params, json, files, url, headers
+        )
+        call = None
+        if self.instrumentation is not None:
+            call = RequestCall(method, request_url)
+            self.instrumentation.start(call)
+        resp = None
+        try:
+            if self.single_flight is not None and method == "GET":
+                resp = await self.single_flight.do(
+                    (self.secret_key, request_url),
+                    lambda: self._send(
+                        method, path, request_url, headers, body, request_options, call
+                    ),
+                )
+            else:
+                resp = await self._send(
+                    method, path, request_url, headers, body, request_options, call
+                )
+            self._cache_update(method, path, url, cache_key, resp)
+            result = self._handle_response(resp, model)
+        except BaseException as e:
+            if call is not None:
+                self._finish_call(call, resp, e)
+            if self.hooks.on_error and isinstance(e, Exception):
+                request = Request(method, request_url, headers, body)
+                for hook in self.hooks.on_error:
+                    await _maybe_await(hook(request, e))
+            raise
+        finally:
+            if files is not None:
+                body.close()
+        if call is not None:
+            self._finish_call(call, resp)
+        return result
+
+    async def _send(self, method, path, url, headers, body, request_options, call=None):
+        retryable = self.retry_policy.is_retryable(method, headers)
+        attempt = 1
+        while True:
+            # An open circuit fails before a rate limit token is taken.
+            permit = self._circuit_acquire(url)
+            wait = self._rate_limit_wait(path)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            timeout = self._attempt_timeout(request_options).as_tuple()
+            started = time.monotonic()
+            if call is not None:
+                call.retries = attempt - 1
+                call.bytes_sent += len(body or b"")
+            try:
+                resp = await self._dispatch(method, url, headers, body, timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._circuit_record(permit, started)
+                delay = self._retry_delay(retryable, attempt)
+                if delay is None:
+                    if isinstance(e, requests.Timeout):
+                        raise Shift4TimeoutException(str(e))
+                    raise
+            else:
+                self._circuit_record(permit, started, resp)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(
+                        path, resp.status_code, resp.headers.get("Retry-After")
+                    )
+                delay = self._retry_delay(retryable, attempt, resp)
+                if delay is None:
+                    return resp
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _dispatch(self, method, url, headers, body, timeout):
+        if not self.hooks:
+            return await self.transport.send(
+                method, url, headers, body, timeout=timeout
+            )
+        request = Request(method, url, headers, body)
+        resp = None
+        for hook in self.hooks.before_send:
+            resp = await _maybe_await(hook(request))
+            if resp is not None:
+                break
+        if resp is None:
+            resp = await self.transport.send(
+                request.method,
+                request.url,
+                request.headers,
+                request.body,
+                timeout=timeout,
+            )
+        for hook in self.hooks.after_response:
+            resp = await _maybe_await(hook(request, resp)) or resp
+        return resp
+
+    def paginate(self, list_page, params=None, page_size=None, prefetch=0):
+        return async_paginate(list_page, params, page_size, prefetch)
+
+    async def run_many(self, call, items, concurrency=DEFAULT_CONCURRENCY):
+        return await async_run_many(call, items, concurrency)
+
+    async def chain(self, result, fn):
+        return await _maybe_await(fn(await result))
+
+    async def get_many(self, get, keys, concurrency=DEFAULT_CONCURRENCY):
+        return await async_get_many(get, keys, concurrency)
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+async def _maybe_await(result):
+    if inspect.isawaitable(result):
+        return await result
+    return result
@@ -1,15 +1,25 @@
+from shift4.models import BlacklistRule
 from shift4.resource import Resource
 
 
 class Blacklist(Resource):
+    model = BlacklistRule
+
     def create(self, params, request_options=None):
         return self._post("/blacklist", params, request_options=request_options)
 
-    def get(self, blacklist_rule_id):
-        return self._get("/blacklist/%s" % blacklist_rule_id)
+    def get(self, blacklist_rule_id, request_options=None):
+        return self._get(
+            "/blacklist/%s" % blacklist_rule_id, request_options=request_options
+        )
+
+    def delete(self, blacklist_rule_id, request_options=None):
+        return self._delete(
+            "/blacklist/%s" % blacklist_rule_id, request_options=request_options
+        )
 
-    def delete(self, blacklist_rule_id):
-        return self._delete("/blacklist/%s" % blacklist_rule_id)
+    def list(self, params=None, request_options=None):
+        return self._get("/blacklist", params, request_options=request_options)
 
-    def list(self, params=None):
-        return self._get("/blacklist", params)
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
@@ -0,0 +1,72 @@
+import asyncio
+import contextvars
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from shift4.exception import Shift4Exception
+
+DEFAULT_CONCURRENCY = 10
+
+# Failures of a single item are returned in its place rather than raised, so
+# one declined charge or one unreadable file to upload does not abort the rest
+# of the batch. OSError also covers requests.RequestException.
+ITEM_ERRORS = (Shift4Exception, OSError)
+
+
+# Calls call(item) for every item with at most concurrency calls in flight and
+# returns the results in input order. Items are consumed lazily, so only
+# concurrency of them are pending at any time.
+def run_many(call, items, concurrency=DEFAULT_CONCURRENCY):
+    results = []
+    pending = {}
+    with ThreadPoolExecutor(concurrency) as executor:
+        for index, item in enumerate(items):
+            if len(pending) >= concurrency:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                _collect(done, pending, results)
+            results.append(None)
+            # Calls run in a copy of the caller's context, so an enclosing
+            # shift4.deadline() applies to them.
+            context = contextvars.copy_context()
+            pending[executor.submit(context.run, call, item)] = index
+        _collect(list(pending), pending, results)
+    return results
+
+
+# Fetches every distinct key with get(key) and returns a dict mapping each key
+# to its result or error, in first-seen order.
+def get_many(get, keys, concurrency=DEFAULT_CONCURRENCY):
+    keys = list(dict.fromkeys(keys))
+    return dict(zip(keys, run_many(get, keys, concurrency)))
+
+
+async def async_run_many(call, items, concurrency=DEFAULT_CONCURRENCY):
+    results = []
+    pending = {}
+    try:
+        for index, item in enumerate(items):
+            if len(pending) >= concurrency:
+                done, _ = await asyncio.wait(pending, return_when=FIRST_COMPLETED)
+                _collect(done, pending, results)
+            results.append(None)
+            pending[asyncio.ensure_future(call(item))] = index
+        if pending:
+            await asyncio.wait(pending)
+        _collect(list(pending), pending, results)
+    finally:
+        for task in pending:
+            task.cancel()
+    return results
+
+
+async def async_get_many(get, keys, concurrency=DEFAULT_CONCURRENCY):
+    keys = list(dict.fromkeys(keys))
+    return dict(zip(keys, await async_run_many(get, keys, concurrency)))
+
+
+def _collect(done, pending, results):
+    for future in done:
+        index = pending.pop(future)
+        try:
+            results[index] = future.result()
+        except ITEM_ERRORS as e:
+            results[index] = e
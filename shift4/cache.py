@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+
+from shift4.codec import JsonCodec
+
+# Seconds a retrieved object stays cached, by the collection in its path
+# (/plans/{id} -> "plans"). None caches objects until they are evicted, which
+# suits events as they never change. Objects of collections not listed here
+# are not cached.
+DEFAULT_TTLS = {
+    "plans": 300,
+    "tokens": 60,
+    "files": 300,
+    "events": None,
+}
+
+# Collection of the object an event is about, by event type prefix. Longer
+# prefixes come first.
+EVENT_COLLECTIONS = (
+    ("CHARGE_DISPUTE_", "disputes"),
+    ("CHARGE_", "charges"),
+    ("CUSTOMER_SUBSCRIPTION_", "subscriptions"),
+    ("CUSTOMER_CARD_", "cards"),
+    ("CUSTOMER_", "customers"),
+    ("PLAN_", "plans"),
+)
+
+
+class ResponseCache(object):
+    # LRU cache of raw response bodies for single-object GET requests. Bodies
+    # are decoded on every hit, so callers never share (and mutate) the same
+    # object. Bounded by number of entries and total size of the bodies.
+    def __init__(
+        self, ttls=None, max_entries=1024, max_bytes=16 * 1024 * 1024, clock=None
+    ):
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock or time.monotonic
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, secret_key, base_url, path):
+        segments = path.strip("/").split("/")
+        if len(segments) % 2 or segments[-2] not in self.ttls:
+            return None
+        return secret_key, base_url, path
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is not None and entry[0] <= self.clock():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, content):
+        if len(content) > self.max_bytes:
+            return
+        ttl = self.ttls[key[2].strip("/").split("/")[-2]]
+        expires = None if ttl is None else self.clock() + ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, content)
+            self.size += len(content)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    # Drops the object at path and the objects it belongs to, e.g. a change
+    # to /customers/{id}/cards/{id} also drops /customers/{id}.
+    def invalidate(self, secret_key, base_url, path):
+        segments = path.strip("/").split("/")
+        with self._lock:
+            for end in range(2, len(segments) + 1, 2):
+                key = secret_key, base_url, "/" + "/".join(segments[:end])
+                if key in self._entries:
+                    self._remove(key)
+
+    # Drops (or with replace=True, stores the event's copy of) the object an
+    # event is about, along with the objects embedding it. Replacing assumes
+    # events are applied in the order they happened.
+    def apply_event(self, secret_key, base_url, event, replace=False, codec=None):
+        paths = event_paths(event)
+        for path in paths:
+            self.invalidate(secret_key, base_url, path)
+        if not replace or not paths or event["type"].endswith("_DELETED"):
+            return
+        key = self.key(secret_key, base_url, paths[0])
+        if key is not None:
+            data = event["data"]
+            if hasattr(data, "to_dict"):
+                data = data.to_dict()
+            self.put(key, (codec or JsonCodec()).dumps(data))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.size,
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        expires, content = self._entries.pop(key)
+        self.size -= len(content)
+
+
+# Paths of the object an event is about, followed by the objects that embed
+# a copy of it.
+def event_paths(event):
+    event_type = event.get("type") or ""
+    data = event.get("data") or {}
+    if "id" not in data:
+        return []
+    for prefix, collection in EVENT_COLLECTIONS:
+        if event_type.startswith(prefix):
+            break
+    else:
+        return []
+    if collection == "cards":
+        return ["/customers/%s/cards/%s" % (data.get("customerId"), data["id"])]
+    paths = ["/%s/%s" % (collection, data["id"])]
+    if collection == "disputes":
+        paths.extend(_embedded_paths("charges", data.get("charge")))
+    elif collection == "charges":
+        paths.extend(_embedded_paths("disputes", data.get("dispute")))
+    return paths
+
+
+def _embedded_paths(collection, value):
+    if isinstance(value, str):
+        return ["/%s/%s" % (collection, value)]
+    if value is not None and value.get("id"):
+        return ["/%s/%s" % (collection, value["id"])]
+    return []
@@ -1,14 +1,20 @@
+from shift4.models import Card
 from shift4.resource import Resource
 
 
 class Cards(Resource):
+    model = Card
+
     def create(self, customer_id, params, request_options=None):
         return self._post(
             "/customers/%s/cards" % customer_id, params, request_options=request_options
         )
 
-    def get(self, customer_id, card_id):
-        return self._get("/customers/%s/cards/%s" % (customer_id, card_id))
+    def get(self, customer_id, card_id, request_options=None):
+        return self._get(
+            "/customers/%s/cards/%s" % (customer_id, card_id),
+            request_options=request_options,
+        )
 
     def update(self, customer_id, card_id, params, request_options=None):
         return self._post(
@@ -17,8 +23,18 @@ class Cards(Resource):
             request_options=request_options,
         )
 
-    def delete(self, customer_id, card_id):
-        return self._delete("/customers/%s/cards/%s" % (customer_id, card_id))
+    def delete(self, customer_id, card_id, request_options=None):
+        return self._delete(
+            "/customers/%s/cards/%s" % (customer_id, card_id),
+            request_options=request_options,
+        )
 
-    def list(self, customer_id, params=None):
-        return self._get("/customers/%s/cards" % customer_id, params)
+    def list(self, customer_id, params=None, request_options=None):
+        return self._get(
+            "/customers/%s/cards" % customer_id, params, request_options=request_options
+        )
+
+    def iter_all(self, customer_id, params=None, page_size=None, prefetch=0):
+        return self._iter_all(
+            lambda params: self.list(customer_id, params), params, page_size, prefetch
+        )
@@ -1,20 +1,37 @@
+from shift4.bulk import DEFAULT_CONCURRENCY
+from shift4.models import Charge
 from shift4.resource import Resource
 
 
 class Charges(Resource):
+    model = Charge
+
     def create(self, params, request_options=None):
         return self._post("/charges", params, request_options=request_options)
 
-    def get(self, charge_id):
-        return self._get("/charges/%s" % charge_id)
+    def create_many(
+        self, params_list, concurrency=DEFAULT_CONCURRENCY, idempotency_key_prefix=None
+    ):
+        return self._many(
+            lambda params, options: self.create(params, request_options=options),
+            params_list,
+            concurrency,
+            idempotency_key_prefix,
+        )
+
+    def get(self, charge_id, request_options=None):
+        return self._get("/charges/%s" % charge_id, request_options=request_options)
 
     def update(self, charge_id, params, request_options=None):
         return self._post(
             "/charges/%s" % charge_id, params, request_options=request_options
         )
 
-    def list(self, params=None):
-        return self._get("/charges", params)
+    def list(self, params=None, request_options=None):
+        return self._get("/charges", params, request_options=request_options)
+
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
 
     def capture(self, charge_id, request_options=None):
         return self._post(
@@ -25,3 +42,13 @@ class Charges(Resource):
         return self._post(
             "/charges/%s/refund" % charge_id, params, request_options=request_options
         )
+
+    # Items are charge ids or (charge_id, params) pairs for partial refunds.
+    def refund_many(
+        self, refunds, concurrency=DEFAULT_CONCURRENCY, idempotency_key_prefix=None
+    ):
+        def refund(item, options):
+            charge_id, params = (item, None) if isinstance(item, str) else item
+            return self.refund(charge_id, params, request_options=options)
+
+        return self._many(refund, refunds, concurrency, idempotency_key_prefix)
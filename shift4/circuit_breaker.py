@@ -0,0 +1,149 @@
+import threading
+import time
+from collections import deque
+
+from shift4.exception import Shift4CircuitOpenException
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class _Circuit(object):
+    def __init__(self, window):
+        self.state = CLOSED
+        self.calls = deque(maxlen=window)
+        self.opened_at = None
+        self.issued = 0
+        self.probes = set()
+        self.probe_at = None
+        self.successes = 0
+
+
+class CircuitBreaker(object):
+    # Tracks the outcome of the last window calls to every route. Once at
+    # least min_calls were made and the share of failed calls (connection
+    # errors, timeouts and 5xx responses) reaches failure_rate, or the share
+    # of calls slower than slow_call_duration reaches slow_call_rate, the
+    # route is opened: calls fail at once with Shift4CircuitOpenException.
+    # After reset_timeout seconds up to half_open_probes calls are let through,
+    # and the route closes again if they all succeed.
+    #
+    # acquire() returns a probe for calls let through while half open, and
+    # None otherwise; record() is given it back. Only probes decide whether a
+    # half-open route closes or opens again, not calls started earlier.
+    def __init__(
+        self,
+        failure_rate=0.5,
+        slow_call_duration=None,
+        slow_call_rate=1.0,
+        window=20,
+        min_calls=10,
+        reset_timeout=30.0,
+        half_open_probes=1,
+        clock=None,
+    ):
+        self.failure_rate = failure_rate
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate = slow_call_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.half_open_probes = half_open_probes
+        self.clock = clock or time.monotonic
+        self._circuits = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, route):
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                circuit = self._circuits[route] = _Circuit(self.window)
+            if circuit.state == CLOSED:
+                return
+            now = self.clock()
+            if circuit.state == OPEN:
+                if now - circuit.opened_at < self.reset_timeout:
+                    raise Shift4CircuitOpenException(route)
+                circuit.state = HALF_OPEN
+                circuit.issued = 0
+                circuit.probes.clear()
+                circuit.successes = 0
+            # A probe that never reported back does not block the route
+            # forever.
+            if (
+                circuit.issued >= self.half_open_probes
+                and now - circuit.probe_at < self.reset_timeout
+            ):
+                raise Shift4CircuitOpenException(route)
+            probe = object()
+            circuit.issued += 1
+            circuit.probes.add(probe)
+            circuit.probe_at = now
+            return probe
+
+    def record(self, route, failed, duration, probe=None):
+        slow = self.slow_call_duration is not None and (
+            duration >= self.slow_call_duration
+        )
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                return
+            if probe is not None:
+                if probe not in circuit.probes:
+                    return
+                circuit.probes.discard(probe)
+            if circuit.state == HALF_OPEN:
+                if probe is None:
+                    return
+                if failed or slow:
+                    self._open(circuit)
+                else:
+                    circuit.successes += 1
+                    if circuit.successes >= self.half_open_probes:
+                        circuit.state = CLOSED
+                        circuit.probes.clear()
+                        circuit.calls.clear()
+                return
+            if circuit.state == OPEN:
+                return
+            circuit.calls.append((failed, slow))
+            calls = len(circuit.calls)
+            if calls < self.min_calls:
+                return
+            failures = sum(1 for failed, _ in circuit.calls if failed)
+            slow_calls = sum(1 for _, slow in circuit.calls if slow)
+            if (
+                failures >= self.failure_rate * calls
+                or slow_calls >= self.slow_call_rate * calls
+            ):
+                self._open(circuit)
+
+    def state(self, route):
+        with self._lock:
+            circuit = self._circuits.get(route)
+            return CLOSED if circuit is None else circuit.state
+
+    # State of every route seen so far, for health checks.
+    def snapshot(self):
+        with self._lock:
+            return {
+                route: {
+                    "state": circuit.state,
+                    "calls": len(circuit.calls),
+                    "failures": sum(1 for failed, _ in circuit.calls if failed),
+                    "slow_calls": sum(1 for _, slow in circuit.calls if slow),
+                }
+                for route, circuit in self._circuits.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._circuits.clear()
+
+    def _open(self, circuit):
+        circuit.state = OPEN
+        circuit.opened_at = self.clock()
+        circuit.probes.clear()
+        circuit.calls.clear()
@@ -0,0 +1,443 @@
+import base64
+import sys
+import time
+import uuid
+from collections.abc import Mapping
+from urllib.parse import urlencode
+
+import requests
+
+import shift4 as api
+from shift4.__version__ import __version__
+from shift4.blacklist import Blacklist
+from shift4.bulk import DEFAULT_CONCURRENCY, get_many, run_many
+from shift4.cards import Cards
+from shift4.charges import Charges
+from shift4.checkout_request import sign, sign_many, verify
+from shift4.codec import default_codec
+from shift4.credits import Credits
+from shift4.customers import Customers
+from shift4.disputes import Disputes
+from shift4.events import Events
+from shift4.exception import Shift4Exception, Shift4TimeoutException
+from shift4.file_uploads import FileUploads
+from shift4.fraud_warnings import FraudWarnings
+from shift4.httpx_transport import HttpxTransport
+from shift4.hooks import Hooks
+from shift4.instrumentation import RequestCall
+from shift4.models import to_model
+from shift4.multipart import encode_files
+from shift4.pagination import paginate
+from shift4.payment_methods import PaymentMethods
+from shift4.plans import Plans
+from shift4.retry import RetryPolicy
+from shift4.routes import route_template
+from shift4.subscriptions import Subscriptions
+from shift4.timeouts import DEFAULT_TIMEOUT, Timeout, time_remaining
+from shift4.tokens import Tokens
+from shift4.transport import PooledTransport, Request, Response
+
+API_URL = "https://api.shift4.com"
+UPLOADS_URL = "https://uploads.api.shift4.com"
+
+
+class BaseClient(object):
+    def _init_resources(self):
+        self.blacklist = Blacklist(self)
+        self.cards = Cards(self)
+        self.charges = Charges(self)
+        self.credits = Credits(self)
+        self.customers = Customers(self)
+        self.disputes = Disputes(self)
+        self.events = Events(self)
+        self.file_uploads = FileUploads(self)
+        self.fraud_warnings = FraudWarnings(self)
+        self.payment_methods = PaymentMethods(self)
+        self.plans = Plans(self)
+        self.subscriptions = Subscriptions(self)
+        self.tokens = Tokens(self)
+
+    # Feeds events (a webhook payload, an event, a list of events or a page
+    # from events.list) into the cache, so that objects they mention are
+    # refetched on the next get. Events are applied oldest first, as pages
+    # list them newest first and replace=True keeps the last copy applied.
+    def apply_events(self, events, replace=False):
+        if self.cache is None:
+            return
+        if isinstance(events, (bytes, str)):
+            events = self.codec.loads(events)
+        if isinstance(events, Mapping):
+            events = events["list"] if "list" in events else [events]
+        events = sorted(events, key=lambda event: event.get("created") or 0)
+        base_url = self.api_url.rstrip("/")
+        for event in events:
+            self.cache.apply_event(
+                self.secret_key, base_url, event, replace, self.codec
+            )
+
+    def sign_checkout_request(self, checkout_request):
+        return sign(checkout_request, secret_key=self.secret_key)
+
+    def sign_checkout_requests(self, checkout_requests, processes=None):
+        return sign_many(checkout_requests, self.secret_key, processes)
+
+    def verify_checkout_request(self, signed):
+        return verify(signed, secret_key=self.secret_key)
+
+    # POSTs get a generated idempotency key, unless one was given, so they can
+    # be retried safely. An idempotency_key of None sends none.
+    def _request_options(self, method, files, request_options):
+        if method != "POST" or files is not None:
+            return request_options
+        if request_options is None:
+            return {"idempotency_key": str(uuid.uuid4())}
+        if "idempotency_key" not in request_options:
+            request_options = dict(request_options)
+            request_options["idempotency_key"] = str(uuid.uuid4())
+        return request_options
+
+    def _create_headers(self, request_options=None):
+        user_agent = "Shift4-Python/%s (Python/%s.%s.%s)" % (
+            __version__,
+            sys.version_info.major,
+            sys.version_info.minor,
+            sys.version_info.micro,
+        )
+        headers = {"User-Agent": user_agent}
+        if request_options is not None:
+            idempotency_key = request_options.get("idempotency_key")
+            if idempotency_key is not None:
+                headers["Idempotency-Key"] = idempotency_key
+        return headers
+
+    def _prepare_request(self, path, params, json_body, files, url, headers):
+        if url is None:
+            url = self.api_url.rstrip("/")
+        url = url + path
+        if params:
+            query = [(k, v) for k, v in params.items() if v is not None]
+            url = url + "?" + urlencode(query, doseq=True)
+        credentials = ("%s:" % self.secret_key).encode("latin1")
+        headers["Authorization"] = "Basic " + base64.b64encode(credentials).decode()
+        body = None
+        if files is not None:
+            body, headers["Content-Type"] = encode_files(files)
+            headers["Content-Length"] = str(len(body))
+        elif json_body is not None:
+            body = self.codec.dumps(json_body)
+            headers["Content-Type"] = "application/json"
+        return url, body
+
+    def _attempt_timeout(self, request_options):
+        timeout = self.timeout
+        if request_options is not None and "timeout" in request_options:
+            timeout = request_options["timeout"]
+        timeout = Timeout.of(timeout)
+        remaining = time_remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise Shift4TimeoutException("Deadline exceeded")
+        return timeout.bounded(remaining)
+
+    def _rate_limit_wait(self, path):
+        if self.rate_limiter is None:
+            return 0
+        wait = self.rate_limiter.reserve(path)
+        remaining = time_remaining()
+        if wait > 0 and remaining is not None and wait >= remaining:
+            raise Shift4TimeoutException(
+                "Deadline exceeded while waiting for rate limit"
+            )
+        return wait
+
+    # Returns the route and the probe handed out by the circuit breaker, to be
+    # passed back to _circuit_record.
+    def _circuit_acquire(self, url):
+        if self.circuit_breaker is None:
+            return None
+        route = route_template(url)
+        return route, self.circuit_breaker.acquire(route)
+
+    # A missing response stands for a connection error or a timeout.
+    def _circuit_record(self, permit, started, resp=None):
+        if permit is not None:
+            route, probe = permit
+            failed = resp is None or resp.status_code >= 500
+            self.circuit_breaker.record(
+                route, failed, time.monotonic() - started, probe
+            )
+
+    def _retry_delay(self, retryable, attempt, resp=None):
+        if not retryable:
+            return None
+        if resp is None:
+            delay = self.retry_policy.retry_delay(attempt)
+        else:
+            delay = self.retry_policy.retry_delay(
+                attempt, resp.status_code, resp.headers.get("Retry-After")
+            )
+        remaining = time_remaining()
+        if delay is not None and remaining is not None and delay >= remaining:
+            raise Shift4TimeoutException("Deadline exceeded while waiting to retry")
+        return delay
+
+    # Returns the cache key of a cacheable GET request and its cached
+    # response, if any.
+    def _cache_lookup(self, method, path, params, url):
+        if self.cache is None or method != "GET" or params:
+            return None, None
+        key = self.cache.key(self.secret_key, (url or self.api_url).rstrip("/"), path)
+        if key is None:
+            return None, None
+        content = self.cache.get(key)
+        if content is None:
+            return key, None
+        return key, Response(200, {}, content)
+
+    def _cache_update(self, method, path, url, cache_key, resp):
+        if self.cache is None:
+            return
+        if cache_key is not None:
+            if resp.status_code == 200:
+                self.cache.put(cache_key, resp.content)
+        elif method != "GET":
+            self.cache.invalidate(
+                self.secret_key, (url or self.api_url).rstrip("/"), path
+            )
+
+    def _finish_call(self, call, resp, error=None):
+        if resp is not None:
+            call.status_code = resp.status_code
+            call.bytes_received = len(resp.content)
+        call.finish(error)
+        self.instrumentation.finish(call)
+
+    def _handle_response(self, resp, model=None):
+        try:
+            json = self.codec.loads(resp.content)
+        except ValueError:
+            raise Shift4Exception("Internal error", None, resp.text, None, None)
+        if resp.status_code == 200:
+            if self.use_models and model is not None:
+                return to_model(json, model)
+            return json
+        error = json.get("error")
+        if error is None:
+            raise Shift4Exception("Internal error", None, json, None, None)
+        raise Shift4Exception(
+            error.get("type"),
+            error.get("code"),
+            error.get("message"),
+            error.get("charge_id"),
+            error.get("blacklist_rule_id"),
+        )
+
+
+class Shift4Client(BaseClient):
+    def __init__(
+        self,
+        secret_key=None,
+        api_url=API_URL,
+        uploads_url=UPLOADS_URL,
+        transport=None,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        retry_policy=None,
+        timeout=DEFAULT_TIMEOUT,
+        http2=False,
+        codec=None,
+        use_models=False,
+        cache=None,
+        single_flight=None,
+        rate_limiter=None,
+        circuit_breaker=None,
+        instrumentation=None,
+        hooks=None,
+    ):
+        self.secret_key = secret_key
+        self.api_url = api_url
+        self.uploads_url = uploads_url
+        if transport is None and http2:
+            transport = HttpxTransport(
+                http2=True,
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+            )
+        elif transport is None:
+            transport = PooledTransport(
+                pool_connections, pool_maxsize, pool_block=pool_block
+            )
+        self.transport = transport
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.timeout = timeout
+        self.codec = codec or default_codec()
+        self.use_models = use_models
+        self.cache = cache
+        self.single_flight = single_flight
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.instrumentation = instrumentation
+        self.hooks = Hooks() if hooks is None else hooks
+        self._init_resources()
+
+    def request(
+        self,
+        method,
+        path,
+        params=None,
+        json=None,
+        files=None,
+        url=None,
+        request_options=None,
+        model=None,
+    ):
+        cache_key, cached = self._cache_lookup(method, path, params, url)
+        if cached is not None:
+            return self._handle_response(cached, model)
+        request_options = self._request_options(method, files, request_options)
+        headers = self._create_headers(request_options)
+        request_url, body = self._prepare_request(
+            path, params, json, files, url, headers
+        )
+        call = None
+        if self.instrumentation is not None:
+            call = RequestCall(method, request_url)
+            self.instrumentation.start(call)
+        resp = None
+        try:
+            if self.single_flight is not None and method == "GET":
+                resp = self.single_flight.do(
+                    (self.secret_key, request_url),
+                    lambda: self._send(
+                        method, path, request_url, headers, body, request_options, call
+                    ),
+                )
+            else:
+                resp = self._send(
+                    method, path, request_url, headers, body, request_options, call
+                )
+            self._cache_update(method, path, url, cache_key, resp)
+            result = self._handle_response(resp, model)
+        except BaseException as e:
+            if call is not None:
+                self._finish_call(call, resp, e)
+            if self.hooks.on_error and isinstance(e, Exception):
+                request = Request(method, request_url, headers, body)
+                for hook in self.hooks.on_error:
+                    hook(request, e)
+            raise
+        finally:
+            if files is not None:
+                body.close()
+        if call is not None:
+            self._finish_call(call, resp)
+        return result
+
+    def _send(self, method, path, url, headers, body, request_options, call=None):
+        retryable = self.retry_policy.is_retryable(method, headers)
+        attempt = 1
+        while True:
+            # An open circuit fails before a rate limit token is taken.
+            permit = self._circuit_acquire(url)
+            wait = self._rate_limit_wait(path)
+            if wait > 0:
+                time.sleep(wait)
+            timeout = self._attempt_timeout(request_options).as_tuple()
+            started = time.monotonic()
+            if call is not None:
+                call.retries = attempt - 1
+                call.bytes_sent += len(body or b"")
+            try:
+                resp = self._dispatch(method, url, headers, body, timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._circuit_record(permit, started)
+                delay = self._retry_delay(retryable, attempt)
+                if delay is None:
+                    if isinstance(e, requests.Timeout):
+                        raise Shift4TimeoutException(str(e))
+                    raise
+            else:
+                self._circuit_record(permit, started, resp)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.update(
+                        path, resp.status_code, resp.headers.get("Retry-After")
+                    )
+                delay = self._retry_delay(retryable, attempt, resp)
+                if delay is None:
+                    return resp
+            time.sleep(delay)
+            attempt += 1
+
+    def _dispatch(self, method, url, headers, body, timeout):
+        if not self.hooks:
+            return self.transport.send(method, url, headers, body, timeout=timeout)
+        request = Request(method, url, headers, body)
+        resp = None
+        for hook in self.hooks.before_send:
+            resp = hook(request)
+            if resp is not None:
+                break
+        if resp is None:
+            resp = self.transport.send(
+                request.method,
+                request.url,
+                request.headers,
+                request.body,
+                timeout=timeout,
+            )
+        for hook in self.hooks.after_response:
+            resp = hook(request, resp) or resp
+        return resp
+
+    def paginate(self, list_page, params=None, page_size=None, prefetch=0):
+        return paginate(list_page, params, page_size, prefetch)
+
+    def run_many(self, call, items, concurrency=DEFAULT_CONCURRENCY):
+        return run_many(call, items, concurrency)
+
+    # Passes the result of a call on to fn; AsyncShift4Client awaits both.
+    def chain(self, result, fn):
+        return fn(result)
+
+    def get_many(self, get, keys, concurrency=DEFAULT_CONCURRENCY):
+        return get_many(get, keys, concurrency)
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _module_setting(name):
+    return property(
+        lambda self: getattr(api, name),
+        lambda self, value: setattr(api, name, value),
+    )
+
+
+class _DefaultClient(Shift4Client):
+    # Backs the module-level API, so settings such as shift4.secret_key
+    # are read from the module on every call.
+    secret_key = _module_setting("secret_key")
+    api_url = _module_setting("api_url")
+    uploads_url = _module_setting("uploads_url")
+    transport = _module_setting("default_transport")
+    retry_policy = _module_setting("retry_policy")
+    timeout = _module_setting("timeout")
+    codec = _module_setting("json_codec")
+    use_models = _module_setting("use_models")
+    cache = _module_setting("response_cache")
+    single_flight = _module_setting("default_single_flight")
+    rate_limiter = _module_setting("rate_limiter")
+    circuit_breaker = _module_setting("default_circuit_breaker")
+    instrumentation = _module_setting("default_instrumentation")
+    hooks = _module_setting("default_hooks")
+
+    def __init__(self):
+        self._init_resources()
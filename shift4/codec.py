@@ -0,0 +1,40 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(object):
+    def __init__(self):
+        self._encoder = json.JSONEncoder(allow_nan=False)
+
+    def dumps(self, obj):
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    # Decodes responses with orjson. Request bodies are still encoded by the
+    # standard library: orjson encodes NaN and infinity as null and accepts
+    # values such as UUID or Enum, so it would not reject what JsonCodec
+    # rejects.
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson: pip install orjson")
+        super(OrjsonCodec, self).__init__()
+
+    def loads(self, data):
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            return super(OrjsonCodec, self).loads(data)
+
+
+def default_codec():
+    if orjson is not None:
+        return OrjsonCodec()
+    return JsonCodec()
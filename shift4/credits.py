@@ -1,17 +1,23 @@
+from shift4.models import Credit
 from shift4.resource import Resource
 
 
 class Credits(Resource):
+    model = Credit
+
     def create(self, params, request_options=None):
         return self._post("/credits", params, request_options=request_options)
 
-    def get(self, credit_id):
-        return self._get("/credits/%s" % credit_id)
+    def get(self, credit_id, request_options=None):
+        return self._get("/credits/%s" % credit_id, request_options=request_options)
 
     def update(self, credit_id, params, request_options=None):
         return self._post(
             "/credits/%s" % credit_id, params, request_options=request_options
         )
 
-    def list(self, params=None):
-        return self._get("/credits", params)
+    def list(self, params=None, request_options=None):
+        return self._get("/credits", params, request_options=request_options)
+
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
@@ -1,20 +1,40 @@
+from shift4.bulk import DEFAULT_CONCURRENCY
+from shift4.models import Customer
 from shift4.resource import Resource
 
 
 class Customers(Resource):
+    model = Customer
+
     def create(self, params, request_options=None):
         return self._post("/customers", params, request_options=request_options)
 
-    def get(self, customer_id):
-        return self._get("/customers/%s" % customer_id)
+    def get(self, customer_id, request_options=None):
+        return self._get("/customers/%s" % customer_id, request_options=request_options)
 
     def update(self, customer_id, params, request_options=None):
         return self._post(
             "/customers/%s" % customer_id, params, request_options=request_options
         )
 
-    def delete(self, customer_id):
-        return self._delete("/customers/%s" % customer_id)
+    # updates is an iterable of (customer_id, params) pairs.
+    def update_many(
+        self, updates, concurrency=DEFAULT_CONCURRENCY, idempotency_key_prefix=None
+    ):
+        return self._many(
+            lambda update, options: self.update(*update, request_options=options),
+            updates,
+            concurrency,
+            idempotency_key_prefix,
+        )
+
+    def delete(self, customer_id, request_options=None):
+        return self._delete(
+            "/customers/%s" % customer_id, request_options=request_options
+        )
+
+    def list(self, params=None, request_options=None):
+        return self._get("/customers", params, request_options=request_options)
 
-    def list(self, params=None):
-        return self._get("/customers", params)
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
@@ -1,9 +1,13 @@
+from shift4.bulk import DEFAULT_CONCURRENCY
+from shift4.models import Dispute
 from shift4.resource import Resource
 
 
 class Disputes(Resource):
-    def get(self, dispute_id):
-        return self._get("/disputes/%s" % dispute_id)
+    model = Dispute
+
+    def get(self, dispute_id, request_options=None):
+        return self._get("/disputes/%s" % dispute_id, request_options=request_options)
 
     def update(self, dispute_id, params, request_options=None):
         return self._post(
@@ -15,5 +19,54 @@ class Disputes(Resource):
             "/disputes/%s/close" % dispute_id, request_options=request_options
         )
 
-    def list(self, params=None):
-        return self._get("/disputes", params)
+    def list(self, params=None, request_options=None):
+        return self._get("/disputes", params, request_options=request_options)
+
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
+
+    # Uploads evidence files concurrently and attaches them to the dispute
+    # with a single update. files maps evidence fields, e.g. "receipt" or
+    # "customerCommunication", to anything file_uploads.upload accepts;
+    # evidence holds the other evidence fields. Nothing is attached if an
+    # upload fails.
+    def submit_evidence(
+        self, dispute_id, files, evidence=None, concurrency=DEFAULT_CONCURRENCY
+    ):
+        fields = list(files)
+        uploads = self.client.run_many(
+            lambda field: self.client.file_uploads.upload(
+                files[field], {"purpose": "dispute_evidence"}
+            ),
+            fields,
+            concurrency,
+        )
+        return self.client.chain(
+            uploads,
+            lambda results: self._attach_evidence(
+                dispute_id, fields, results, evidence
+            ),
+        )
+
+    # submissions is an iterable of (dispute_id, files[, evidence]) tuples.
+    # Returns the updated disputes in input order, with the error of a failed
+    # submission (a Shift4Exception, or an OSError for a file that could not be
+    # read) in its place.
+    def submit_evidence_many(
+        self, submissions, concurrency=DEFAULT_CONCURRENCY, upload_concurrency=4
+    ):
+        return self.client.run_many(
+            lambda submission: self.submit_evidence(
+                *submission, concurrency=upload_concurrency
+            ),
+            submissions,
+            concurrency,
+        )
+
+    def _attach_evidence(self, dispute_id, fields, uploads, evidence):
+        evidence = dict(evidence or {})
+        for field, upload in zip(fields, uploads):
+            if isinstance(upload, Exception):
+                raise upload
+            evidence[field] = upload["id"]
+        return self.update(dispute_id, {"evidence": evidence})
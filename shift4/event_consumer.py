@@ -0,0 +1,257 @@
+import asyncio
+import contextlib
+import inspect
+import os
+import threading
+from collections import OrderedDict
+
+from shift4.exception import Shift4CursorNotFoundException, Shift4Exception
+
+# Error type of API responses to requests naming an unknown object.
+INVALID_REQUEST = "invalid_request"
+
+
+class FileCheckpointStore(object):
+    # Keeps the cursor, the id and creation time of the last handled event,
+    # in a file replaced atomically on every save.
+    def __init__(self, path):
+        self.path = os.fspath(path)
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                event_id, created = f.read().split()
+        except FileNotFoundError:
+            return None
+        return event_id, int(created)
+
+    def save(self, event_id, created):
+        temporary = "%s.tmp" % self.path
+        with open(temporary, "w") as f:
+            f.write("%s %d\n" % (event_id, created))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.path)
+
+
+class SQLiteCheckpointStore(object):
+    # Keeps cursors in a SQLite table, one row per consumer name, so several
+    # consumers can share a database.
+    def __init__(self, path, name="events", table="shift4_event_cursors"):
+        self.path = os.fspath(path)
+        self.name = name
+        self.table = table
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS %s (name TEXT PRIMARY KEY, "
+                "event_id TEXT NOT NULL, created INTEGER NOT NULL)" % self.table
+            )
+
+    def load(self):
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT event_id, created FROM %s WHERE name = ?" % self.table,
+                (self.name,),
+            ).fetchone()
+        return None if row is None else tuple(row)
+
+    def save(self, event_id, created):
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO %s (name, event_id, created) "
+                "VALUES (?, ?, ?)" % self.table,
+                (self.name, event_id, created),
+            )
+
+    @contextlib.contextmanager
+    def _connect(self):
+        # Imported here, so shift4 still imports on Pythons built without
+        # sqlite3.
+        import sqlite3
+
+        with contextlib.closing(sqlite3.connect(self.path)) as connection:
+            with connection:
+                yield connection
+
+
+class EventConsumer(object):
+    # Hands new events to handler(batch), oldest first, in batches of up to
+    # batch_size. The cursor (id and creation time of the last handled event)
+    # is saved to store only after handler returns, so a failed batch is
+    # handed over again by the next poll and a restart resumes where the
+    # consumer stopped.
+    #
+    # A poll walks forward from the stored cursor one page at a time, listing
+    # the page_size events created right after it with endingBeforeId (newest
+    # first, with hasMore set while newer events follow), and hands every
+    # page over before the next one is fetched. Only one page is
+    # held in memory, and pages handled before a failure are not fetched
+    # again. If the cursor event is gone, the poll raises
+    # Shift4CursorNotFoundException rather than guessing where to resume.
+    # Without a stored cursor, the first poll only records the latest event,
+    # unless from_beginning=True.
+    def __init__(
+        self,
+        events,
+        handler,
+        store,
+        params=None,
+        batch_size=100,
+        page_size=100,
+        seen_size=10000,
+        from_beginning=False,
+    ):
+        self.events = events
+        self.handler = handler
+        self.store = store
+        self.params = dict(params or {})
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.seen_size = seen_size
+        self.from_beginning = from_beginning
+        self._seen = OrderedDict()
+
+    # Handles the events created since the last poll and returns their number.
+    def poll(self):
+        cursor = self.store.load()
+        if cursor is None and not self.from_beginning:
+            self._start(self.events.list(self._page_params(limit=1)))
+            return 0
+        if cursor is None:
+            page = self._oldest_page()
+        else:
+            page = self._page_after(cursor)
+        handled = 0
+        while page["list"]:
+            for batch, last in self._batches(page["list"]):
+                if batch:
+                    self.handler(batch)
+                handled += self._commit(batch, last)
+            if not page.get("hasMore"):
+                break
+            page = self._page_after(self.store.load())
+        return handled
+
+    # Polls until stop (a threading.Event) is set, sleeping interval seconds
+    # whenever there is nothing new.
+    def run(self, interval=5.0, stop=None):
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if not self.poll():
+                stop.wait(interval)
+
+    def _page_params(self, **params):
+        page_params = dict(self.params)
+        page_params["limit"] = self.page_size
+        page_params.update(params)
+        return page_params
+
+    def _start(self, page):
+        if page["list"]:
+            latest = page["list"][0]
+            self.store.save(latest["id"], latest["created"])
+
+    # Walks back to the oldest page, keeping only the last page fetched. More
+    # events follow it, so it is returned with hasMore set.
+    def _oldest_page(self):
+        page = self.events.list(self._page_params())
+        while page.get("hasMore") and page["list"]:
+            page = self.events.list(
+                self._page_params(startingAfterId=page["list"][-1]["id"])
+            )
+        return {"list": page["list"], "hasMore": True}
+
+    def _page_after(self, cursor):
+        try:
+            return self.events.list(self._page_params(endingBeforeId=cursor[0]))
+        except Shift4Exception as e:
+            if e.type != INVALID_REQUEST or self._cursor_exists(cursor):
+                raise
+            raise Shift4CursorNotFoundException(cursor[0])
+
+    def _cursor_exists(self, cursor):
+        try:
+            self.events.get(cursor[0])
+        except Shift4Exception as e:
+            if e.type != INVALID_REQUEST:
+                raise
+            return False
+        return True
+
+    # Splits a page, newest first, into batches of unseen events oldest
+    # first, each with the event to save as the cursor once it is handled.
+    def _batches(self, events):
+        events = events[::-1]
+        for start in range(0, len(events), self.batch_size):
+            chunk = events[start : start + self.batch_size]
+            batch = [event for event in chunk if event["id"] not in self._seen]
+            yield batch, chunk[-1]
+
+    def _commit(self, batch, last):
+        self.store.save(last["id"], last["created"])
+        for event in batch:
+            self._seen[event["id"]] = True
+        while len(self._seen) > self.seen_size:
+            self._seen.popitem(last=False)
+        return len(batch)
+
+
+class AsyncEventConsumer(EventConsumer):
+    # Same as EventConsumer for AsyncShift4Client; handler may be a coroutine
+    # function.
+    async def poll(self):
+        cursor = self.store.load()
+        if cursor is None and not self.from_beginning:
+            self._start(await self.events.list(self._page_params(limit=1)))
+            return 0
+        if cursor is None:
+            page = await self._oldest_page()
+        else:
+            page = await self._page_after(cursor)
+        handled = 0
+        while page["list"]:
+            for batch, last in self._batches(page["list"]):
+                if batch:
+                    result = self.handler(batch)
+                    if inspect.isawaitable(result):
+                        await result
+                handled += self._commit(batch, last)
+            if not page.get("hasMore"):
+                break
+            page = await self._page_after(self.store.load())
+        return handled
+
+    # Polls until stop (an asyncio.Event) is set.
+    async def run(self, interval=5.0, stop=None):
+        stop = stop or asyncio.Event()
+        while not stop.is_set():
+            if not await self.poll():
+                try:
+                    await asyncio.wait_for(stop.wait(), interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def _oldest_page(self):
+        page = await self.events.list(self._page_params())
+        while page.get("hasMore") and page["list"]:
+            page = await self.events.list(
+                self._page_params(startingAfterId=page["list"][-1]["id"])
+            )
+        return {"list": page["list"], "hasMore": True}
+
+    async def _page_after(self, cursor):
+        try:
+            return await self.events.list(self._page_params(endingBeforeId=cursor[0]))
+        except Shift4Exception as e:
+            if e.type != INVALID_REQUEST or await self._cursor_exists(cursor):
+                raise
+            raise Shift4CursorNotFoundException(cursor[0])
+
+    async def _cursor_exists(self, cursor):
+        try:
+            await self.events.get(cursor[0])
+        except Shift4Exception as e:
+            if e.type != INVALID_REQUEST:
+                raise
+            return False
+        return True
@@ -1,9 +1,15 @@
+from shift4.models import Event
 from shift4.resource import Resource
 
 
 class Events(Resource):
-    def get(self, event_id):
-        return self._get("/events/%s" % event_id)
+    model = Event
 
-    def list(self, params=None):
-        return self._get("/events", params)
+    def get(self, event_id, request_options=None):
+        return self._get("/events/%s" % event_id, request_options=request_options)
+
+    def list(self, params=None, request_options=None):
+        return self._get("/events", params, request_options=request_options)
+
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
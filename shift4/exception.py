@@ -22,3 +22,30 @@ class Shift4Exception(Exception):
                 ]
             )
         )
+
+
+class Shift4TimeoutException(Shift4Exception):
+    def __init__(self, message):
+        super(Shift4TimeoutException, self).__init__(
+            "timeout", None, message, None, None
+        )
+
+
+class Shift4CircuitOpenException(Shift4Exception):
+    def __init__(self, route):
+        super(Shift4CircuitOpenException, self).__init__(
+            "circuit_open", None, "Circuit open for %s" % route, None, None
+        )
+        self.route = route
+
+
+class Shift4CursorNotFoundException(Shift4Exception):
+    def __init__(self, event_id):
+        super(Shift4CursorNotFoundException, self).__init__(
+            "cursor_not_found",
+            None,
+            "Event %s is no longer listed" % event_id,
+            None,
+            None,
+        )
+        self.event_id = event_id
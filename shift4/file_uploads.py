@@ -1,24 +1,37 @@
-import shift4 as api
+from shift4.models import FileUpload
+from shift4.multipart import MultipartEncoder
 from shift4.resource import Resource
 
 
 class FileUploads(Resource):
-    def upload(self, file, params):
-        if isinstance(file, str):
-            opened = open(file, "rb")
-            file_tuple = (opened.name, opened, "application/octet-stream")
-        else:
-            file_tuple = file
+    model = FileUpload
 
+    # file is a path, a file object, bytes, a memoryview or an mmap, or a
+    # (filename, file[, content_type]) tuple. It is streamed rather than read
+    # into memory; progress(sent, total) is called as it is sent.
+    def upload(self, file, params, progress=None, request_options=None):
         return self._multipart(
             "/files",
             params=params,
-            files={"file": file_tuple},
-            url=api.uploads_url.rstrip("/"),
+            files=MultipartEncoder({"file": file}, progress=progress),
+            url=self.client.uploads_url.rstrip("/"),
+            request_options=request_options,
         )
 
-    def get(self, file_upload_id):
-        return self._get("/files/%s" % file_upload_id, url=api.uploads_url.rstrip("/"))
+    def get(self, file_upload_id, request_options=None):
+        return self._get(
+            "/files/%s" % file_upload_id,
+            url=self.client.uploads_url.rstrip("/"),
+            request_options=request_options,
+        )
+
+    def list(self, params, request_options=None):
+        return self._get(
+            "/files",
+            params,
+            url=self.client.uploads_url.rstrip("/"),
+            request_options=request_options,
+        )
 
-    def list(self, params):
-        return self._get("/files", params, url=api.uploads_url.rstrip("/"))
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
@@ -1,9 +1,17 @@
+from shift4.models import FraudWarning
 from shift4.resource import Resource
 
 
 class FraudWarnings(Resource):
-    def get(self, fraud_warning_id):
-        return self._get("/fraud-warnings/%s" % fraud_warning_id)
+    model = FraudWarning
 
-    def list(self, params=None):
-        return self._get("/fraud-warnings", params)
+    def get(self, fraud_warning_id, request_options=None):
+        return self._get(
+            "/fraud-warnings/%s" % fraud_warning_id, request_options=request_options
+        )
+
+    def list(self, params=None, request_options=None):
+        return self._get("/fraud-warnings", params, request_options=request_options)
+
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
@@ -0,0 +1,33 @@
+EVENTS = ("before_send", "after_response", "on_error")
+
+
+class Hooks(object):
+    # Functions called around the requests of a client, in the order they
+    # were added:
+    #
+    #     before_send(request)             before every attempt; may change the
+    #                                      request, or return a Response to use
+    #                                      instead of sending it
+    #     after_response(request, response) after every attempt; may return a
+    #                                      Response to replace it
+    #     on_error(request, error)         when a call fails, before the error
+    #                                      is raised
+    #
+    # request is a shift4.transport.Request. With AsyncShift4Client hooks may
+    # be coroutine functions.
+    def __init__(self):
+        self.before_send = []
+        self.after_response = []
+        self.on_error = []
+
+    def add(self, event, hook):
+        if event not in EVENTS:
+            raise ValueError("Unknown hook event: %s" % event)
+        getattr(self, event).append(hook)
+        return hook
+
+    def remove(self, event, hook):
+        getattr(self, event).remove(hook)
+
+    def __bool__(self):
+        return bool(self.before_send or self.after_response or self.on_error)
@@ -0,0 +1,112 @@
+import requests
+
+from shift4.transport import AsyncTransport, Response, Transport
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def require_httpx(feature, extra="http2"):
+    if httpx is None:
+        raise ImportError(
+            "%s requires httpx, install it with: pip install shift4[%s]"
+            % (feature, extra)
+        )
+
+
+def httpx_timeout(timeout):
+    connect, read = timeout
+    return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+
+
+# httpx.AsyncClient only streams async iterables.
+def async_content(body):
+    if body is None or isinstance(body, bytes):
+        return body
+    return _iterate_async(body)
+
+
+async def _iterate_async(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def httpx_limits(max_connections, max_keepalive_connections):
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+    )
+
+
+# With http2=True concurrent requests to the same host are multiplexed over
+# one connection instead of opening a connection per in-flight request.
+class HttpxTransport(Transport):
+    def __init__(
+        self,
+        http2=True,
+        max_connections=10,
+        max_keepalive_connections=10,
+        http_client=None,
+    ):
+        if http_client is None:
+            require_httpx("HttpxTransport")
+            http_client = httpx.Client(
+                http2=http2,
+                limits=httpx_limits(max_connections, max_keepalive_connections),
+            )
+        self.http_client = http_client
+
+    def send(self, method, url, headers, body=None, timeout=(None, None)):
+        try:
+            resp = self.http_client.request(
+                method,
+                url,
+                headers=headers,
+                content=body,
+                timeout=httpx_timeout(timeout),
+            )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e))
+        return Response(resp.status_code, resp.headers, resp.content)
+
+    def close(self):
+        self.http_client.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    def __init__(
+        self,
+        http2=False,
+        max_connections=100,
+        max_keepalive_connections=20,
+        http_client=None,
+    ):
+        if http_client is None:
+            require_httpx("AsyncHttpxTransport", "async")
+            http_client = httpx.AsyncClient(
+                http2=http2,
+                limits=httpx_limits(max_connections, max_keepalive_connections),
+            )
+        self.http_client = http_client
+
+    async def send(self, method, url, headers, body=None, timeout=(None, None)):
+        try:
+            resp = await self.http_client.request(
+                method,
+                url,
+                headers=headers,
+                content=async_content(body),
+                timeout=httpx_timeout(timeout),
+            )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e))
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e))
+        return Response(resp.status_code, resp.headers, resp.content)
+
+    async def close(self):
+        await self.http_client.aclose()
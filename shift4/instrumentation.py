@@ -0,0 +1,178 @@
+import time
+from urllib.parse import urlsplit
+
+from shift4.exception import Shift4Exception
+from shift4.routes import path_template
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+try:
+    from opentelemetry import context, trace
+except ImportError:
+    context = trace = None
+
+DURATION_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class RequestCall(object):
+    # Everything measured about one client call, from the first attempt to
+    # the decoded response or the raised error.
+    def __init__(self, method, url):
+        self.method = method
+        self.route = path_template(urlsplit(url).path)
+        self.resource = self.route.split("/")[1]
+        self.start_time_ns = time.time_ns()
+        self.started = time.perf_counter()
+        self.duration = None
+        self.status_code = None
+        self.retries = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.error = None
+        self.span = None
+        self.context_token = None
+
+    @property
+    def error_type(self):
+        if self.error is None:
+            return None
+        if isinstance(self.error, Shift4Exception):
+            return self.error.type
+        return self.error.__class__.__name__
+
+    @property
+    def error_code(self):
+        return getattr(self.error, "code", None)
+
+    def finish(self, error=None):
+        self.duration = time.perf_counter() - self.started
+        self.error = error
+
+
+class Instrumentation(object):
+    # Receives every call made by a client: start() when it is about to be
+    # sent and finish() once it completed or failed.
+    def start(self, call):
+        pass
+
+    def finish(self, call):
+        pass
+
+
+class CompositeInstrumentation(Instrumentation):
+    def __init__(self, *instrumentations):
+        self.instrumentations = instrumentations
+
+    def start(self, call):
+        for instrumentation in self.instrumentations:
+            instrumentation.start(call)
+
+    def finish(self, call):
+        for instrumentation in self.instrumentations:
+            instrumentation.finish(call)
+
+
+class PrometheusInstrumentation(Instrumentation):
+    def __init__(self, registry=None, namespace="shift4", buckets=DURATION_BUCKETS):
+        if prometheus_client is None:
+            raise ImportError(
+                "PrometheusInstrumentation requires prometheus_client, "
+                "install it with: pip install shift4[prometheus]"
+            )
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        labels = ["resource", "method", "route"]
+        options = {"namespace": namespace, "registry": registry}
+        self.requests = prometheus_client.Counter(
+            "requests", "Completed API calls", labels + ["status"], **options
+        )
+        self.errors = prometheus_client.Counter(
+            "errors", "Failed API calls", labels + ["type", "code"], **options
+        )
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "API call duration, including retries",
+            labels,
+            buckets=buckets,
+            **options
+        )
+        self.retries = prometheus_client.Counter(
+            "retries", "Retried API requests", labels, **options
+        )
+        self.in_flight = prometheus_client.Gauge(
+            "requests_in_flight", "API calls in progress", ["resource"], **options
+        )
+        self.bytes_sent = prometheus_client.Counter(
+            "request_bytes", "Request body bytes sent", labels, **options
+        )
+        self.bytes_received = prometheus_client.Counter(
+            "response_bytes", "Response body bytes received", labels, **options
+        )
+
+    def start(self, call):
+        self.in_flight.labels(call.resource).inc()
+
+    def finish(self, call):
+        labels = (call.resource, call.method, call.route)
+        self.in_flight.labels(call.resource).dec()
+        self.requests.labels(*labels, str(call.status_code or "error")).inc()
+        self.duration.labels(*labels).observe(call.duration)
+        if call.error is not None:
+            self.errors.labels(
+                *labels, str(call.error_type), str(call.error_code or "")
+            ).inc()
+        if call.retries:
+            self.retries.labels(*labels).inc(call.retries)
+        if call.bytes_sent:
+            self.bytes_sent.labels(*labels).inc(call.bytes_sent)
+        if call.bytes_received:
+            self.bytes_received.labels(*labels).inc(call.bytes_received)
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    # Reports every call as a client span, child of the span current when
+    # the call was made.
+    def __init__(self, tracer=None):
+        if trace is None:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires opentelemetry-api, "
+                "install it with: pip install shift4[opentelemetry]"
+            )
+        self.tracer = tracer or trace.get_tracer("shift4")
+
+    # The span is current while the call runs, so hooks, transports and HTTP
+    # library instrumentation see it as their parent.
+    def start(self, call):
+        call.span = self.tracer.start_span(
+            "%s %s" % (call.method, call.route),
+            kind=trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": call.method,
+                "http.route": call.route,
+                "shift4.resource": call.resource,
+            },
+        )
+        call.context_token = context.attach(trace.set_span_in_context(call.span))
+
+    def finish(self, call):
+        span = call.span
+        context.detach(call.context_token)
+        span.set_attributes(
+            {
+                "shift4.retries": call.retries,
+                "shift4.request_bytes": call.bytes_sent,
+                "shift4.response_bytes": call.bytes_received,
+            }
+        )
+        if call.status_code is not None:
+            span.set_attribute("http.response.status_code", call.status_code)
+        if call.error is not None:
+            span.set_attribute("error.type", str(call.error_type))
+            if call.error_code:
+                span.set_attribute("shift4.error_code", call.error_code)
+            span.record_exception(call.error)
+            span.set_status(trace.Status(trace.StatusCode.ERROR))
+        span.end()
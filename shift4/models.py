@@ -0,0 +1,386 @@
+from collections.abc import MutableMapping
+
+
+class Model(MutableMapping):
+    # Compact, read-mostly view of an API object. Known fields live in
+    # __slots__, anything else the API returns is kept in _extra. Models
+    # behave like the dicts returned without them: obj["amount"],
+    # obj.get("metadata"), "card" in obj, obj == {...} and dict(obj) all work,
+    # as does attribute access (obj.amount).
+    __slots__ = ("_extra",)
+    _fields = ()
+    _field_set = frozenset()
+    _nested = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._field_set = frozenset(cls._fields)
+
+    @classmethod
+    def from_json(cls, data):
+        obj = cls.__new__(cls)
+        extra = None
+        nested = cls._nested
+        fields = cls._field_set
+        for key, value in data.items():
+            if key in nested:
+                value = _convert(nested[key], value)
+            if key in fields:
+                setattr(obj, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        obj._extra = extra
+        return obj
+
+    def to_dict(self):
+        return {key: _to_json(value) for key, value in self.items()}
+
+    def __getattr__(self, name):
+        # Only called for unset slots and names that are not slots.
+        if name in self._field_set:
+            return None
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and name in extra:
+            return extra[name]
+        raise AttributeError(name)
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            try:
+                return object.__getattribute__(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in self._field_set:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in self._field_set:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key)
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __iter__(self):
+        for key in self._fields:
+            try:
+                object.__getattribute__(self, key)
+            except AttributeError:
+                continue
+            yield key
+        if self._extra is not None:
+            for key in self._extra:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return "%s(%r)" % (self.__class__.__name__, dict(self.items()))
+
+    def __reduce__(self):
+        return self.__class__.from_json, (self.to_dict(),)
+
+
+def _convert(model, value):
+    if isinstance(value, dict):
+        return model.from_json(value)
+    if isinstance(value, list):
+        return [
+            model.from_json(item) if isinstance(item, dict) else item for item in value
+        ]
+    return value
+
+
+def _to_json(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_json(item) for item in value]
+    return value
+
+
+class Card(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "deleted",
+        "first6",
+        "last4",
+        "fingerprint",
+        "expMonth",
+        "expYear",
+        "cardholderName",
+        "customerId",
+        "brand",
+        "type",
+        "country",
+        "issuer",
+        "segment",
+        "merchantAccountId",
+        "addressLine1",
+        "addressLine2",
+        "addressCity",
+        "addressState",
+        "addressZip",
+        "addressCountry",
+        "fraudCheckData",
+    )
+    __slots__ = _fields
+
+
+class Token(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "first6",
+        "last4",
+        "fingerprint",
+        "expMonth",
+        "expYear",
+        "cardholderName",
+        "brand",
+        "type",
+        "country",
+        "used",
+        "addressLine1",
+        "addressLine2",
+        "addressCity",
+        "addressState",
+        "addressZip",
+        "addressCountry",
+        "fraudCheckData",
+        "threeDSecureInfo",
+    )
+    __slots__ = _fields
+
+
+class PaymentMethod(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "deleted",
+        "clientObjectId",
+        "type",
+        "customerId",
+        "status",
+        "flow",
+        "billing",
+        "shipping",
+        "threeDSecureInfo",
+        "fraudCheckData",
+        "card",
+        "metadata",
+    )
+    __slots__ = _fields
+    _nested = {"card": Card}
+
+
+class Dispute(Model):
+    _fields = (
+        "id",
+        "created",
+        "updated",
+        "objectType",
+        "amount",
+        "currency",
+        "status",
+        "reason",
+        "acceptedAsLost",
+        "evidence",
+        "evidenceDetails",
+        "charge",
+    )
+    __slots__ = _fields
+
+
+class Charge(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "amount",
+        "amountRefunded",
+        "currency",
+        "description",
+        "status",
+        "card",
+        "paymentMethod",
+        "customerId",
+        "subscriptionId",
+        "merchantAccountId",
+        "captured",
+        "refunded",
+        "refunds",
+        "disputed",
+        "dispute",
+        "fraudDetails",
+        "avsCheck",
+        "threeDSecureInfo",
+        "failureCode",
+        "failureIssuerDeclineCode",
+        "failureMessage",
+        "clientObjectId",
+        "flow",
+        "shipping",
+        "billing",
+        "metadata",
+    )
+    __slots__ = _fields
+    _nested = {"card": Card, "paymentMethod": PaymentMethod, "dispute": Dispute}
+
+
+Dispute._nested = {"charge": Charge}
+
+
+class Credit(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "amount",
+        "currency",
+        "description",
+        "card",
+        "customerId",
+        "fraudDetails",
+        "merchantAccountId",
+        "metadata",
+    )
+    __slots__ = _fields
+    _nested = {"card": Card}
+
+
+class Customer(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "deleted",
+        "email",
+        "description",
+        "defaultCardId",
+        "defaultPaymentMethodId",
+        "cards",
+        "paymentMethods",
+        "billing",
+        "shipping",
+        "metadata",
+    )
+    __slots__ = _fields
+    _nested = {"cards": Card, "paymentMethods": PaymentMethod}
+
+
+class Plan(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "deleted",
+        "amount",
+        "currency",
+        "interval",
+        "intervalCount",
+        "billingCycles",
+        "name",
+        "trialPeriodDays",
+        "recursTo",
+        "metadata",
+    )
+    __slots__ = _fields
+
+
+class Subscription(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "deleted",
+        "planId",
+        "customerId",
+        "quantity",
+        "captureCharges",
+        "status",
+        "remainingBillingCycles",
+        "start",
+        "currentPeriodStart",
+        "currentPeriodEnd",
+        "canceledAt",
+        "endedAt",
+        "trialStart",
+        "trialEnd",
+        "cancelAtPeriodEnd",
+        "billing",
+        "shipping",
+        "threeDSecure",
+        "metadata",
+    )
+    __slots__ = _fields
+
+
+class Event(Model):
+    _fields = ("id", "created", "objectType", "type", "data", "log")
+    __slots__ = _fields
+
+
+class FraudWarning(Model):
+    _fields = ("id", "created", "objectType", "charge", "actionable")
+    __slots__ = _fields
+    _nested = {"charge": Charge}
+
+
+class FileUpload(Model):
+    _fields = ("id", "created", "objectType", "purpose", "size", "type")
+    __slots__ = _fields
+
+
+class BlacklistRule(Model):
+    _fields = (
+        "id",
+        "created",
+        "objectType",
+        "deleted",
+        "ruleType",
+        "fingerprint",
+        "ipAddress",
+        "ipCountry",
+        "email",
+        "userAgent",
+        "acceptLanguage",
+        "metadata",
+    )
+    __slots__ = _fields
+
+
+class ListResponse(Model):
+    _fields = ("list", "hasMore", "totalCount")
+    __slots__ = _fields
+
+    @classmethod
+    def of(cls, data, model):
+        response = cls.from_json(data)
+        response.list = [model.from_json(item) for item in data["list"]]
+        return response
+
+
+def to_model(data, model):
+    if isinstance(data.get("list"), list):
+        return ListResponse.of(data, model)
+    return model.from_json(data)
@@ -0,0 +1,176 @@
+import binascii
+import mimetypes
+import mmap
+import os
+
+CHUNK_SIZE = 64 * 1024
+
+
+def encode_files(files):
+    if isinstance(files, MultipartEncoder):
+        encoder = files
+    else:
+        encoder = MultipartEncoder(files)
+    return encoder, encoder.content_type
+
+
+class MultipartEncoder(object):
+    # Streams a multipart/form-data body without holding the files in memory.
+    # Values of files are paths, file objects, mmaps, bytes or memoryviews, or
+    # (filename, content[, content_type]) tuples, where content is a str or
+    # any of those but a path. bytes, memoryviews
+    # and mmaps are sent in fixed-size slices without copying; files are read
+    # chunk by chunk. Files opened from a path are closed once sent, or by
+    # close().
+    #
+    # The body can be consumed once, through read() like a file, or by
+    # iterating over its chunks. progress(sent, total) is called as it is.
+    def __init__(self, files, boundary=None, chunk_size=CHUNK_SIZE, progress=None):
+        self.boundary = boundary or binascii.hexlify(os.urandom(16)).decode()
+        self.content_type = "multipart/form-data; boundary=%s" % self.boundary
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.sent = 0
+        self._parts = [_Part(name, value) for name, value in files.items()]
+        self._trailer = ("--%s--\r\n" % self.boundary).encode()
+        self._length = len(self._trailer) + sum(
+            len(self._header(part)) + part.size + 2 for part in self._parts
+        )
+        self._chunks = None
+        self._buffer = b""
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        for chunk in self._generate():
+            self.sent += len(chunk)
+            if self.progress is not None:
+                self.progress(self.sent, self._length)
+            yield chunk
+
+    def read(self, size=-1):
+        if self._chunks is None:
+            self._chunks = iter(self)
+        pieces = [self._buffer]
+        length = len(self._buffer)
+        while size < 0 or length < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            pieces.append(chunk)
+            length += len(chunk)
+        data = b"".join(pieces)
+        if size < 0:
+            self._buffer = b""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+    def close(self):
+        for part in self._parts:
+            part.close()
+
+    def _header(self, part):
+        return (
+            '--%s\r\nContent-Disposition: form-data; name="%s"; filename="%s"\r\n'
+            "Content-Type: %s\r\n\r\n"
+            % (
+                self.boundary,
+                _quote(part.name),
+                _quote(part.filename),
+                part.content_type,
+            )
+        ).encode("utf-8")
+
+    def _generate(self):
+        try:
+            for part in self._parts:
+                yield self._header(part)
+                for chunk in part.chunks(self.chunk_size):
+                    yield chunk
+                part.close()
+                yield b"\r\n"
+            yield self._trailer
+        finally:
+            self.close()
+
+
+class _Part(object):
+    def __init__(self, name, value):
+        content_type = None
+        if isinstance(value, (tuple, list)):
+            # As with requests' files=, a str in a tuple is the content itself.
+            filename, source = value[0], value[1]
+            if isinstance(source, str):
+                source = source.encode("utf-8")
+            if len(value) > 2:
+                content_type = value[2]
+        else:
+            source = value
+            filename = value if _is_path(value) else getattr(value, "name", None)
+            if not _is_path(filename):
+                filename = "file"
+            filename = os.path.basename(os.fspath(filename))
+        self.name = name
+        self.filename = filename
+        self.content_type = (
+            content_type
+            or mimetypes.guess_type(filename)[0]
+            or "application/octet-stream"
+        )
+        self._path = None
+        self._file = None
+        self._opened = None
+        self._view = None
+        if _is_path(source):
+            self._path = source
+            self.size = os.path.getsize(source)
+        elif isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+            self._view = memoryview(source).cast("B")
+            self.size = len(self._view)
+        else:
+            self._file = source
+            self.size = _remaining_size(source)
+
+    def chunks(self, chunk_size):
+        if self._view is not None:
+            for start in range(0, self.size, chunk_size):
+                yield self._view[start : start + chunk_size]
+            return
+        source = self._file
+        if source is None:
+            source = self._opened = open(self._path, "rb")
+        remaining = self.size
+        while remaining > 0:
+            chunk = source.read(min(chunk_size, remaining))
+            if not chunk:
+                raise IOError("%s is shorter than expected" % self.filename)
+            remaining -= len(chunk)
+            yield chunk
+
+    def close(self):
+        if self._opened is not None:
+            self._opened.close()
+            self._opened = None
+        if self._view is not None:
+            # Lets the caller close an mmap once the upload is done.
+            self._view.release()
+
+
+def _is_path(value):
+    return isinstance(value, (str, os.PathLike))
+
+
+def _remaining_size(file):
+    try:
+        return os.fstat(file.fileno()).st_size - file.tell()
+    except (AttributeError, OSError, ValueError):
+        position = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(position)
+        return end - position
+
+
+def _quote(value):
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
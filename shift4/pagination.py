@@ -0,0 +1,131 @@
+import asyncio
+import contextvars
+import queue
+import threading
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def _first_page_params(params, page_size):
+    params = dict(params or {})
+    if page_size is not None:
+        params["limit"] = page_size
+    else:
+        params.setdefault("limit", DEFAULT_PAGE_SIZE)
+    return params
+
+
+def _next_page_params(params, page):
+    items = page["list"]
+    if not page.get("hasMore") or not items:
+        return None
+    params = dict(params)
+    params["startingAfterId"] = items[-1]["id"]
+    return params
+
+
+# Walks all pages of a list endpoint using the startingAfterId cursor, holding
+# a single page in memory at a time. list_page(params) fetches one page.
+#
+# With prefetch=N pages are fetched in the background, up to N pages ahead of
+# the one being consumed. The cursor of a page is only known once the
+# previous page arrives, so pages are still fetched one after another, but
+# the next request is already in flight while the caller works on a page.
+def paginate(list_page, params=None, page_size=None, prefetch=0):
+    params = _first_page_params(params, page_size)
+    if prefetch > 0:
+        return _prefetch(list_page, params, prefetch)
+    return _paginate(list_page, params)
+
+
+def _paginate(list_page, params):
+    while params is not None:
+        page = list_page(params)
+        for item in page["list"]:
+            yield item
+        params = _next_page_params(params, page)
+
+
+def _prefetch(list_page, params, depth):
+    pages = queue.Queue()
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def produce(params):
+        try:
+            while params is not None:
+                while not slots.acquire(timeout=0.1):
+                    if stopped.is_set():
+                        return
+                if stopped.is_set():
+                    return
+                page = list_page(params)
+                params = _next_page_params(params, page)
+                pages.put((page, None))
+            pages.put((None, None))
+        except Exception as e:
+            pages.put((None, e))
+
+    # Runs in a copy of the caller's context, so an enclosing
+    # shift4.deadline() applies to the background requests as well.
+    context = contextvars.copy_context()
+    producer = threading.Thread(target=context.run, args=(produce, params))
+    producer.daemon = True
+    producer.start()
+    try:
+        while True:
+            page, error = pages.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            slots.release()
+            for item in page["list"]:
+                yield item
+    finally:
+        stopped.set()
+
+
+def async_paginate(list_page, params=None, page_size=None, prefetch=0):
+    params = _first_page_params(params, page_size)
+    if prefetch > 0:
+        return _async_prefetch(list_page, params, prefetch)
+    return _async_paginate(list_page, params)
+
+
+async def _async_paginate(list_page, params):
+    while params is not None:
+        page = await list_page(params)
+        for item in page["list"]:
+            yield item
+        params = _next_page_params(params, page)
+
+
+async def _async_prefetch(list_page, params, depth):
+    pages = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce(params):
+        try:
+            while params is not None:
+                await slots.acquire()
+                page = await list_page(params)
+                params = _next_page_params(params, page)
+                pages.put_nowait((page, None))
+            pages.put_nowait((None, None))
+        except Exception as e:
+            pages.put_nowait((None, e))
+
+    producer = asyncio.ensure_future(produce(params))
+    try:
+        while True:
+            page, error = await pages.get()
+            if error is not None:
+                raise error
+            if page is None:
+                return
+            slots.release()
+            for item in page["list"]:
+                yield item
+    finally:
+        producer.cancel()
@@ -1,15 +1,25 @@
+from shift4.models import PaymentMethod
 from shift4.resource import Resource
 
 
 class PaymentMethods(Resource):
+    model = PaymentMethod
+
     def create(self, params, request_options=None):
         return self._post("/payment-methods", params, request_options=request_options)
 
-    def get(self, payment_method_id):
-        return self._get("/payment-methods/%s" % payment_method_id)
+    def get(self, payment_method_id, request_options=None):
+        return self._get(
+            "/payment-methods/%s" % payment_method_id, request_options=request_options
+        )
+
+    def delete(self, payment_method_id, request_options=None):
+        return self._delete(
+            "/payment-methods/%s" % payment_method_id, request_options=request_options
+        )
 
-    def delete(self, payment_method_id):
-        return self._delete("/payment-methods/%s" % payment_method_id)
+    def list(self, params=None, request_options=None):
+        return self._get("/payment-methods", params, request_options=request_options)
 
-    def list(self, params=None):
-        return self._get("/payment-methods", params)
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
@@ -1,20 +1,26 @@
+from shift4.models import Plan
 from shift4.resource import Resource
 
 
 class Plans(Resource):
+    model = Plan
+
     def create(self, params, request_options=None):
         return self._post("/plans", params, request_options=request_options)
 
-    def get(self, plan_id):
-        return self._get("/plans/%s" % plan_id)
+    def get(self, plan_id, request_options=None):
+        return self._get("/plans/%s" % plan_id, request_options=request_options)
 
     def update(self, plan_id, params, request_options=None):
         return self._post(
             "/plans/%s" % plan_id, params, request_options=request_options
         )
 
-    def delete(self, plan_id):
-        return self._delete("/plans/%s" % plan_id)
+    def delete(self, plan_id, request_options=None):
+        return self._delete("/plans/%s" % plan_id, request_options=request_options)
+
+    def list(self, params=None, request_options=None):
+        return self._get("/plans", params, request_options=request_options)
 
-    def list(self, params=None):
-        return self._get("/plans", params)
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
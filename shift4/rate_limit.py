@@ -0,0 +1,88 @@
+import threading
+import time
+
+from shift4.retry import parse_retry_after
+
+
+class TokenBucket(object):
+    # Allows rate requests per second with bursts of up to burst requests.
+    # A 429 response cuts the rate by decrease (and pauses the bucket for its
+    # Retry-After), every other response raises it by increase, up to the
+    # configured rate again.
+    def __init__(
+        self, rate, burst=None, min_rate=None, decrease=0.5, increase=None, clock=None
+    ):
+        self.max_rate = float(rate)
+        self.rate = self.max_rate
+        self.burst = float(burst or max(1.0, rate))
+        self.min_rate = min_rate or self.max_rate / 10
+        self.decrease = decrease
+        self.increase = increase or self.max_rate / 20
+        self.clock = clock or time.monotonic
+        self.tokens = self.burst
+        self.updated = self.clock()
+        self._lock = threading.Lock()
+
+    # Takes a token and returns the seconds to wait before using it. Tokens
+    # may be reserved ahead, so concurrent callers are spaced out evenly.
+    def reserve(self):
+        with self._lock:
+            self._refill()
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def wait_time(self):
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def throttle(self, retry_after=None):
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.tokens = min(self.tokens, 1 - (retry_after or 0) * self.rate)
+
+    def recover(self):
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill()
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class RateLimiter(object):
+    # Limits all requests of a client to rate per second and, optionally,
+    # groups of endpoints to their own buckets. Groups are keyed by the first
+    # segment of the request path, e.g. "charges" or "files"; the same bucket
+    # may be given for several keys to share it.
+    def __init__(self, rate=None, burst=None, groups=None):
+        self.bucket = None if rate is None else TokenBucket(rate, burst)
+        self.groups = dict(groups or {})
+
+    def reserve(self, path):
+        return max([bucket.reserve() for bucket in self._buckets(path)] or [0.0])
+
+    def wait_time(self, path="/"):
+        return max([bucket.wait_time() for bucket in self._buckets(path)] or [0.0])
+
+    def update(self, path, status_code, retry_after=None):
+        for bucket in self._buckets(path):
+            if status_code == 429:
+                bucket.throttle(parse_retry_after(retry_after))
+            else:
+                bucket.recover()
+
+    def _buckets(self, path):
+        buckets = [] if self.bucket is None else [self.bucket]
+        group = self.groups.get(path.strip("/").split("/")[0])
+        if group is not None and group is not self.bucket:
+            buckets.append(group)
+        return buckets
@@ -1,75 +1,90 @@
-import sys
-
-import requests
+import uuid
 
 import shift4 as api
-from shift4.__version__ import __version__
+from shift4.bulk import DEFAULT_CONCURRENCY
 
 
 class Resource(object):
+    model = None
+
+    def __init__(self, client=None):
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            return api.default_client
+        return self._client
+
     def name(self):
         return self.__class__.__name__.lower()
 
-    def _get(self, path, params=None, url=None):
-        return self.__request("GET", path, params=params, url=url)
+    # Fetches objects by id concurrently. Duplicate ids are fetched once and
+    # the result maps each id to its object or Shift4Exception. Resources
+    # whose get() takes several ids, like cards, are given tuples of ids.
+    def get_many(self, ids, concurrency=DEFAULT_CONCURRENCY):
+        return self.client.get_many(self._get_one, ids, concurrency)
 
-    def _post(self, path, json=None, url=None, request_options=None):
-        return self.__request(
-            "POST", path, json=json, url=url, request_options=request_options
-        )
+    def _get_one(self, object_id):
+        if isinstance(object_id, tuple):
+            return self.get(*object_id)
+        return self.get(object_id)
 
-    def _multipart(self, path, params=None, files=None, url=None):
-        return self.__request("POST", path, params=params, files=files, url=url)
-
-    def _delete(self, path, params=None, url=None):
-        return self.__request("DELETE", path, params=params, url=url)
-
-    @classmethod
-    def __request(
-        cls,
-        method,
-        path,
-        params=None,
-        json=None,
-        files=None,
-        url=None,
-        request_options=None,
-    ):
-        if url is None:
-            url = api.api_url.rstrip("/")
-        resp = requests.request(
-            method,
-            url=url + path,
-            auth=(api.secret_key, ""),
-            headers=cls.__create_headers(request_options),
-            files=files,
+    def _iter_all(self, list_page, params=None, page_size=None, prefetch=0):
+        return self.client.paginate(list_page, params, page_size, prefetch)
+
+    # Runs call(item, request_options) for every item through the client's
+    # worker pool. Each item gets the idempotency key "<prefix>-<index>", so
+    # re-running a batch with the same idempotency_key_prefix never applies
+    # an item twice.
+    def _many(self, call, items, concurrency, idempotency_key_prefix):
+        if idempotency_key_prefix is None:
+            idempotency_key_prefix = str(uuid.uuid4())
+
+        def run_item(indexed):
+            index, item = indexed
+            key = "%s-%d" % (idempotency_key_prefix, index)
+            return call(item, {"idempotency_key": key})
+
+        return self.client.run_many(run_item, enumerate(items), concurrency)
+
+    def _get(self, path, params=None, url=None, request_options=None):
+        return self.client.request(
+            "GET",
+            path,
             params=params,
+            url=url,
+            request_options=request_options,
+            model=self.model,
+        )
+
+    def _post(self, path, json=None, url=None, request_options=None):
+        return self.client.request(
+            "POST",
+            path,
             json=json,
+            url=url,
+            request_options=request_options,
+            model=self.model,
         )
 
-        json = resp.json()
-        if resp.status_code == 200:
-            return json
-        error = json.get("error")
-        if error is None:
-            raise api.Shift4Exception("Internal error", None, json, None, None)
-        raise api.Shift4Exception(
-            error.get("type"),
-            error.get("code"),
-            error.get("message"),
-            error.get("charge_id"),
-            error.get("blacklist_rule_id"),
+    def _multipart(self, path, params=None, files=None, url=None, request_options=None):
+        return self.client.request(
+            "POST",
+            path,
+            params=params,
+            files=files,
+            url=url,
+            request_options=request_options,
+            model=self.model,
         )
 
-    @classmethod
-    def __create_headers(cls, request_options=None):
-        user_agent = "Shift4-Python/%s (Python/%s.%s.%s)" % (
-            __version__,
-            sys.version_info.major,
-            sys.version_info.minor,
-            sys.version_info.micro,
+    def _delete(self, path, params=None, url=None, request_options=None):
+        return self.client.request(
+            "DELETE",
+            path,
+            params=params,
+            url=url,
+            request_options=request_options,
+            model=self.model,
         )
-        headers = {"User-Agent": user_agent}
-        if request_options is not None and "idempotency_key" in request_options:
-            headers["Idempotency-Key"] = request_options["idempotency_key"]
-        return headers
@@ -0,0 +1,62 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+SAFE_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+RETRY_STATUSES = frozenset([429, 502, 503, 504])
+
+
+class RetryPolicy(object):
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_factor=0.5,
+        max_backoff=8.0,
+        max_retry_after=60.0,
+        jitter=True,
+        retry_statuses=RETRY_STATUSES,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+
+    def is_retryable(self, method, headers):
+        if method in SAFE_METHODS:
+            return True
+        return method == "POST" and "Idempotency-Key" in headers
+
+    # Seconds to wait before the next attempt, or None when the request
+    # should not be retried. A status_code of None stands for a connection
+    # error.
+    def retry_delay(self, attempt, status_code=None, retry_after=None):
+        if attempt >= self.max_attempts:
+            return None
+        if status_code is not None and status_code not in self.retry_statuses:
+            return None
+        retry_after = parse_retry_after(retry_after)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        backoff = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+NO_RETRIES = RetryPolicy(max_attempts=1)
+
+
+def parse_retry_after(value):
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
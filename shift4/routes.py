@@ -0,0 +1,16 @@
+from urllib.parse import urlsplit
+
+
+# Replaces object ids, every second path segment, so that requests to the
+# same endpoint share a name: /charges/char_1/refund -> /charges/{id}/refund.
+def path_template(path):
+    segments = path.strip("/").split("/")
+    for index in range(1, len(segments), 2):
+        segments[index] = "{id}"
+    return "/" + "/".join(segments)
+
+
+# Host and path template, e.g. api.shift4.com/charges/{id}.
+def route_template(url):
+    parts = urlsplit(url)
+    return parts.netloc + path_template(parts.path)
@@ -0,0 +1,61 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool(object):
+    # Keeps one HTTPAdapter per base URL, shared by a requests.Session per
+    # thread. pool_maxsize is the number of connections kept open to each
+    # host; with pool_block=True it is also a hard limit, and calls over it
+    # wait for a free connection instead of opening one that is discarded
+    # afterwards. As every adapter talks to a single host, pool_connections
+    # (the number of hosts an adapter keeps pools for) rarely matters.
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._adapters = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def request(self, method, base_url, path, **kwargs):
+        return self._session(base_url).request(method, base_url + path, **kwargs)
+
+    def close(self):
+        with self._lock:
+            adapters = list(self._adapters.values())
+            self._adapters = {}
+            self._generation += 1
+        for adapter in adapters:
+            adapter.close()
+
+    def _session(self, base_url):
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.session = requests.Session()
+            local.mounted = set()
+            local.generation = self._generation
+        if base_url not in local.mounted:
+            local.session.mount(base_url, self._adapter(base_url))
+            local.mounted.add(base_url)
+        return local.session
+
+    def _adapter(self, base_url):
+        with self._lock:
+            adapter = self._adapters.get(base_url)
+            if adapter is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_connections,
+                    pool_maxsize=self.pool_maxsize,
+                    pool_block=self.pool_block,
+                )
+                self._adapters[base_url] = adapter
+            return adapter
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -1,12 +1,18 @@
+from shift4.bulk import DEFAULT_CONCURRENCY
+from shift4.models import Subscription
 from shift4.resource import Resource
 
 
 class Subscriptions(Resource):
+    model = Subscription
+
     def create(self, params, request_options=None):
         return self._post("/subscriptions", params, request_options=request_options)
 
-    def get(self, subscription_id):
-        return self._get("/subscriptions/%s" % subscription_id)
+    def get(self, subscription_id, request_options=None):
+        return self._get(
+            "/subscriptions/%s" % subscription_id, request_options=request_options
+        )
 
     def update(self, subscription_id, params, request_options=None):
         return self._post(
@@ -15,8 +21,28 @@ class Subscriptions(Resource):
             request_options=request_options,
         )
 
-    def cancel(self, subscription_id):
-        return self._delete("/subscriptions/%s" % subscription_id)
+    def cancel(self, subscription_id, request_options=None):
+        return self._delete(
+            "/subscriptions/%s" % subscription_id, request_options=request_options
+        )
+
+    def cancel_many(
+        self,
+        subscription_ids,
+        concurrency=DEFAULT_CONCURRENCY,
+        idempotency_key_prefix=None,
+    ):
+        return self._many(
+            lambda subscription_id, options: self.cancel(
+                subscription_id, request_options=options
+            ),
+            subscription_ids,
+            concurrency,
+            idempotency_key_prefix,
+        )
+
+    def list(self, params=None, request_options=None):
+        return self._get("/subscriptions", params, request_options=request_options)
 
-    def list(self, params=None):
-        return self._get("/subscriptions", params)
+    def iter_all(self, params=None, page_size=None, prefetch=0):
+        return self._iter_all(self.list, params, page_size, prefetch)
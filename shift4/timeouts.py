@@ -0,0 +1,62 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_deadline = ContextVar("shift4_deadline", default=None)
+
+
+class Timeout(object):
+    def __init__(self, connect=None, read=None):
+        self.connect = connect
+        self.read = read
+
+    @classmethod
+    def of(cls, value):
+        if isinstance(value, Timeout):
+            return value
+        if value is None:
+            return cls()
+        if isinstance(value, tuple):
+            return cls(*value)
+        return cls(value, value)
+
+    def bounded(self, seconds):
+        return Timeout(_min(self.connect, seconds), _min(self.read, seconds))
+
+    def as_tuple(self):
+        return self.connect, self.read
+
+    def __eq__(self, other):
+        return isinstance(other, Timeout) and self.as_tuple() == other.as_tuple()
+
+    def __repr__(self):
+        return "Timeout(connect=%r, read=%r)" % self.as_tuple()
+
+
+DEFAULT_TIMEOUT = Timeout(connect=10, read=60)
+
+
+@contextmanager
+def deadline(seconds):
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None and current < expires_at:
+        expires_at = current
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining():
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def _min(value, limit):
+    if value is None:
+        return limit
+    return min(value, limit)
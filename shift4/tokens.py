@@ -1,9 +1,12 @@
+from shift4.models import Token
 from shift4.resource import Resource
 
 
 class Tokens(Resource):
-    def create(self, params):
-        return self._post("/tokens", params)
+    model = Token
 
-    def get(self, token_id):
-        return self._get("/tokens/%s" % token_id)
+    def create(self, params, request_options=None):
+        return self._post("/tokens", params, request_options=request_options)
+
+    def get(self, token_id, request_options=None):
+        return self._get("/tokens/%s" % token_id, request_options=request_options)
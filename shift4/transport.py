@@ -0,0 +1,176 @@
+import inspect
+import json
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from shift4.session_pool import SessionPool
+
+# A transport sends a single HTTP request and returns the raw response:
+#
+#     transport.send(method, url, headers, body, timeout) -> Response
+#
+# url already carries the query string and timeout is a (connect, read) tuple.
+# body is bytes, None or, for file uploads, a streaming MultipartEncoder that
+# can be read() like a file or iterated over, and has a known len().
+# Connection failures are reported as requests.ConnectionError and timeouts as
+# requests.Timeout, whatever the underlying HTTP stack, so that retries and
+# timeouts behave the same for every transport.
+
+
+class Request(object):
+    def __init__(self, method, url, headers, body):
+        self.method = method
+        self.url = url
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+
+    @property
+    def path(self):
+        return urlsplit(self.url).path
+
+    @property
+    def query(self):
+        return urlsplit(self.url).query
+
+    def json(self):
+        if self.body is None:
+            return None
+        return json.loads(self.body)
+
+
+class Response(object):
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", "replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class Transport(object):
+    def send(self, method, url, headers, body=None, timeout=(None, None)):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class AsyncTransport(object):
+    async def send(self, method, url, headers, body=None, timeout=(None, None)):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class RequestsTransport(Transport):
+    # Opens a new connection for every request.
+    def send(self, method, url, headers, body=None, timeout=(None, None)):
+        resp = requests.request(
+            method,
+            url,
+            headers=headers,
+            data=body,
+            timeout=timeout,
+            auth=_keep_authorization,
+        )
+        return Response(resp.status_code, resp.headers, resp.content)
+
+
+class PooledTransport(Transport):
+    def __init__(
+        self, pool_connections=10, pool_maxsize=10, session_pool=None, pool_block=False
+    ):
+        if session_pool is None:
+            session_pool = SessionPool(pool_connections, pool_maxsize, pool_block)
+        self.session_pool = session_pool
+
+    def send(self, method, url, headers, body=None, timeout=(None, None)):
+        parts = urlsplit(url)
+        base_url = "%s://%s" % (parts.scheme, parts.netloc)
+        resp = self.session_pool.request(
+            method,
+            base_url,
+            url[len(base_url) :],
+            headers=headers,
+            data=body,
+            timeout=timeout,
+            auth=_keep_authorization,
+        )
+        return Response(resp.status_code, resp.headers, resp.content)
+
+    def close(self):
+        self.session_pool.close()
+
+
+class InProcessTransport(Transport):
+    # Dispatches requests straight to handler(request) without touching the
+    # network. The handler returns a Response or a (status_code, body) or
+    # (status_code, headers, body) tuple, where body is bytes, str or an
+    # object to be encoded as JSON.
+    def __init__(self, handler):
+        self.handler = handler
+
+    def send(self, method, url, headers, body=None, timeout=(None, None)):
+        request = Request(method, url, headers, read_body(body))
+        return to_response(self.handler(request))
+
+
+class AsyncInProcessTransport(AsyncTransport):
+    # Same as InProcessTransport, the handler may be a coroutine function.
+    def __init__(self, handler):
+        self.handler = handler
+
+    async def send(self, method, url, headers, body=None, timeout=(None, None)):
+        result = self.handler(Request(method, url, headers, read_body(body)))
+        if inspect.isawaitable(result):
+            result = await result
+        return to_response(result)
+
+
+# The client sets the Authorization header itself. Passing an auth callable
+# keeps requests from replacing it with credentials found in ~/.netrc.
+def _keep_authorization(request):
+    return request
+
+
+def read_body(body):
+    if body is None or isinstance(body, bytes):
+        return body
+    return b"".join(body)
+
+
+def to_response(result):
+    if isinstance(result, Response):
+        return result
+    if len(result) == 2:
+        status_code, body = result
+        headers = {}
+    else:
+        status_code, headers, body = result
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    elif not isinstance(body, bytes):
+        body = json.dumps(body).encode("utf-8")
+        headers = dict(headers)
+        headers["Content-Type"] = "application/json"
+    return Response(status_code, headers, body)
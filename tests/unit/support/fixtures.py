@@ -0,0 +1,53 @@
+def card(i=0):
+    return {
+        "id": "card_%08d" % i,
+        "created": 1700000000 + i,
+        "objectType": "card",
+        "first6": "424242",
+        "last4": "4242",
+        "fingerprint": "e3d8suyIDgFg3pE7",
+        "expMonth": "12",
+        "expYear": "2030",
+        "cardholderName": "John Smith",
+        "customerId": "cust_%08d" % i,
+        "brand": "Visa",
+        "type": "Credit Card",
+        "country": "CH",
+    }
+
+
+def customer(i=0):
+    return {
+        "id": "cust_%08d" % i,
+        "created": 1700000000 + i,
+        "deleted": False,
+        "email": "user%s@example.com" % i,
+        "description": "Customer %s" % i,
+        "defaultCardId": "card_%08d" % i,
+        "cards": [card(i)],
+        "metadata": {"orderId": str(i), "note": "zamówienie"},
+    }
+
+
+def charge(i=0):
+    return {
+        "id": "char_%08d" % i,
+        "created": 1700000000 + i,
+        "objectType": "charge",
+        "amount": 1000 + i,
+        "amountRefunded": 0,
+        "currency": "EUR",
+        "description": "Charge %s" % i,
+        "card": card(i),
+        "customerId": "cust_%08d" % i,
+        "captured": True,
+        "refunded": False,
+        "disputed": False,
+        "fraudDetails": {"status": "safe"},
+        "avsCheck": {"result": "unavailable"},
+        "metadata": {"orderId": str(i), "note": "zamówienie"},
+    }
+
+
+def page(limit, factory=charge):
+    return {"list": [factory(i) for i in range(limit)], "hasMore": False}
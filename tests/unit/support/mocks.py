@@ -0,0 +1,64 @@
+import threading
+import time
+
+from shift4.transport import AsyncInProcessTransport, InProcessTransport
+
+
+class StubTransport(InProcessTransport):
+    # Replies with the given responses in order and records the requests.
+    # An exception instance in place of a response is raised instead.
+    def __init__(self, *responses):
+        super(StubTransport, self).__init__(self._reply)
+        self.responses = list(responses) or [(200, {"id": "obj_1"})]
+        self.requests = []
+        self.timeouts = []
+
+    def send(self, method, url, headers, body=None, timeout=(None, None)):
+        self.timeouts.append(timeout)
+        return super(StubTransport, self).send(method, url, headers, body, timeout)
+
+    def _reply(self, request):
+        self.requests.append(request)
+        response = (
+            self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+        )
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class AsyncStubTransport(AsyncInProcessTransport):
+    def __init__(self, *responses):
+        self.stub = StubTransport(*responses)
+        super(AsyncStubTransport, self).__init__(self.stub._reply)
+
+    @property
+    def requests(self):
+        return self.stub.requests
+
+
+class ConcurrentEndpoint(object):
+    # Handler for InProcessTransport that records requests, holds each one for
+    # delay seconds and tracks how many were in flight at once. Subclasses
+    # answer in reply(request).
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        with self.lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            return self.reply(request)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def reply(self, request):
+        raise NotImplementedError
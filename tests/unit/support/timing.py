@@ -0,0 +1,15 @@
+import time
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for(condition, timeout=2):
+    until = time.time() + timeout
+    while not condition() and time.time() < until:
+        time.sleep(0.005)
@@ -0,0 +1,114 @@
+import asyncio
+import json
+import unittest
+
+import httpx
+
+import shift4 as api
+from shift4 import AsyncHttpxTransport, AsyncShift4Client
+
+
+def async_client(handler, **kwargs):
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    transport = AsyncHttpxTransport(http_client=http_client)
+    return AsyncShift4Client("sk_test", transport=transport, **kwargs)
+
+
+class TestAsyncShift4Client(unittest.TestCase):
+    def test_get(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "char_1"})
+
+        async def run():
+            async with async_client(handler) as client:
+                return await client.charges.get("char_1")
+
+        self.assertEqual(asyncio.run(run()), {"id": "char_1"})
+        self.assertEqual(str(requests[0].url), "https://api.shift4.com/charges/char_1")
+        self.assertTrue(requests[0].headers["Authorization"].startswith("Basic "))
+
+    def test_post_with_idempotency_key(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=json.loads(request.content))
+
+        async def run():
+            async with async_client(handler) as client:
+                return await client.charges.create(
+                    {"amount": 100}, request_options={"idempotency_key": "key_1"}
+                )
+
+        self.assertEqual(asyncio.run(run()), {"amount": 100})
+        self.assertEqual(requests[0].method, "POST")
+        self.assertEqual(requests[0].headers["Idempotency-Key"], "key_1")
+
+    def test_uploads_url(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "file_1"})
+
+        async def run():
+            async with async_client(
+                handler, uploads_url="https://uploads.example.com"
+            ) as client:
+                await client.file_uploads.upload(
+                    ("evidence.pdf", b"content", "application/pdf"),
+                    {"purpose": "dispute_evidence"},
+                )
+
+        asyncio.run(run())
+        self.assertEqual(
+            str(requests[0].url),
+            "https://uploads.example.com/files?purpose=dispute_evidence",
+        )
+
+    def test_concurrent_requests(self):
+        def handler(request):
+            return httpx.Response(200, json={"path": request.url.path})
+
+        async def run():
+            async with async_client(handler) as client:
+                return await asyncio.gather(
+                    *[client.customers.get("cust_%s" % i) for i in range(10)]
+                )
+
+        results = asyncio.run(run())
+        self.assertEqual(
+            [result["path"] for result in results],
+            ["/customers/cust_%s" % i for i in range(10)],
+        )
+
+    def test_raises_shift4_exception(self):
+        def handler(request):
+            return httpx.Response(
+                402, json={"error": {"type": "card_error", "code": "card_declined"}}
+            )
+
+        async def run():
+            async with async_client(handler) as client:
+                await client.charges.create({"amount": 100})
+
+        with self.assertRaises(api.Shift4Exception) as context:
+            asyncio.run(run())
+        self.assertEqual(context.exception.code, "card_declined")
+
+    def test_timeout_raises_timeout_exception(self):
+        def handler(request):
+            raise httpx.ReadTimeout("read timed out", request=request)
+
+        async def run():
+            async with async_client(
+                handler, retry_policy=api.RetryPolicy(max_attempts=1)
+            ) as client:
+                with api.deadline(5):
+                    await client.charges.get("char_1")
+
+        with self.assertRaises(api.Shift4TimeoutException):
+            asyncio.run(run())
@@ -0,0 +1,172 @@
+import asyncio
+import unittest
+
+from shift4 import (
+    AsyncInProcessTransport,
+    AsyncShift4Client,
+    InProcessTransport,
+    Shift4Client,
+    Shift4Exception,
+)
+from tests.unit.support.mocks import ConcurrentEndpoint
+
+DECLINED = {"error": {"type": "card_error", "code": "card_declined"}}
+
+
+class ChargeEndpoint(ConcurrentEndpoint):
+    # Declines charges for an amount of 0.
+    def reply(self, request):
+        body = request.json() or {}
+        if body.get("amount") == 0:
+            return 402, DECLINED
+        segments = request.path.split("/")
+        if len(segments) > 2:
+            object_id = segments[2]
+        else:
+            object_id = "char_%d" % body["amount"]
+        return 200, dict(body, id=object_id)
+
+
+class TestBulk(unittest.TestCase):
+    def test_create_many_returns_results_in_input_order(self):
+        endpoint = ChargeEndpoint(delay=0.01)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.charges.create_many(
+            ({"amount": amount} for amount in [300, 0, 100, 200]), concurrency=3
+        )
+
+        self.assertEqual(results[0]["id"], "char_300")
+        self.assertIsInstance(results[1], Shift4Exception)
+        self.assertEqual(results[1].code, "card_declined")
+        self.assertEqual(results[2]["id"], "char_100")
+        self.assertEqual(results[3]["id"], "char_200")
+
+    def test_concurrency_is_bounded(self):
+        endpoint = ChargeEndpoint(delay=0.02)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        client.charges.create_many(
+            [{"amount": amount} for amount in range(1, 21)], concurrency=4
+        )
+
+        self.assertEqual(len(endpoint.requests), 20)
+        self.assertLessEqual(endpoint.max_in_flight, 4)
+        self.assertGreater(endpoint.max_in_flight, 1)
+
+    def test_idempotency_keys_are_stable_per_item(self):
+        endpoint = ChargeEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        client.charges.create_many(
+            [{"amount": 1}, {"amount": 2}], idempotency_key_prefix="batch-7"
+        )
+
+        keys = {
+            request.json()["amount"]: request.headers["Idempotency-Key"]
+            for request in endpoint.requests
+        }
+        self.assertEqual(keys, {1: "batch-7-0", 2: "batch-7-1"})
+
+    def test_refund_many(self):
+        endpoint = ChargeEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.charges.refund_many(["char_1", ("char_2", {"amount": 50})])
+
+        self.assertEqual(len(results), 2)
+        paths = sorted(request.path for request in endpoint.requests)
+        self.assertEqual(paths, ["/charges/char_1/refund", "/charges/char_2/refund"])
+        bodies = {request.path: request.json() for request in endpoint.requests}
+        self.assertEqual(bodies["/charges/char_2/refund"], {"amount": 50})
+
+    def test_update_many(self):
+        endpoint = ChargeEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.customers.update_many(
+            [("cust_1", {"email": "a@example.com"}), ("cust_2", {"amount": 0})]
+        )
+
+        self.assertEqual(results[0], {"id": "cust_1", "email": "a@example.com"})
+        self.assertIsInstance(results[1], Shift4Exception)
+
+    def test_cancel_many(self):
+        endpoint = ChargeEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.subscriptions.cancel_many(["sub_1", "sub_2"])
+
+        self.assertEqual([result["id"] for result in results], ["sub_1", "sub_2"])
+        for request in endpoint.requests:
+            self.assertEqual(request.method, "DELETE")
+            self.assertIn("Idempotency-Key", request.headers)
+
+    def test_async_create_many(self):
+        endpoint = ChargeEndpoint()
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncInProcessTransport(endpoint.reply)
+        )
+
+        results = asyncio.run(
+            client.charges.create_many(
+                [{"amount": 100}, {"amount": 0}, {"amount": 200}], concurrency=2
+            )
+        )
+
+        self.assertEqual(results[0]["id"], "char_100")
+        self.assertIsInstance(results[1], Shift4Exception)
+        self.assertEqual(results[2]["id"], "char_200")
+
+
+class ObjectEndpoint(object):
+    # Returns the object at the requested path, or 404 for ids ending in 404.
+    def __init__(self):
+        self.paths = []
+
+    def __call__(self, request):
+        self.paths.append(request.path)
+        object_id = request.path.rsplit("/", 1)[1]
+        if object_id.endswith("404"):
+            return 404, {"error": {"type": "invalid_request", "message": "Not found"}}
+        return 200, {"id": object_id}
+
+
+class TestGetMany(unittest.TestCase):
+    def test_fetches_each_id_once(self):
+        endpoint = ObjectEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.charges.get_many(
+            ["char_1", "char_2", "char_1", "char_404"], concurrency=2
+        )
+
+        self.assertEqual(list(results), ["char_1", "char_2", "char_404"])
+        self.assertEqual(results["char_1"], {"id": "char_1"})
+        self.assertEqual(results["char_2"], {"id": "char_2"})
+        self.assertIsInstance(results["char_404"], Shift4Exception)
+        self.assertEqual(
+            sorted(endpoint.paths),
+            ["/charges/char_1", "/charges/char_2", "/charges/char_404"],
+        )
+
+    def test_composite_ids(self):
+        endpoint = ObjectEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.cards.get_many([("cust_1", "card_1"), ("cust_1", "card_1")])
+
+        self.assertEqual(results, {("cust_1", "card_1"): {"id": "card_1"}})
+        self.assertEqual(endpoint.paths, ["/customers/cust_1/cards/card_1"])
+
+    def test_async_get_many(self):
+        endpoint = ObjectEndpoint()
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncInProcessTransport(endpoint)
+        )
+
+        results = asyncio.run(client.customers.get_many(["cust_1", "cust_2"]))
+
+        self.assertEqual(
+            results, {"cust_1": {"id": "cust_1"}, "cust_2": {"id": "cust_2"}}
+        )
@@ -0,0 +1,278 @@
+import asyncio
+import unittest
+
+from shift4 import (
+    AsyncShift4Client,
+    Plan,
+    ResponseCache,
+    Shift4Client,
+    Shift4Exception,
+)
+from tests.unit.support.mocks import AsyncStubTransport, StubTransport
+from tests.unit.support.timing import FakeClock
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def client(self, cache=None, *responses):
+        return Shift4Client(
+            "sk_test",
+            transport=StubTransport(*responses),
+            cache=ResponseCache(clock=self.clock) if cache is None else cache,
+        )
+
+    def test_serves_repeated_gets_from_cache(self):
+        client = self.client(None, (200, {"id": "plan_1", "amount": 100}))
+
+        first = client.plans.get("plan_1")
+        first["amount"] = 0
+        second = client.plans.get("plan_1")
+
+        self.assertEqual(second, {"id": "plan_1", "amount": 100})
+        self.assertEqual(len(client.transport.requests), 1)
+        self.assertEqual(client.cache.stats()["hits"], 1)
+        self.assertEqual(client.cache.stats()["misses"], 1)
+
+    def test_only_configured_resources_are_cached(self):
+        client = self.client()
+
+        client.charges.get("char_1")
+        client.charges.get("char_1")
+        client.plans.list()
+        client.plans.list()
+
+        self.assertEqual(len(client.transport.requests), 4)
+
+    def test_entries_expire_after_ttl(self):
+        client = self.client(ResponseCache({"plans": 10}, clock=self.clock))
+
+        client.plans.get("plan_1")
+        self.clock.now = 9
+        client.plans.get("plan_1")
+        self.clock.now = 11
+        client.plans.get("plan_1")
+
+        self.assertEqual(len(client.transport.requests), 2)
+
+    def test_events_are_cached_forever(self):
+        client = self.client()
+
+        client.events.get("evt_1")
+        self.clock.now = 10**9
+        client.events.get("evt_1")
+
+        self.assertEqual(len(client.transport.requests), 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = ResponseCache(max_entries=2, clock=self.clock)
+        client = self.client(cache)
+
+        client.plans.get("plan_1")
+        client.plans.get("plan_2")
+        client.plans.get("plan_1")
+        client.plans.get("plan_3")
+        client.plans.get("plan_1")
+        client.plans.get("plan_2")
+
+        paths = [request.path for request in client.transport.requests]
+        self.assertEqual(
+            paths, ["/plans/plan_1", "/plans/plan_2", "/plans/plan_3", "/plans/plan_2"]
+        )
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+    def test_bounds_total_size(self):
+        cache = ResponseCache(max_bytes=50, clock=self.clock)
+        client = self.client(cache, (200, {"id": "plan_1", "name": "x" * 10}))
+
+        client.plans.get("plan_1")
+        client.plans.get("plan_2")
+
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.stats()["bytes"], 50)
+
+    def test_changes_through_client_invalidate_object(self):
+        client = self.client()
+
+        client.plans.get("plan_1")
+        client.plans.update("plan_1", {"name": "Gold"})
+        client.plans.get("plan_1")
+        client.plans.delete("plan_1")
+        client.plans.get("plan_1")
+
+        self.assertEqual(len(client.transport.requests), 5)
+
+    def test_changes_to_child_invalidate_parent(self):
+        client = self.client(ResponseCache({"customers": 60}, clock=self.clock))
+
+        client.customers.get("cust_1")
+        client.cards.delete("cust_1", "card_1")
+        client.customers.get("cust_1")
+
+        self.assertEqual(len(client.transport.requests), 3)
+
+    def test_errors_are_not_cached(self):
+        client = self.client(
+            None, (404, {"error": {"type": "invalid_request"}}), (200, {"id": "p"})
+        )
+
+        with self.assertRaises(Shift4Exception):
+            client.plans.get("plan_1")
+        client.plans.get("plan_1")
+
+        self.assertEqual(len(client.transport.requests), 2)
+
+    def test_entries_are_scoped_to_secret_key(self):
+        cache = ResponseCache(clock=self.clock)
+        first = Shift4Client("sk_first", transport=StubTransport(), cache=cache)
+        second = Shift4Client("sk_second", transport=StubTransport(), cache=cache)
+
+        first.plans.get("plan_1")
+        second.plans.get("plan_1")
+
+        self.assertEqual(len(second.transport.requests), 1)
+
+    def test_cached_responses_are_decoded_as_models(self):
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(),
+            cache=ResponseCache(),
+            use_models=True,
+        )
+
+        client.plans.get("plan_1")
+
+        self.assertIsInstance(client.plans.get("plan_1"), Plan)
+
+    def test_async_client(self):
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncStubTransport(), cache=ResponseCache()
+        )
+
+        async def run():
+            await client.plans.get("plan_1")
+            return await client.plans.get("plan_1")
+
+        self.assertEqual(asyncio.run(run()), {"id": "obj_1"})
+        self.assertEqual(len(client.transport.requests), 1)
+
+
+class TestApplyEvents(unittest.TestCase):
+    def setUp(self):
+        self.cache = ResponseCache(
+            {
+                "customers": 3600,
+                "subscriptions": 3600,
+                "charges": 3600,
+                "disputes": 3600,
+            }
+        )
+        self.client = Shift4Client(
+            "sk_test",
+            transport=StubTransport((200, {"id": "obj_1", "version": 1})),
+            cache=self.cache,
+        )
+
+    def requests_for(self, path):
+        return [r for r in self.client.transport.requests if r.path == path]
+
+    def test_event_evicts_referenced_object(self):
+        self.client.customers.get("cust_1")
+        self.client.customers.get("cust_2")
+
+        self.client.apply_events(
+            {"type": "CUSTOMER_UPDATED", "data": {"id": "cust_1", "email": "x"}}
+        )
+        self.client.customers.get("cust_1")
+        self.client.customers.get("cust_2")
+
+        self.assertEqual(len(self.requests_for("/customers/cust_1")), 2)
+        self.assertEqual(len(self.requests_for("/customers/cust_2")), 1)
+
+    def test_accepts_webhook_body_and_event_pages(self):
+        self.client.subscriptions.get("sub_1")
+        self.client.charges.get("char_1")
+
+        self.client.apply_events(
+            b'{"type": "CUSTOMER_SUBSCRIPTION_UPDATED", "data": {"id": "sub_1"}}'
+        )
+        self.client.apply_events(
+            {"list": [{"type": "CHARGE_CAPTURED", "data": {"id": "char_1"}}]}
+        )
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_dispute_event_evicts_its_charge(self):
+        self.client.disputes.get("disp_1")
+        self.client.charges.get("char_1")
+
+        self.client.apply_events(
+            {
+                "type": "CHARGE_DISPUTE_UPDATED",
+                "data": {"id": "disp_1", "charge": {"id": "char_1"}},
+            }
+        )
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_card_event_evicts_customer(self):
+        self.client.customers.get("cust_1")
+
+        self.client.apply_events(
+            {
+                "type": "CUSTOMER_CARD_DELETED",
+                "data": {"id": "card_1", "customerId": "cust_1"},
+            }
+        )
+
+        self.assertEqual(len(self.cache), 0)
+
+    def test_replace_stores_event_copy(self):
+        self.client.customers.get("cust_1")
+
+        self.client.apply_events(
+            [{"type": "CUSTOMER_UPDATED", "data": {"id": "cust_1", "version": 2}}],
+            replace=True,
+        )
+
+        self.assertEqual(
+            self.client.customers.get("cust_1"), {"id": "cust_1", "version": 2}
+        )
+        self.assertEqual(len(self.client.transport.requests), 1)
+
+    def test_replace_applies_page_oldest_first(self):
+        self.client.customers.get("cust_1")
+
+        self.client.apply_events(
+            {
+                "list": [
+                    {
+                        "type": "CUSTOMER_UPDATED",
+                        "created": 1002,
+                        "data": {"id": "cust_1", "email": "new@example.com"},
+                    },
+                    {
+                        "type": "CUSTOMER_UPDATED",
+                        "created": 1001,
+                        "data": {"id": "cust_1", "email": "old@example.com"},
+                    },
+                ]
+            },
+            replace=True,
+        )
+
+        self.assertEqual(
+            self.client.customers.get("cust_1"),
+            {"id": "cust_1", "email": "new@example.com"},
+        )
+        self.assertEqual(len(self.client.transport.requests), 1)
+
+    def test_replace_evicts_deleted_objects(self):
+        self.client.customers.get("cust_1")
+
+        self.client.apply_events(
+            {"type": "CUSTOMER_DELETED", "data": {"id": "cust_1"}}, replace=True
+        )
+
+        self.assertEqual(len(self.cache), 0)
@@ -1,3 +1,4 @@
+import base64
 import json
 import unittest
 
@@ -21,3 +22,37 @@ class TestCheckoutRequest(unittest.TestCase):
             ),
             "NTk1MjY3MmZjMjdjMjdkZjEyNDlhYjA3YTQ4NDE2NDdhYzcwOGM1MzdjYWQ3MDhjNDRlZWVkMDIzOWI0OTc0Ynx7ImNoYXJnZSI6eyJhbW91bnQiOjQ5OSwiY3VycmVuY3kiOiJFVVIifX0=",
         )
+
+    def test_sign_many(self):
+        requests = [
+            '{"charge":{"amount":499,"currency":"EUR"}}',
+            {"charge": {"currency": "USD", "amount": 100}, "customerId": "cust_1"},
+            {"charge": {"amount": 1, "currency": "EUR"}, "description": "zażółć"},
+        ]
+        expected = [api.checkout_request.sign(request) for request in requests]
+        self.assertEqual(api.checkout_request.sign_many(requests), expected)
+        self.assertEqual(
+            api.checkout_request.sign_many(iter(requests), processes=2), expected
+        )
+
+    def test_signer_matches_json_dumps(self):
+        request = {"b": [1, 2.5, None, True], "a": {"d": "ü", "c": " "}}
+        signer = api.CheckoutRequestSigner("sk_test_other")
+        self.assertEqual(
+            signer.sign(request),
+            api.checkout_request.sign(
+                json.dumps(request, sort_keys=True, separators=(",", ":")),
+                secret_key="sk_test_other",
+            ),
+        )
+
+    def test_verify(self):
+        signed = api.checkout_request.sign({"charge": {"amount": 499}})
+        self.assertTrue(api.checkout_request.verify(signed))
+        self.assertFalse(api.checkout_request.verify(signed, "sk_test_other"))
+
+        digest, payload = base64.b64decode(signed).split(b"|", 1)
+        tampered = base64.b64encode(digest + b"|" + payload.replace(b"4", b"5"))
+        self.assertFalse(api.checkout_request.verify(tampered))
+        self.assertFalse(api.checkout_request.verify("not base64!"))
+        self.assertFalse(api.checkout_request.verify(base64.b64encode(b"no-separator")))
@@ -0,0 +1,197 @@
+import asyncio
+import unittest
+
+import requests
+
+from shift4 import (
+    AsyncShift4Client,
+    CircuitBreaker,
+    RateLimiter,
+    RetryPolicy,
+    Shift4CircuitOpenException,
+    Shift4Client,
+    Shift4Exception,
+    TokenBucket,
+)
+from shift4.routes import route_template
+from tests.unit.support.mocks import AsyncStubTransport, StubTransport
+from tests.unit.support.timing import FakeClock
+
+UNAVAILABLE = (503, {"error": {"type": "api_error"}})
+NOT_FOUND = (404, {"error": {"type": "invalid_request"}})
+OK = (200, {"id": "obj_1"})
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            window=4, min_calls=2, reset_timeout=10, clock=self.clock
+        )
+
+    def client(self, *responses):
+        return Shift4Client(
+            "sk_test",
+            transport=StubTransport(*responses),
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=self.breaker,
+        )
+
+    def fail(self, client, call, times=1):
+        for _ in range(times):
+            with self.assertRaises(Shift4Exception):
+                call()
+
+    def test_route_template(self):
+        self.assertEqual(
+            route_template("https://api.shift4.com/charges/char_1/refund?x=1"),
+            "api.shift4.com/charges/{id}/refund",
+        )
+        self.assertEqual(
+            route_template("https://uploads.api.shift4.com/files"),
+            "uploads.api.shift4.com/files",
+        )
+
+    def test_opens_after_failures_and_fails_fast(self):
+        client = self.client(UNAVAILABLE)
+
+        self.fail(client, lambda: client.charges.get("char_1"), times=2)
+        with self.assertRaises(Shift4CircuitOpenException) as context:
+            client.charges.get("char_2")
+
+        self.assertEqual(len(client.transport.requests), 2)
+        self.assertEqual(context.exception.type, "circuit_open")
+        self.assertEqual(context.exception.route, "api.shift4.com/charges/{id}")
+        self.assertEqual(self.breaker.state(context.exception.route), "open")
+
+    def test_connection_errors_are_failures(self):
+        client = self.client(requests.ConnectionError("refused"))
+
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                client.plans.get("plan_1")
+
+        with self.assertRaises(Shift4CircuitOpenException):
+            client.plans.get("plan_1")
+
+    def test_other_routes_and_client_errors_are_not_affected(self):
+        client = self.client(UNAVAILABLE, UNAVAILABLE, NOT_FOUND)
+
+        self.fail(client, lambda: client.charges.get("char_1"), times=2)
+        self.fail(client, lambda: client.customers.get("cust_1"), times=3)
+
+        self.assertEqual(self.breaker.state("api.shift4.com/customers/{id}"), "closed")
+
+    def test_successful_probe_closes_circuit(self):
+        client = self.client(UNAVAILABLE, UNAVAILABLE, OK)
+        self.fail(client, lambda: client.charges.get("char_1"), times=2)
+
+        self.clock.now = 10
+        client.charges.get("char_1")
+        client.charges.get("char_1")
+
+        self.assertEqual(self.breaker.state("api.shift4.com/charges/{id}"), "closed")
+        self.assertEqual(len(client.transport.requests), 4)
+
+    def test_failed_probe_reopens_circuit(self):
+        client = self.client(UNAVAILABLE)
+        self.fail(client, lambda: client.charges.get("char_1"), times=2)
+
+        self.clock.now = 10
+        self.fail(client, lambda: client.charges.get("char_1"))
+        with self.assertRaises(Shift4CircuitOpenException):
+            client.charges.get("char_1")
+
+        self.assertEqual(len(client.transport.requests), 3)
+
+    def test_only_allowed_probes_pass_while_half_open(self):
+        self.breaker.record("route", True, 0)
+        self.breaker.acquire("route")
+        self.breaker.record("route", True, 0)
+        self.breaker.record("route", True, 0)
+        self.clock.now = 10
+
+        self.breaker.acquire("route")
+        with self.assertRaises(Shift4CircuitOpenException):
+            self.breaker.acquire("route")
+
+    def test_late_calls_do_not_count_as_probes(self):
+        self.breaker.acquire("route")  # let through while closed, ends late
+        self.breaker.record("route", True, 0)
+        self.breaker.record("route", True, 0)
+        self.clock.now = 10
+        probe = self.breaker.acquire("route")
+
+        self.breaker.record("route", False, 0)
+        self.assertEqual(self.breaker.state("route"), "half_open")
+        self.breaker.record("route", True, 0)
+        self.assertEqual(self.breaker.state("route"), "half_open")
+
+        self.breaker.record("route", False, 0, probe)
+        self.assertEqual(self.breaker.state("route"), "closed")
+        self.breaker.record("route", True, 0, probe)
+        self.assertEqual(self.breaker.snapshot()["route"]["failures"], 0)
+
+    def test_open_circuit_fails_before_rate_limit(self):
+        client = self.client(UNAVAILABLE)
+        self.fail(client, lambda: client.charges.get("char_1"), times=2)
+        bucket = TokenBucket(rate=1, burst=1, clock=self.clock)
+        limited = Shift4Client(
+            "sk_test",
+            transport=StubTransport(OK),
+            circuit_breaker=self.breaker,
+            rate_limiter=RateLimiter(groups={"charges": bucket}),
+        )
+
+        for _ in range(3):
+            with self.assertRaises(Shift4CircuitOpenException):
+                limited.charges.get("char_2")
+
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(limited.transport.requests, [])
+
+    def test_opens_on_slow_calls(self):
+        breaker = CircuitBreaker(
+            slow_call_duration=2, slow_call_rate=0.5, min_calls=4, clock=self.clock
+        )
+        breaker.acquire("route")
+        for duration in (0.1, 3, 0.1, 5):
+            breaker.record("route", False, duration)
+
+        self.assertEqual(breaker.state("route"), "open")
+
+    def test_snapshot(self):
+        client = self.client(OK, OK, UNAVAILABLE)
+        client.charges.get("char_1")
+        client.charges.get("char_1")
+        self.fail(client, lambda: client.charges.get("char_1"))
+
+        self.assertEqual(
+            self.breaker.snapshot(),
+            {
+                "api.shift4.com/charges/{id}": {
+                    "state": "closed",
+                    "calls": 3,
+                    "failures": 1,
+                    "slow_calls": 0,
+                }
+            },
+        )
+
+    def test_async_client(self):
+        client = AsyncShift4Client(
+            "sk_test",
+            transport=AsyncStubTransport(UNAVAILABLE),
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=self.breaker,
+        )
+
+        async def run():
+            for _ in range(2):
+                with self.assertRaises(Shift4Exception):
+                    await client.charges.get("char_1")
+            with self.assertRaises(Shift4CircuitOpenException):
+                await client.charges.get("char_1")
+
+        asyncio.run(run())
+        self.assertEqual(len(client.transport.requests), 2)
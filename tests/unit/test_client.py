@@ -0,0 +1,132 @@
+import base64
+import unittest
+
+import shift4 as api
+from shift4 import Shift4Client
+from tests.unit.support.mocks import StubTransport
+
+
+def basic_auth(secret_key):
+    return "Basic " + base64.b64encode(("%s:" % secret_key).encode()).decode()
+
+
+class TestShift4Client(unittest.TestCase):
+    def test_clients_use_their_own_configuration(self):
+        first = Shift4Client("sk_first", transport=StubTransport())
+        second = Shift4Client(
+            "sk_second",
+            api_url="https://api.example.com/",
+            transport=StubTransport(),
+        )
+
+        first.charges.get("char_1")
+        second.customers.get("cust_1")
+
+        first_request = first.transport.requests[0]
+        self.assertEqual(first_request.method, "GET")
+        self.assertEqual(first_request.url, "https://api.shift4.com/charges/char_1")
+        self.assertEqual(first_request.headers["Authorization"], basic_auth("sk_first"))
+        second_request = second.transport.requests[0]
+        self.assertEqual(second_request.url, "https://api.example.com/customers/cust_1")
+        self.assertEqual(
+            second_request.headers["Authorization"], basic_auth("sk_second")
+        )
+
+    def test_list_params_are_sent_in_query(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+
+        client.charges.list({"limit": 10, "customerId": None})
+
+        self.assertEqual(client.transport.requests[0].query, "limit=10")
+
+    def test_post_sends_json_body(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+
+        client.customers.create({"email": "user@example.com"})
+
+        request = client.transport.requests[0]
+        self.assertEqual(request.method, "POST")
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(request.json(), {"email": "user@example.com"})
+
+    def test_file_uploads_use_client_uploads_url(self):
+        client = Shift4Client(
+            "sk_test",
+            uploads_url="https://uploads.example.com",
+            transport=StubTransport(),
+        )
+
+        client.file_uploads.upload(
+            ("evidence.pdf", b"%PDF", "application/pdf"),
+            {"purpose": "dispute_evidence"},
+        )
+
+        request = client.transport.requests[0]
+        self.assertEqual(
+            request.url, "https://uploads.example.com/files?purpose=dispute_evidence"
+        )
+        self.assertTrue(
+            request.headers["Content-Type"].startswith("multipart/form-data")
+        )
+        self.assertIn(b'filename="evidence.pdf"', request.body)
+        self.assertIn(b"%PDF", request.body)
+
+    def test_raises_shift4_exception_on_error(self):
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(
+                (400, {"error": {"type": "card_error", "code": "card_declined"}})
+            ),
+        )
+
+        with self.assertRaises(api.Shift4Exception) as context:
+            client.charges.create({"amount": 100})
+
+        self.assertEqual(context.exception.type, "card_error")
+        self.assertEqual(context.exception.code, "card_declined")
+
+    def test_close_closes_transport(self):
+        closed = []
+        transport = StubTransport()
+        transport.close = lambda: closed.append(True)
+
+        with Shift4Client("sk_test", transport=transport):
+            pass
+
+        self.assertEqual(closed, [True])
+
+
+class TestDefaultClient(unittest.TestCase):
+    def setUp(self):
+        self.previous = (api.secret_key, api.api_url, api.default_transport)
+
+    def tearDown(self):
+        api.secret_key, api.api_url, api.default_transport = self.previous
+
+    def test_module_level_api_reads_module_settings(self):
+        api.secret_key = "sk_module"
+        api.api_url = "https://api.example.com"
+        api.default_transport = StubTransport()
+
+        api.charges.get("char_1")
+
+        request = api.default_transport.requests[0]
+        self.assertEqual(request.url, "https://api.example.com/charges/char_1")
+        self.assertEqual(request.headers["Authorization"], basic_auth("sk_module"))
+
+    def test_settings_do_not_shadow_submodules(self):
+        import shift4.cache
+        import shift4.circuit_breaker
+        import shift4.codec
+        import shift4.hooks
+        import shift4.instrumentation
+        import shift4.single_flight
+        import shift4.transport
+
+        self.assertIs(shift4.cache.ResponseCache, api.ResponseCache)
+        self.assertIs(shift4.circuit_breaker.CircuitBreaker, api.CircuitBreaker)
+        self.assertIs(shift4.codec.JsonCodec, api.JsonCodec)
+        self.assertIs(shift4.hooks.Hooks, api.Hooks)
+        self.assertIs(shift4.instrumentation.Instrumentation, api.Instrumentation)
+        self.assertIs(shift4.single_flight.SingleFlight, api.SingleFlight)
+        self.assertIs(shift4.transport.Transport, api.Transport)
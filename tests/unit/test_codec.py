@@ -0,0 +1,93 @@
+import datetime
+import decimal
+import enum
+import json
+import unittest
+import uuid
+
+from shift4 import InProcessTransport, JsonCodec, OrjsonCodec, Shift4Client
+from shift4.codec import orjson
+
+METADATA = {"note": "zamówienie – 東京", 1: "int key", "emoji": "💳"}
+
+
+class CodecContract(object):
+    def test_round_trip(self):
+        body = {"amount": 1000, "metadata": METADATA, "captured": True, "x": None}
+
+        self.assertEqual(
+            json.loads(self.codec.dumps(body)), json.loads(JsonCodec().dumps(body))
+        )
+        self.assertEqual(
+            self.codec.loads(self.codec.dumps(body)), json.loads(json.dumps(body))
+        )
+
+    def test_decimal_is_rejected(self):
+        with self.assertRaises(TypeError):
+            self.codec.dumps({"amount": decimal.Decimal("10.00")})
+
+    def test_datetime_is_rejected(self):
+        with self.assertRaises(TypeError):
+            self.codec.dumps({"created": datetime.datetime(2024, 1, 1)})
+
+    def test_non_finite_floats_are_rejected(self):
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.assertRaises(ValueError):
+                self.codec.dumps({"amount": value})
+
+    def test_uuid_and_enum_are_rejected(self):
+        class Currency(enum.Enum):
+            EUR = "EUR"
+
+        for value in (uuid.uuid4(), Currency.EUR):
+            with self.assertRaises(TypeError):
+                self.codec.dumps({"value": value})
+
+    def test_big_integers(self):
+        self.assertEqual(self.codec.loads(self.codec.dumps(2**70)), 2**70)
+
+    def test_decodes_bytes(self):
+        self.assertEqual(
+            self.codec.loads('{"note":"zamówienie"}'.encode("utf-8")),
+            {"note": "zamówienie"},
+        )
+
+    def test_invalid_json_raises_value_error(self):
+        with self.assertRaises(ValueError):
+            self.codec.loads(b"<html>Bad Gateway</html>")
+
+
+class TestJsonCodec(CodecContract, unittest.TestCase):
+    codec = JsonCodec()
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class TestOrjsonCodec(CodecContract, unittest.TestCase):
+    def setUp(self):
+        self.codec = OrjsonCodec()
+
+
+class TestClientCodec(unittest.TestCase):
+    def test_client_uses_codec(self):
+        class RecordingCodec(JsonCodec):
+            calls = []
+
+            def dumps(self, obj):
+                self.calls.append(("dumps", obj))
+                return super(RecordingCodec, self).dumps(obj)
+
+            def loads(self, data):
+                self.calls.append(("loads", data))
+                return super(RecordingCodec, self).loads(data)
+
+        codec = RecordingCodec()
+        client = Shift4Client(
+            "sk_test",
+            transport=InProcessTransport(lambda request: (200, b'{"id":"cust_1"}')),
+            codec=codec,
+        )
+
+        self.assertEqual(client.customers.create({"email": "x"}), {"id": "cust_1"})
+        self.assertEqual(
+            codec.calls, [("dumps", {"email": "x"}), ("loads", b'{"id":"cust_1"}')]
+        )
@@ -0,0 +1,147 @@
+import asyncio
+import re
+import unittest
+
+from shift4 import (
+    AsyncInProcessTransport,
+    AsyncShift4Client,
+    InProcessTransport,
+    Shift4Client,
+    Shift4Exception,
+)
+from tests.unit.support.mocks import ConcurrentEndpoint
+
+
+class EvidenceEndpoint(ConcurrentEndpoint):
+    # Accepts uploads (rejecting files named "bad.pdf") and dispute updates.
+    def __init__(self, delay=0):
+        super(EvidenceEndpoint, self).__init__(delay)
+        self.uploads = []
+        self.updates = []
+
+    def reply(self, request):
+        if request.path == "/files":
+            filename = re.search(rb'filename="([^"]+)"', request.body).group(1)
+            self.uploads.append((request.query, filename.decode()))
+            if filename == b"bad.pdf":
+                return 400, {"error": {"type": "invalid_request"}}
+            return 200, {"id": "file_" + filename.decode().split(".")[0]}
+        self.updates.append((request.path, request.json()))
+        return 200, dict(request.json(), id=request.path.split("/")[2])
+
+
+class TestSubmitEvidence(unittest.TestCase):
+    def test_uploads_files_and_updates_dispute_once(self):
+        endpoint = EvidenceEndpoint(delay=0.02)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        dispute = client.disputes.submit_evidence(
+            "disp_1",
+            {
+                "receipt": ("receipt.pdf", b"%PDF"),
+                "customerCommunication": ("emails.pdf", b"%PDF"),
+                "shippingDocumentation": ("tracking.png", b"\x89PNG"),
+            },
+            {"customerName": "John Doe"},
+        )
+
+        self.assertEqual(len(endpoint.uploads), 3)
+        self.assertEqual(endpoint.max_in_flight, 3)
+        self.assertTrue(
+            all(query == "purpose=dispute_evidence" for query, _ in endpoint.uploads)
+        )
+        self.assertEqual(
+            endpoint.updates,
+            [
+                (
+                    "/disputes/disp_1",
+                    {
+                        "evidence": {
+                            "customerName": "John Doe",
+                            "receipt": "file_receipt",
+                            "customerCommunication": "file_emails",
+                            "shippingDocumentation": "file_tracking",
+                        }
+                    },
+                )
+            ],
+        )
+        self.assertEqual(dispute["id"], "disp_1")
+
+    def test_failed_upload_attaches_nothing(self):
+        endpoint = EvidenceEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        with self.assertRaises(Shift4Exception):
+            client.disputes.submit_evidence(
+                "disp_1",
+                {"receipt": ("receipt.pdf", b"%PDF"), "refundPolicy": ("bad.pdf", b"")},
+            )
+
+        self.assertEqual(endpoint.updates, [])
+
+    def test_submit_evidence_many(self):
+        endpoint = EvidenceEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.disputes.submit_evidence_many(
+            [
+                ("disp_1", {"receipt": ("r1.pdf", b"%PDF")}),
+                ("disp_2", {"receipt": ("bad.pdf", b"%PDF")}),
+                (
+                    "disp_3",
+                    {"receipt": ("r3.pdf", b"%PDF")},
+                    {"productDescription": "Mug"},
+                ),
+            ],
+            concurrency=2,
+        )
+
+        self.assertEqual(results[0]["evidence"], {"receipt": "file_r1"})
+        self.assertIsInstance(results[1], Shift4Exception)
+        self.assertEqual(
+            results[2]["evidence"],
+            {"productDescription": "Mug", "receipt": "file_r3"},
+        )
+        self.assertEqual(len(endpoint.updates), 2)
+
+    def test_missing_file_fails_only_its_submission(self):
+        endpoint = EvidenceEndpoint()
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        results = client.disputes.submit_evidence_many(
+            [
+                ("disp_1", {"receipt": ("r1.pdf", b"%PDF")}),
+                ("disp_2", {"receipt": "/nonexistent/receipt.pdf"}),
+                ("disp_3", {"receipt": ("r3.pdf", b"%PDF")}),
+            ]
+        )
+
+        self.assertEqual(results[0]["evidence"], {"receipt": "file_r1"})
+        self.assertIsInstance(results[1], FileNotFoundError)
+        self.assertEqual(results[2]["evidence"], {"receipt": "file_r3"})
+        self.assertEqual(
+            sorted(path for path, _ in endpoint.updates),
+            ["/disputes/disp_1", "/disputes/disp_3"],
+        )
+
+    def test_async_client(self):
+        endpoint = EvidenceEndpoint()
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncInProcessTransport(endpoint.reply)
+        )
+
+        async def run():
+            return await client.disputes.submit_evidence_many(
+                [
+                    ("disp_1", {"receipt": ("r1.pdf", b"%PDF")}),
+                    ("disp_2", {"receipt": ("r2.pdf", b"%PDF")}),
+                ]
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(
+            [result["evidence"] for result in results],
+            [{"receipt": "file_r1"}, {"receipt": "file_r2"}],
+        )
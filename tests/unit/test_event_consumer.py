@@ -0,0 +1,243 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from urllib.parse import parse_qs
+
+from shift4 import (
+    AsyncEventConsumer,
+    AsyncInProcessTransport,
+    AsyncShift4Client,
+    EventConsumer,
+    FileCheckpointStore,
+    InProcessTransport,
+    SQLiteCheckpointStore,
+    Shift4Client,
+    Shift4CursorNotFoundException,
+    Shift4Exception,
+)
+
+NOT_FOUND = 404, {"error": {"type": "invalid_request", "message": "Not found"}}
+
+
+class EventsEndpoint(object):
+    # Serves events newest first, like the API's events list. endingBeforeId
+    # lists the events created right after the given one.
+    def __init__(self, count=0):
+        self.events = []
+        self.requests = []
+        self.fail_at = None
+        self.add(count)
+
+    def add(self, count):
+        start = len(self.events)
+        for i in range(start, start + count):
+            self.events.insert(
+                0,
+                {"id": "evt_%03d" % i, "created": 1000 + i, "type": "CHARGE_SUCCEEDED"},
+            )
+
+    def __call__(self, request):
+        query = {k: v[0] for k, v in parse_qs(request.query).items()}
+        self.requests.append(query)
+        if self.fail_at is not None and len(self.requests) >= self.fail_at:
+            return 503, {"error": {"type": "api_error"}}
+        ids = [event["id"] for event in self.events]
+        if request.path != "/events":
+            event_id = request.path.split("/")[2]
+            if event_id not in ids:
+                return NOT_FOUND
+            return 200, self.events[ids.index(event_id)]
+        limit = int(query.get("limit", 10))
+        if "endingBeforeId" in query:
+            if query["endingBeforeId"] not in ids:
+                return NOT_FOUND
+            end = ids.index(query["endingBeforeId"])
+            start = max(0, end - limit)
+            return 200, {"list": self.events[start:end], "hasMore": start > 0}
+        start = 0
+        if "startingAfterId" in query:
+            start = ids.index(query["startingAfterId"]) + 1
+        page = self.events[start : start + limit]
+        return 200, {"list": page, "hasMore": start + limit < len(self.events)}
+
+
+class Handler(object):
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+
+    def __call__(self, batch):
+        ids = [event["id"] for event in batch]
+        if self.fail_on in ids:
+            raise ValueError(self.fail_on)
+        self.batches.append(ids)
+
+    @property
+    def ids(self):
+        return [event_id for batch in self.batches for event_id in batch]
+
+
+class TestEventConsumer(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cursor")
+        self.endpoint = EventsEndpoint()
+        self.client = Shift4Client(
+            "sk_test", transport=InProcessTransport(self.endpoint)
+        )
+
+    def consumer(self, handler, store=None, **kwargs):
+        store = store or FileCheckpointStore(self.path)
+        return EventConsumer(self.client.events, handler, store, **kwargs)
+
+    def test_first_poll_starts_at_latest_event(self):
+        self.endpoint.add(5)
+        handler = Handler()
+        consumer = self.consumer(handler)
+
+        self.assertEqual(consumer.poll(), 0)
+        self.assertEqual(handler.batches, [])
+        self.assertEqual(consumer.store.load(), ("evt_004", 1004))
+
+        self.endpoint.add(3)
+        self.assertEqual(consumer.poll(), 3)
+        self.assertEqual(handler.batches, [["evt_005", "evt_006", "evt_007"]])
+
+    def test_handles_new_events_oldest_first_in_batches(self):
+        self.endpoint.add(25)
+        handler = Handler()
+        consumer = self.consumer(
+            handler, from_beginning=True, batch_size=10, page_size=10
+        )
+
+        self.assertEqual(consumer.poll(), 25)
+        self.assertEqual(handler.ids, ["evt_%03d" % i for i in range(25)])
+        self.assertEqual([len(batch) for batch in handler.batches], [5, 10, 10])
+        self.assertEqual(consumer.store.load(), ("evt_024", 1024))
+        self.assertEqual(consumer.poll(), 0)
+
+    def test_lists_only_events_after_cursor(self):
+        self.endpoint.add(50)
+        consumer = self.consumer(Handler(), page_size=10)
+        consumer.poll()
+        self.endpoint.add(3)
+        self.endpoint.requests = []
+
+        self.assertEqual(consumer.poll(), 3)
+        self.assertEqual(
+            self.endpoint.requests, [{"limit": "10", "endingBeforeId": "evt_049"}]
+        )
+
+    def test_walks_forward_committing_each_page(self):
+        self.endpoint.add(1)
+        handler = Handler()
+        consumer = self.consumer(handler, page_size=10)
+        consumer.poll()
+        self.endpoint.add(30)
+        self.endpoint.requests = []
+        self.endpoint.fail_at = 3
+
+        with self.assertRaises(Shift4Exception):
+            consumer.poll()
+        self.assertEqual(handler.ids, ["evt_%03d" % i for i in range(1, 21)])
+        self.assertEqual(consumer.store.load(), ("evt_020", 1020))
+
+        self.endpoint.requests = []
+        self.endpoint.fail_at = None
+        self.assertEqual(consumer.poll(), 10)
+        self.assertEqual(
+            self.endpoint.requests, [{"limit": "10", "endingBeforeId": "evt_020"}]
+        )
+        self.assertEqual(handler.ids, ["evt_%03d" % i for i in range(1, 31)])
+
+    def test_cursor_advances_only_after_handler_succeeds(self):
+        self.endpoint.add(10)
+        handler = Handler(fail_on="evt_005")
+        consumer = self.consumer(handler, from_beginning=True, batch_size=3)
+
+        with self.assertRaises(ValueError):
+            consumer.poll()
+        self.assertEqual(handler.ids, ["evt_000", "evt_001", "evt_002"])
+        self.assertEqual(consumer.store.load(), ("evt_002", 1002))
+
+        handler.fail_on = None
+        restarted = self.consumer(handler, batch_size=3)
+        self.assertEqual(restarted.poll(), 7)
+        self.assertEqual(handler.ids, ["evt_%03d" % i for i in range(10)])
+
+    def test_skips_seen_events(self):
+        self.endpoint.add(4)
+        handler = Handler()
+        consumer = self.consumer(handler, from_beginning=True)
+        consumer.poll()
+
+        # As if the process stopped after handling evt_003 but before saving
+        # the cursor.
+        consumer.store.save("evt_001", 1001)
+        self.assertEqual(consumer.poll(), 0)
+        self.assertEqual(handler.ids, ["evt_000", "evt_001", "evt_002", "evt_003"])
+        self.assertEqual(consumer.store.load(), ("evt_003", 1003))
+
+    def test_raises_when_cursor_event_is_gone(self):
+        self.endpoint.add(10)
+        handler = Handler()
+        consumer = self.consumer(handler, page_size=3)
+        consumer.store.save("evt_gone", 1005)
+        self.endpoint.add(2)
+        self.endpoint.requests = []
+
+        with self.assertRaises(Shift4CursorNotFoundException) as context:
+            consumer.poll()
+
+        self.assertEqual(context.exception.event_id, "evt_gone")
+        self.assertEqual(handler.batches, [])
+        self.assertEqual(len(self.endpoint.requests), 2)
+        self.assertEqual(consumer.store.load(), ("evt_gone", 1005))
+
+    def test_sqlite_store(self):
+        first = SQLiteCheckpointStore(self.path, name="fulfillment")
+        second = SQLiteCheckpointStore(self.path, name="reconciliation")
+
+        self.assertIsNone(first.load())
+        first.save("evt_001", 1001)
+        first.save("evt_002", 1002)
+        second.save("evt_009", 1009)
+
+        self.assertEqual(
+            SQLiteCheckpointStore(self.path, "fulfillment").load(), ("evt_002", 1002)
+        )
+        self.assertEqual(second.load(), ("evt_009", 1009))
+
+    def test_imports_without_sqlite(self):
+        code = (
+            "import sys; sys.modules['sqlite3'] = sys.modules['_sqlite3'] = None; "
+            "import shift4; shift4.FileCheckpointStore"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_async_consumer(self):
+        self.endpoint.add(5)
+        handled = []
+
+        async def handler(batch):
+            handled.extend(event["id"] for event in batch)
+
+        async def run():
+            async with AsyncShift4Client(
+                "sk_test", transport=AsyncInProcessTransport(self.endpoint)
+            ) as client:
+                consumer = AsyncEventConsumer(
+                    client.events, handler, SQLiteCheckpointStore(self.path)
+                )
+                self.assertEqual(await consumer.poll(), 0)
+                self.endpoint.add(2)
+                self.assertEqual(await consumer.poll(), 2)
+                return consumer.store.load()
+
+        self.assertEqual(asyncio.run(run()), ("evt_006", 1006))
+        self.assertEqual(handled, ["evt_005", "evt_006"])
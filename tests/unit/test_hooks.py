@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+
+from shift4 import (
+    AsyncShift4Client,
+    Hooks,
+    RetryPolicy,
+    Shift4Client,
+    Shift4Exception,
+)
+from shift4.transport import Response
+from tests.unit.support.mocks import AsyncStubTransport, StubTransport
+
+DECLINED = (402, {"error": {"type": "card_error", "code": "card_declined"}})
+
+
+class TestHooks(unittest.TestCase):
+    def test_before_send_can_change_request(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+
+        def add_trace_header(request):
+            request.headers["traceparent"] = "00-abc-def-01"
+
+        client.hooks.add("before_send", add_trace_header)
+        client.charges.get("char_1")
+
+        self.assertEqual(
+            client.transport.requests[0].headers["traceparent"], "00-abc-def-01"
+        )
+
+    def test_hooks_run_in_order_for_every_attempt(self):
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(
+                (503, {"error": {"type": "api_error"}}), (200, {"id": "char_1"})
+            ),
+            retry_policy=RetryPolicy(backoff_factor=0),
+        )
+        events = []
+        client.hooks.add("before_send", lambda request: events.append("first"))
+        client.hooks.add("before_send", lambda request: events.append("second"))
+        client.hooks.add(
+            "after_response",
+            lambda request, response: events.append(response.status_code),
+        )
+
+        client.charges.get("char_1")
+
+        self.assertEqual(events, ["first", "second", 503, "first", "second", 200])
+
+    def test_before_send_can_answer_request(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+        client.hooks.add(
+            "before_send",
+            lambda request: Response(200, {}, b'{"id": "cached"}'),
+        )
+
+        self.assertEqual(client.plans.get("plan_1"), {"id": "cached"})
+        self.assertEqual(client.transport.requests, [])
+
+    def test_after_response_can_replace_response(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+        client.hooks.add(
+            "after_response",
+            lambda request, response: Response(200, {}, b'{"id": "replaced"}'),
+        )
+
+        self.assertEqual(client.plans.get("plan_1"), {"id": "replaced"})
+
+    def test_on_error_sees_failed_calls(self):
+        client = Shift4Client("sk_test", transport=StubTransport(DECLINED))
+        errors = []
+        client.hooks.add(
+            "on_error", lambda request, error: errors.append((request.path, error))
+        )
+
+        with self.assertRaises(Shift4Exception):
+            client.charges.create({"amount": 100})
+
+        self.assertEqual(errors[0][0], "/charges")
+        self.assertEqual(errors[0][1].code, "card_declined")
+
+    def test_unknown_event(self):
+        with self.assertRaises(ValueError):
+            Hooks().add("before_request", lambda request: None)
+
+    def test_hooks_are_per_client(self):
+        hooked = Shift4Client("sk_test", transport=StubTransport())
+        other = Shift4Client("sk_test", transport=StubTransport())
+        hooked.hooks.add("before_send", lambda request: Response(200, {}, b"{}"))
+
+        other.plans.get("plan_1")
+
+        self.assertEqual(len(other.transport.requests), 1)
+
+    def test_async_hooks(self):
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncStubTransport((200, {"id": "a"}), DECLINED)
+        )
+        events = []
+
+        async def before_send(request):
+            request.headers["X-Audit"] = "1"
+
+        async def on_error(request, error):
+            events.append(error.code)
+
+        client.hooks.add("before_send", before_send)
+        client.hooks.add(
+            "after_response",
+            lambda request, response: events.append(response.status_code),
+        )
+        client.hooks.add("on_error", on_error)
+
+        async def run():
+            await client.charges.get("char_1")
+            with self.assertRaises(Shift4Exception):
+                await client.charges.get("char_2")
+
+        asyncio.run(run())
+
+        self.assertEqual(events, [200, 402, "card_declined"])
+        self.assertEqual(client.transport.requests[0].headers["X-Audit"], "1")
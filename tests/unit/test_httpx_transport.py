@@ -0,0 +1,63 @@
+import unittest
+
+import httpx
+
+import shift4 as api
+from shift4 import HttpxTransport, RetryPolicy, Shift4Client
+
+
+def transport(handler):
+    return HttpxTransport(
+        http_client=httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+
+class TestHttpxTransport(unittest.TestCase):
+    def test_http2_client_option(self):
+        client = Shift4Client("sk_test", http2=True)
+
+        self.assertIsInstance(client.transport, HttpxTransport)
+        client.close()
+
+    def test_request(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json={"id": "cust_1"})
+
+        client = Shift4Client("sk_test", transport=transport(handler))
+
+        self.assertEqual(client.customers.list({"limit": 10}), {"id": "cust_1"})
+        self.assertEqual(
+            str(requests[0].url), "https://api.shift4.com/customers?limit=10"
+        )
+
+    def test_timeout_raises_timeout_exception(self):
+        def handler(request):
+            raise httpx.ConnectTimeout("connect timed out", request=request)
+
+        client = Shift4Client(
+            "sk_test",
+            transport=transport(handler),
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+        with self.assertRaises(api.Shift4TimeoutException):
+            client.charges.get("char_1")
+
+    def test_connection_error_is_retried(self):
+        responses = [httpx.ConnectError("connection reset")]
+
+        def handler(request):
+            if responses:
+                raise responses.pop()
+            return httpx.Response(200, json={"id": "char_1"})
+
+        client = Shift4Client(
+            "sk_test",
+            transport=transport(handler),
+            retry_policy=RetryPolicy(backoff_factor=0),
+        )
+
+        self.assertEqual(client.charges.get("char_1"), {"id": "char_1"})
@@ -0,0 +1,223 @@
+import asyncio
+import unittest
+
+import requests
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+from opentelemetry import trace
+from opentelemetry.trace import StatusCode
+from prometheus_client import CollectorRegistry
+
+from shift4 import (
+    AsyncShift4Client,
+    CompositeInstrumentation,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    PrometheusInstrumentation,
+    RetryPolicy,
+    Shift4Client,
+    Shift4Exception,
+)
+from tests.unit.support.mocks import AsyncStubTransport, StubTransport
+
+DECLINED = (402, {"error": {"type": "card_error", "code": "card_declined"}})
+UNAVAILABLE = (503, {"error": {"type": "api_error"}})
+NO_WAIT = RetryPolicy(backoff_factor=0)
+
+
+class Recorder(Instrumentation):
+    def __init__(self):
+        self.started = []
+        self.finished = []
+
+    def start(self, call):
+        self.started.append(call)
+
+    def finish(self, call):
+        self.finished.append(call)
+
+
+class TestInstrumentation(unittest.TestCase):
+    def client(self, instrumentation, *responses):
+        return Shift4Client(
+            "sk_test",
+            transport=StubTransport(*responses),
+            retry_policy=NO_WAIT,
+            instrumentation=instrumentation,
+        )
+
+    def test_records_successful_call(self):
+        recorder = Recorder()
+        client = self.client(recorder, (200, {"id": "char_1"}))
+
+        client.charges.capture("char_1")
+
+        call = recorder.finished[0]
+        self.assertIs(recorder.started[0], call)
+        self.assertEqual(call.method, "POST")
+        self.assertEqual(call.route, "/charges/{id}/capture")
+        self.assertEqual(call.resource, "charges")
+        self.assertEqual(call.status_code, 200)
+        self.assertEqual(call.retries, 0)
+        self.assertEqual(call.bytes_received, len(b'{"id": "char_1"}'))
+        self.assertGreater(call.duration, 0)
+        self.assertIsNone(call.error)
+
+    def test_records_retries_and_bytes_sent(self):
+        recorder = Recorder()
+        client = self.client(recorder, UNAVAILABLE, (200, {"id": "cust_1"}))
+
+        client.customers.create({"email": "user@example.com"})
+
+        call = recorder.finished[0]
+        self.assertEqual(call.retries, 1)
+        self.assertEqual(call.bytes_sent, 2 * len(client.transport.requests[0].body))
+
+    def test_records_api_errors(self):
+        recorder = Recorder()
+        client = self.client(recorder, DECLINED)
+
+        with self.assertRaises(Shift4Exception):
+            client.charges.create({"amount": 100})
+
+        call = recorder.finished[0]
+        self.assertEqual(call.status_code, 402)
+        self.assertEqual(call.error_type, "card_error")
+        self.assertEqual(call.error_code, "card_declined")
+
+    def test_records_connection_errors(self):
+        recorder = Recorder()
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(requests.ConnectionError("refused")),
+            retry_policy=RetryPolicy(max_attempts=1),
+            instrumentation=recorder,
+        )
+
+        with self.assertRaises(requests.ConnectionError):
+            client.plans.get("plan_1")
+
+        call = recorder.finished[0]
+        self.assertIsNone(call.status_code)
+        self.assertEqual(call.error_type, "ConnectionError")
+
+    def test_async_client(self):
+        recorder = Recorder()
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncStubTransport(), instrumentation=recorder
+        )
+
+        asyncio.run(client.cards.get("cust_1", "card_1"))
+
+        self.assertEqual(recorder.finished[0].route, "/customers/{id}/cards/{id}")
+
+
+class TestPrometheusInstrumentation(unittest.TestCase):
+    def test_exports_metrics(self):
+        registry = CollectorRegistry()
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(UNAVAILABLE, (200, {"id": "char_1"}), DECLINED),
+            retry_policy=NO_WAIT,
+            instrumentation=PrometheusInstrumentation(registry),
+        )
+
+        client.charges.get("char_1")
+        with self.assertRaises(Shift4Exception):
+            client.charges.get("char_2")
+
+        labels = {"resource": "charges", "method": "GET", "route": "/charges/{id}"}
+        sample = registry.get_sample_value
+        self.assertEqual(sample("shift4_requests_total", dict(labels, status="200")), 1)
+        self.assertEqual(sample("shift4_requests_total", dict(labels, status="402")), 1)
+        self.assertEqual(
+            sample(
+                "shift4_errors_total",
+                dict(labels, type="card_error", code="card_declined"),
+            ),
+            1,
+        )
+        self.assertEqual(sample("shift4_retries_total", labels), 1)
+        self.assertEqual(sample("shift4_request_duration_seconds_count", labels), 2)
+        self.assertEqual(
+            sample("shift4_requests_in_flight", {"resource": "charges"}), 0
+        )
+        self.assertGreater(sample("shift4_response_bytes_total", labels), 0)
+
+
+class TestOpenTelemetryInstrumentation(unittest.TestCase):
+    def test_exports_spans(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        recorder = Recorder()
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport((200, {"id": "sub_1"}), DECLINED),
+            instrumentation=CompositeInstrumentation(
+                OpenTelemetryInstrumentation(provider.get_tracer("test")), recorder
+            ),
+        )
+
+        client.subscriptions.get("sub_1")
+        with self.assertRaises(Shift4Exception):
+            client.subscriptions.get("sub_2")
+
+        ok, failed = exporter.get_finished_spans()
+        self.assertEqual(ok.name, "GET /subscriptions/{id}")
+        self.assertEqual(ok.attributes["http.response.status_code"], 200)
+        self.assertEqual(ok.attributes["shift4.resource"], "subscriptions")
+        self.assertEqual(failed.status.status_code, StatusCode.ERROR)
+        self.assertEqual(failed.attributes["error.type"], "card_error")
+        self.assertEqual(len(recorder.finished), 2)
+
+    def test_span_is_current_while_the_call_runs(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer = provider.get_tracer("test")
+        seen = []
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport((200, {"id": "char_1"})),
+            instrumentation=OpenTelemetryInstrumentation(tracer),
+        )
+        client.hooks.add(
+            "before_send", lambda request: seen.append(trace.get_current_span())
+        )
+
+        with tracer.start_as_current_span("checkout") as parent:
+            client.charges.get("char_1")
+            self.assertIs(trace.get_current_span(), parent)
+
+        span = exporter.get_finished_spans()[0]
+        self.assertEqual(seen[0].get_span_context(), span.get_span_context())
+        self.assertEqual(span.parent.span_id, parent.get_span_context().span_id)
+
+    def test_async_span_is_current_while_the_call_runs(self):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        seen = []
+
+        async def run():
+            client = AsyncShift4Client(
+                "sk_test",
+                transport=AsyncStubTransport((200, {"id": "char_1"})),
+                instrumentation=OpenTelemetryInstrumentation(
+                    provider.get_tracer("test")
+                ),
+            )
+            client.hooks.add(
+                "before_send",
+                lambda request: seen.append(trace.get_current_span()),
+            )
+            await client.charges.get("char_1")
+
+        asyncio.run(run())
+
+        span = exporter.get_finished_spans()[0]
+        self.assertEqual(seen[0].get_span_context(), span.get_span_context())
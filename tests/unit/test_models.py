@@ -0,0 +1,104 @@
+import copy
+import pickle
+import tracemalloc
+import unittest
+
+from shift4 import (
+    Card,
+    Charge,
+    Customer,
+    InProcessTransport,
+    ListResponse,
+    Shift4Client,
+)
+from tests.unit.support import fixtures
+
+
+class TestModels(unittest.TestCase):
+    def setUp(self):
+        self.data = fixtures.charge()
+        self.charge = Charge.from_json(self.data)
+
+    def test_dict_style_access(self):
+        self.assertEqual(self.charge["amount"], self.data["amount"])
+        self.assertEqual(self.charge.get("description"), self.data["description"])
+        self.assertIsNone(self.charge.get("failureCode"))
+        self.assertIn("card", self.charge)
+        self.assertNotIn("failureCode", self.charge)
+        self.assertEqual(set(self.charge.keys()), set(self.data.keys()))
+        with self.assertRaises(KeyError):
+            self.charge["failureCode"]
+
+    def test_attribute_access(self):
+        self.assertEqual(self.charge.amount, self.data["amount"])
+        self.assertIsNone(self.charge.failureCode)
+        with self.assertRaises(AttributeError):
+            self.charge.unknownField
+
+    def test_nested_models(self):
+        self.assertIsInstance(self.charge.card, Card)
+        self.assertEqual(self.charge["card"]["last4"], "4242")
+        customer = Customer.from_json(fixtures.customer())
+        self.assertIsInstance(customer.cards[0], Card)
+
+    def test_unknown_fields_are_kept(self):
+        charge = Charge.from_json(dict(self.data, newField="value"))
+
+        self.assertEqual(charge["newField"], "value")
+        self.assertEqual(charge.newField, "value")
+
+    def test_equals_source_dict(self):
+        self.assertEqual(self.charge, self.data)
+        self.assertEqual(self.data, self.charge)
+        self.assertEqual(self.charge.to_dict(), self.data)
+        self.assertEqual(dict(self.charge)["card"], self.data["card"])
+
+    def test_mutation(self):
+        self.charge["description"] = "updated"
+        self.charge["newField"] = 1
+        del self.charge["metadata"]
+
+        self.assertEqual(self.charge.description, "updated")
+        self.assertEqual(self.charge["newField"], 1)
+        self.assertNotIn("metadata", self.charge)
+
+    def test_copy_and_pickle(self):
+        self.assertEqual(pickle.loads(pickle.dumps(self.charge)), self.data)
+        self.assertEqual(copy.deepcopy(self.charge), self.data)
+
+    def test_uses_less_memory_than_dicts(self):
+        def allocated(factory):
+            tracemalloc.start()
+            objects = [factory(fixtures.charge(i)) for i in range(200)]
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del objects
+            return size
+
+        self.assertLess(allocated(Charge.from_json), allocated(lambda d: d))
+
+
+class TestClientModels(unittest.TestCase):
+    def setUp(self):
+        def handler(request):
+            if request.path == "/charges":
+                return 200, fixtures.page(3)
+            return 200, fixtures.charge()
+
+        self.transport = InProcessTransport(handler)
+
+    def test_disabled_by_default(self):
+        client = Shift4Client("sk_test", transport=self.transport)
+
+        self.assertIs(type(client.charges.get("char_1")), dict)
+
+    def test_enabled_per_client(self):
+        client = Shift4Client("sk_test", transport=self.transport, use_models=True)
+
+        charge = client.charges.get("char_1")
+        page = client.charges.list()
+
+        self.assertIsInstance(charge, Charge)
+        self.assertIsInstance(page, ListResponse)
+        self.assertIsInstance(page["list"][0], Charge)
+        self.assertFalse(page.hasMore)
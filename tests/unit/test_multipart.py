@@ -0,0 +1,174 @@
+import asyncio
+import io
+import mmap
+import os
+import tempfile
+import unittest
+
+from shift4 import (
+    AsyncHttpxTransport,
+    AsyncShift4Client,
+    HttpxTransport,
+    PooledTransport,
+    Shift4Client,
+)
+from shift4.multipart import MultipartEncoder
+from tests.unit.support.server import EchoServer
+
+PDF = b"%PDF-1.4\n" + bytes(range(256)) * 40
+
+
+def expected_body(boundary, filename, content_type, data):
+    return (
+        b"--" + boundary.encode() + b"\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="'
+        + filename.encode()
+        + b'"\r\nContent-Type: '
+        + content_type.encode()
+        + b"\r\n\r\n"
+        + data
+        + b"\r\n--"
+        + boundary.encode()
+        + b"--\r\n"
+    )
+
+
+class TestMultipartEncoder(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(handle, "wb") as file:
+            file.write(PDF)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def encode(self, value, **kwargs):
+        return MultipartEncoder({"file": value}, boundary="b0undary", **kwargs)
+
+    def test_encodes_every_source(self):
+        name = os.path.basename(self.path)
+        with open(self.path, "rb") as file, open(self.path, "r+b") as mapped:
+            with mmap.mmap(mapped.fileno(), 0) as mapping:
+                sources = {
+                    "path": (self.path, name, "application/pdf"),
+                    "file": (file, name, "application/pdf"),
+                    "mmap": (("e.pdf", mapping), "e.pdf", "application/pdf"),
+                    "bytes": (PDF, "file", "application/octet-stream"),
+                    "memoryview": (
+                        ("e.bin", memoryview(PDF), "application/x-evidence"),
+                        "e.bin",
+                        "application/x-evidence",
+                    ),
+                }
+                for source, (value, filename, content_type) in sources.items():
+                    with self.subTest(source):
+                        encoder = self.encode(value)
+                        body = b"".join(encoder)
+
+                        self.assertEqual(
+                            body,
+                            expected_body("b0undary", filename, content_type, PDF),
+                        )
+                        self.assertEqual(len(encoder), len(body))
+
+    def test_str_in_tuple_is_content(self):
+        encoder = self.encode(("a.txt", "inline tekst ż"))
+
+        self.assertEqual(
+            b"".join(encoder),
+            expected_body("b0undary", "a.txt", "text/plain", "inline tekst ż".encode()),
+        )
+
+    def test_read_in_blocks(self):
+        encoder = self.encode(self.path, chunk_size=1000)
+        expected = b"".join(self.encode(self.path))
+
+        blocks = iter(lambda: encoder.read(8192), b"")
+
+        self.assertEqual(b"".join(blocks), expected)
+
+    def test_slices_buffers_without_copying(self):
+        encoder = self.encode(PDF, chunk_size=4096)
+
+        chunks = list(encoder)[1:-2]
+
+        self.assertTrue(all(isinstance(chunk, memoryview) for chunk in chunks))
+        self.assertEqual(max(len(chunk) for chunk in chunks), 4096)
+
+    def test_reports_progress(self):
+        progress = []
+        encoder = self.encode(io.BytesIO(PDF), progress=lambda *p: progress.append(p))
+
+        list(encoder)
+
+        sent = [sent for sent, _ in progress]
+        self.assertEqual(sent, sorted(sent))
+        self.assertEqual(progress[-1], (len(encoder), len(encoder)))
+
+    def test_closes_files_it_opened(self):
+        user_file = open(self.path, "rb")
+        encoder = MultipartEncoder({"a": self.path, "b": user_file})
+
+        list(encoder)
+
+        self.assertIsNone(encoder._parts[0]._opened)
+        self.assertFalse(user_file.closed)
+        user_file.close()
+
+    def test_closes_files_when_abandoned(self):
+        encoder = self.encode(self.path, chunk_size=100)
+        chunks = iter(encoder)
+        next(chunks)
+        next(chunks)
+        opened = encoder._parts[0]._opened
+
+        encoder.close()
+
+        self.assertTrue(opened.closed)
+
+
+class TestStreamingUploads(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(handle, "wb") as file:
+            file.write(PDF)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def upload(self, transport):
+        with EchoServer() as server:
+            client = Shift4Client(
+                "sk_test", uploads_url=server.url, transport=transport
+            )
+            progress = []
+            response = client.file_uploads.upload(
+                self.path,
+                {"purpose": "dispute_evidence"},
+                progress=lambda sent, total: progress.append(sent),
+            )
+            client.close()
+        body = response["body"].encode("latin-1")
+        self.assertIn(PDF, body)
+        self.assertIn(b'filename="%s"' % os.path.basename(self.path).encode(), body)
+        self.assertEqual(progress[-1], len(body))
+
+    def test_pooled_transport(self):
+        self.upload(PooledTransport())
+
+    def test_httpx_transport(self):
+        self.upload(HttpxTransport(http2=False))
+
+    def test_async_httpx_transport(self):
+        async def run(url):
+            async with AsyncShift4Client(
+                "sk_test", uploads_url=url, transport=AsyncHttpxTransport()
+            ) as client:
+                return await client.file_uploads.upload(
+                    self.path, {"purpose": "dispute_evidence"}
+                )
+
+        with EchoServer() as server:
+            response = asyncio.run(run(server.url))
+
+        self.assertIn(PDF, response["body"].encode("latin-1"))
@@ -0,0 +1,146 @@
+import asyncio
+import time
+import unittest
+from urllib.parse import parse_qs
+
+from shift4 import (
+    AsyncInProcessTransport,
+    AsyncShift4Client,
+    InProcessTransport,
+    Shift4Client,
+    Shift4Exception,
+)
+from tests.unit.support.timing import wait_for
+
+
+class ListEndpoint(object):
+    # Serves items newest first, like the API's list endpoints.
+    def __init__(self, count, prefix="char"):
+        self.items = [{"id": "%s_%03d" % (prefix, i)} for i in range(count)]
+        self.requests = []
+        self.fail_at = None
+
+    def __call__(self, request):
+        query = {k: v[0] for k, v in parse_qs(request.query).items()}
+        self.requests.append((request.path, query))
+        start = 0
+        if "startingAfterId" in query:
+            ids = [item["id"] for item in self.items]
+            start = ids.index(query["startingAfterId"]) + 1
+        limit = int(query.get("limit", 10))
+        if self.fail_at is not None and start >= self.fail_at:
+            return 500, {"error": {"type": "api_error"}}
+        page = self.items[start : start + limit]
+        return 200, {"list": page, "hasMore": start + limit < len(self.items)}
+
+
+class TestPagination(unittest.TestCase):
+    def test_iterates_over_all_pages(self):
+        endpoint = ListEndpoint(25)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        items = list(client.charges.iter_all({"customerId": "cust_1"}, page_size=10))
+
+        self.assertEqual(items, endpoint.items)
+        self.assertEqual(
+            [query for _, query in endpoint.requests],
+            [
+                {"customerId": "cust_1", "limit": "10"},
+                {"customerId": "cust_1", "limit": "10", "startingAfterId": "char_009"},
+                {"customerId": "cust_1", "limit": "10", "startingAfterId": "char_019"},
+            ],
+        )
+
+    def test_is_lazy(self):
+        endpoint = ListEndpoint(250)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        iterator = client.events.iter_all()
+        first = next(iterator)
+
+        self.assertEqual(first, {"id": "char_000"})
+        self.assertEqual(len(endpoint.requests), 1)
+        self.assertEqual(endpoint.requests[0][1]["limit"], "100")
+
+    def test_respects_limit_param(self):
+        endpoint = ListEndpoint(5)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        list(client.customers.iter_all({"limit": 2}))
+
+        self.assertEqual(len(endpoint.requests), 3)
+
+    def test_cards_of_customer(self):
+        endpoint = ListEndpoint(3, "card")
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        items = list(client.cards.iter_all("cust_1"))
+
+        self.assertEqual(items, endpoint.items)
+        self.assertEqual(endpoint.requests[0][0], "/customers/cust_1/cards")
+
+    def test_prefetch_requests_next_page_in_background(self):
+        endpoint = ListEndpoint(50)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        iterator = client.charges.iter_all(page_size=10, prefetch=2)
+        next(iterator)
+
+        wait_for(lambda: len(endpoint.requests) == 3)
+        time.sleep(0.05)
+        self.assertEqual(len(endpoint.requests), 3)
+        self.assertEqual(list(iterator), endpoint.items[1:])
+        self.assertEqual(len(endpoint.requests), 5)
+
+    def test_prefetch_raises_errors_in_order(self):
+        endpoint = ListEndpoint(30)
+        endpoint.fail_at = 20
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        items = []
+        with self.assertRaises(Shift4Exception):
+            for item in client.charges.iter_all(page_size=10, prefetch=1):
+                items.append(item)
+
+        self.assertEqual(items, endpoint.items[:20])
+
+    def test_prefetch_stops_when_iterator_is_closed(self):
+        endpoint = ListEndpoint(100)
+        client = Shift4Client("sk_test", transport=InProcessTransport(endpoint))
+
+        iterator = client.charges.iter_all(page_size=10, prefetch=1)
+        next(iterator)
+        iterator.close()
+
+        time.sleep(0.3)
+        self.assertLessEqual(len(endpoint.requests), 2)
+
+    def test_async_iterates_over_all_pages(self):
+        endpoint = ListEndpoint(25)
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncInProcessTransport(endpoint)
+        )
+
+        async def run():
+            return [item async for item in client.charges.iter_all(page_size=10)]
+
+        self.assertEqual(asyncio.run(run()), endpoint.items)
+        self.assertEqual(len(endpoint.requests), 3)
+
+    def test_async_prefetch(self):
+        endpoint = ListEndpoint(25)
+        client = AsyncShift4Client(
+            "sk_test", transport=AsyncInProcessTransport(endpoint)
+        )
+
+        async def run():
+            iterator = client.charges.iter_all(page_size=10, prefetch=1)
+            first = await iterator.__anext__()
+            await asyncio.sleep(0.01)
+            prefetched = len(endpoint.requests)
+            rest = [item async for item in iterator]
+            return [first] + rest, prefetched
+
+        items, prefetched = asyncio.run(run())
+        self.assertEqual(items, endpoint.items)
+        self.assertEqual(prefetched, 2)
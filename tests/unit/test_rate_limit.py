@@ -0,0 +1,113 @@
+import asyncio
+import time
+import unittest
+
+from shift4 import (
+    AsyncShift4Client,
+    RateLimiter,
+    RetryPolicy,
+    Shift4Client,
+    TokenBucket,
+)
+from tests.unit.support.mocks import AsyncStubTransport, StubTransport
+from tests.unit.support.timing import FakeClock
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_allows_burst_then_spaces_requests(self):
+        bucket = TokenBucket(rate=2, burst=2, clock=self.clock)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        self.assertEqual(waits, [0, 0, 0.5, 1.0])
+
+    def test_refills_over_time(self):
+        bucket = TokenBucket(rate=2, burst=2, clock=self.clock)
+        bucket.reserve()
+        bucket.reserve()
+        self.assertEqual(bucket.wait_time(), 0.5)
+
+        self.clock.now = 0.5
+
+        self.assertEqual(bucket.wait_time(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+
+    def test_throttle_honors_retry_after_and_lowers_rate(self):
+        bucket = TokenBucket(rate=10, burst=10, clock=self.clock)
+
+        bucket.throttle(retry_after=3)
+
+        self.assertEqual(bucket.rate, 5)
+        self.assertAlmostEqual(bucket.wait_time(), 3)
+        self.assertAlmostEqual(bucket.reserve(), 3)
+
+    def test_rate_recovers_up_to_configured_rate(self):
+        bucket = TokenBucket(rate=10, min_rate=2, increase=1, clock=self.clock)
+
+        for _ in range(5):
+            bucket.throttle()
+        self.assertEqual(bucket.rate, 2)
+        for _ in range(20):
+            bucket.recover()
+
+        self.assertEqual(bucket.rate, 10)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_endpoint_groups_have_own_buckets(self):
+        clock = FakeClock()
+        uploads = TokenBucket(rate=1, burst=1, clock=clock)
+        limiter = RateLimiter(groups={"files": uploads})
+
+        self.assertEqual(limiter.reserve("/files"), 0)
+        self.assertEqual(limiter.reserve("/files/file_1"), 1)
+        self.assertEqual(limiter.reserve("/charges"), 0)
+        self.assertEqual(limiter.wait_time("/files"), 2)
+
+    def test_client_waits_for_tokens(self):
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(),
+            rate_limiter=RateLimiter(rate=50, burst=1),
+        )
+
+        started = time.monotonic()
+        for _ in range(3):
+            client.charges.get("char_1")
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.035)
+
+    def test_429_tightens_limit(self):
+        limiter = RateLimiter(rate=100)
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(
+                (429, {"Retry-After": "0"}, {"error": {"type": "rate_limit"}}),
+                (200, {"id": "char_1"}),
+            ),
+            rate_limiter=limiter,
+            retry_policy=RetryPolicy(max_attempts=2),
+        )
+
+        client.charges.get("char_1")
+
+        self.assertEqual(len(client.transport.requests), 2)
+        self.assertLess(limiter.bucket.rate, 100)
+
+    def test_async_client_waits_for_tokens(self):
+        client = AsyncShift4Client(
+            "sk_test",
+            transport=AsyncStubTransport(),
+            rate_limiter=RateLimiter(rate=50, burst=1),
+        )
+
+        async def run():
+            await asyncio.gather(*[client.charges.get("char_1") for _ in range(3)])
+
+        started = time.monotonic()
+        asyncio.run(run())
+
+        self.assertGreaterEqual(time.monotonic() - started, 0.035)
@@ -0,0 +1,124 @@
+import unittest
+
+import requests
+
+import shift4 as api
+from shift4 import RetryPolicy, Shift4Client
+from shift4.retry import parse_retry_after
+from tests.unit.support.mocks import StubTransport
+
+
+def client(*responses, **kwargs):
+    policy = RetryPolicy(backoff_factor=0, **kwargs)
+    return Shift4Client(
+        "sk_test", transport=StubTransport(*responses), retry_policy=policy
+    )
+
+
+def sent_headers(client, call=0):
+    return client.transport.requests[call].headers
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_retryable_requests(self):
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable("GET", {}))
+        self.assertTrue(policy.is_retryable("POST", {"Idempotency-Key": "key"}))
+        self.assertFalse(policy.is_retryable("POST", {}))
+        self.assertFalse(policy.is_retryable("DELETE", {}))
+
+    def test_exponential_backoff_without_jitter(self):
+        policy = RetryPolicy(
+            max_attempts=5, backoff_factor=1, max_backoff=3, jitter=False
+        )
+
+        self.assertEqual(
+            [policy.retry_delay(attempt) for attempt in range(1, 6)],
+            [1, 2, 3, 3, None],
+        )
+
+    def test_jitter_stays_within_backoff(self):
+        policy = RetryPolicy(backoff_factor=1)
+
+        for _ in range(100):
+            self.assertTrue(0 <= policy.retry_delay(2) <= 2)
+
+    def test_honors_retry_after(self):
+        policy = RetryPolicy(max_retry_after=10)
+
+        self.assertEqual(policy.retry_delay(1, 429, "3"), 3)
+        self.assertEqual(policy.retry_delay(1, 503, "120"), 10)
+        self.assertIsNone(policy.retry_delay(1, 400, "3"))
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("5"), 5)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertIsNone(parse_retry_after(None))
+
+
+class TestClientRetries(unittest.TestCase):
+    def test_retries_get_on_retryable_status(self):
+        c = client((503, "<html>"), (200, {"id": "char_1"}))
+
+        self.assertEqual(c.charges.get("char_1"), {"id": "char_1"})
+        self.assertEqual(len(c.transport.requests), 2)
+
+    def test_retries_get_on_connection_error(self):
+        c = client(requests.ConnectionError(), (200, {"id": "char_1"}))
+
+        self.assertEqual(c.charges.get("char_1"), {"id": "char_1"})
+
+    def test_gives_up_after_max_attempts(self):
+        c = client(
+            requests.ConnectionError(), requests.ConnectionError(), max_attempts=2
+        )
+
+        with self.assertRaises(requests.ConnectionError):
+            c.charges.get("char_1")
+
+    def test_post_gets_stable_generated_idempotency_key(self):
+        c = client((502, "<html>"), (200, {"id": "char_1"}))
+
+        c.charges.refund("char_1")
+
+        self.assertIn("Idempotency-Key", sent_headers(c, 0))
+        self.assertEqual(
+            sent_headers(c, 0)["Idempotency-Key"], sent_headers(c, 1)["Idempotency-Key"]
+        )
+
+    def test_keeps_explicit_idempotency_key(self):
+        c = client((200, {"id": "char_1"}))
+
+        c.charges.create({"amount": 100}, request_options={"idempotency_key": "key"})
+
+        self.assertEqual(sent_headers(c)["Idempotency-Key"], "key")
+
+    def test_does_not_retry_post_without_idempotency_key(self):
+        c = client((503, "<html>"))
+
+        with self.assertRaises(api.Shift4Exception):
+            c.charges.create({"amount": 100}, request_options={"idempotency_key": None})
+
+        self.assertEqual(len(c.transport.requests), 1)
+        self.assertNotIn("Idempotency-Key", sent_headers(c))
+
+    def test_per_call_timeout_keeps_generated_idempotency_key(self):
+        c = client(requests.ConnectionError(), (200, {"id": "char_1"}))
+
+        c.charges.create({"amount": 100}, request_options={"timeout": (1, 5)})
+
+        self.assertEqual(len(c.transport.requests), 2)
+        self.assertEqual(
+            sent_headers(c, 0)["Idempotency-Key"], sent_headers(c, 1)["Idempotency-Key"]
+        )
+
+    def test_non_json_error_raises_shift4_exception(self):
+        c = client((502, "<html>Bad Gateway</html>"), max_attempts=1)
+
+        with self.assertRaises(api.Shift4Exception) as context:
+            c.charges.get("char_1")
+
+        self.assertEqual(context.exception.type, "Internal error")
+        self.assertEqual(context.exception.message, "<html>Bad Gateway</html>")
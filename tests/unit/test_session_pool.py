@@ -0,0 +1,59 @@
+import threading
+import unittest
+
+from shift4.session_pool import SessionPool
+
+
+class TestSessionPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = SessionPool(pool_connections=2, pool_maxsize=5)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_adapter_is_shared_between_threads(self):
+        adapters = []
+
+        def mount():
+            session = self.pool._session("https://api.shift4.com")
+            adapters.append(session.get_adapter("https://api.shift4.com/charges"))
+
+        threads = [threading.Thread(target=mount) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(adapters), 4)
+        self.assertTrue(all(adapter is adapters[0] for adapter in adapters))
+        self.assertEqual(adapters[0]._pool_maxsize, 5)
+        self.assertEqual(adapters[0]._pool_connections, 2)
+        self.assertFalse(adapters[0]._pool_block)
+
+    def test_pool_block_limits_connections_per_host(self):
+        pool = SessionPool(pool_maxsize=3, pool_block=True)
+        self.addCleanup(pool.close)
+
+        session = pool._session("https://api.shift4.com")
+        adapter = session.get_adapter("https://api.shift4.com/charges")
+        connections = adapter.poolmanager.connection_from_url("https://api.shift4.com")
+
+        self.assertTrue(connections.block)
+        self.assertEqual(connections.pool.maxsize, 3)
+
+    def test_separate_adapters_per_base_url(self):
+        session = self.pool._session("https://api.shift4.com")
+        session = self.pool._session("https://uploads.api.shift4.com")
+
+        self.assertIsNot(
+            session.get_adapter("https://api.shift4.com/charges"),
+            session.get_adapter("https://uploads.api.shift4.com/files"),
+        )
+
+    def test_close_releases_adapters(self):
+        session = self.pool._session("https://api.shift4.com")
+
+        self.pool.close()
+
+        self.assertEqual(self.pool._adapters, {})
+        self.assertIsNot(self.pool._session("https://api.shift4.com"), session)
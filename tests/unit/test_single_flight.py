@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import unittest
+
+from shift4 import (
+    AsyncInProcessTransport,
+    AsyncShift4Client,
+    AsyncSingleFlight,
+    InProcessTransport,
+    Shift4Client,
+    Shift4Exception,
+    SingleFlight,
+)
+from tests.unit.support.timing import wait_for
+
+
+class BlockingEndpoint(object):
+    # Holds every request until release is set.
+    def __init__(self, status=200):
+        self.status = status
+        self.paths = []
+        self.release = threading.Event()
+
+    def __call__(self, request):
+        self.paths.append(request.path)
+        self.release.wait(2)
+        if self.status != 200:
+            return self.status, {"error": {"type": "invalid_request"}}
+        return 200, {"id": request.path.rsplit("/", 1)[1]}
+
+
+class TestSingleFlight(unittest.TestCase):
+    def get_concurrently(self, client, ids):
+        results = [None] * len(ids)
+
+        def get(index):
+            try:
+                results[index] = client.plans.get(ids[index])
+            except Shift4Exception as e:
+                results[index] = e
+
+        threads = [threading.Thread(target=get, args=(i,)) for i in range(len(ids))]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def test_concurrent_identical_gets_share_one_request(self):
+        endpoint = BlockingEndpoint()
+        client = Shift4Client(
+            "sk_test",
+            transport=InProcessTransport(endpoint),
+            single_flight=SingleFlight(),
+        )
+
+        threads, results = self.get_concurrently(client, ["plan_1"] * 5)
+        wait_for(lambda: client.single_flight.collapsed == 4)
+        endpoint.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(endpoint.paths, ["/plans/plan_1"])
+        self.assertEqual(results, [{"id": "plan_1"}] * 5)
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(
+            client.single_flight.stats(),
+            {"executed": 1, "collapsed": 4, "in_flight": 0},
+        )
+
+    def test_different_requests_are_not_collapsed(self):
+        endpoint = BlockingEndpoint()
+        endpoint.release.set()
+        client = Shift4Client(
+            "sk_test",
+            transport=InProcessTransport(endpoint),
+            single_flight=SingleFlight(),
+        )
+
+        threads, _ = self.get_concurrently(client, ["plan_1", "plan_2"])
+        for thread in threads:
+            thread.join()
+        client.plans.create({"amount": 100})
+        client.plans.create({"amount": 100})
+
+        self.assertEqual(len(endpoint.paths), 4)
+        self.assertEqual(client.single_flight.collapsed, 0)
+
+    def test_errors_are_shared(self):
+        endpoint = BlockingEndpoint(status=404)
+        client = Shift4Client(
+            "sk_test",
+            transport=InProcessTransport(endpoint),
+            single_flight=SingleFlight(),
+        )
+
+        threads, results = self.get_concurrently(client, ["plan_1"] * 3)
+        wait_for(lambda: client.single_flight.collapsed == 2)
+        endpoint.release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(endpoint.paths), 1)
+        for result in results:
+            self.assertIsInstance(result, Shift4Exception)
+
+    def test_async_client(self):
+        paths = []
+
+        async def handler(request):
+            paths.append(request.path)
+            await asyncio.sleep(0.01)
+            return 200, {"id": "plan_1"}
+
+        client = AsyncShift4Client(
+            "sk_test",
+            transport=AsyncInProcessTransport(handler),
+            single_flight=AsyncSingleFlight(),
+        )
+
+        async def run():
+            first = asyncio.ensure_future(client.plans.get("plan_1"))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await asyncio.gather(*[client.plans.get("plan_1") for _ in range(4)])
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [{"id": "plan_1"}] * 4)
+        self.assertEqual(paths, ["/plans/plan_1"])
+        self.assertEqual(client.single_flight.collapsed, 4)
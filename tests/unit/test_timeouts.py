@@ -0,0 +1,118 @@
+import time
+import unittest
+
+import requests
+
+import shift4 as api
+from shift4 import RetryPolicy, Shift4Client, Timeout, deadline
+from shift4.timeouts import time_remaining
+from tests.unit.support.mocks import StubTransport
+
+
+def sent_timeout(client, call=0):
+    return client.transport.timeouts[call]
+
+
+class TestTimeout(unittest.TestCase):
+    def test_of(self):
+        self.assertEqual(Timeout.of(5), Timeout(5, 5))
+        self.assertEqual(Timeout.of((1, 30)), Timeout(1, 30))
+        self.assertEqual(Timeout.of(None), Timeout())
+
+    def test_bounded(self):
+        self.assertEqual(Timeout(2, 30).bounded(5), Timeout(2, 5))
+        self.assertEqual(Timeout().bounded(5), Timeout(5, 5))
+
+
+class TestDeadline(unittest.TestCase):
+    def test_no_deadline_by_default(self):
+        self.assertIsNone(time_remaining())
+
+    def test_nested_deadline_cannot_extend_outer_one(self):
+        with deadline(1):
+            with deadline(60):
+                self.assertLessEqual(time_remaining(), 1)
+            with deadline(0.5):
+                self.assertLessEqual(time_remaining(), 0.5)
+        self.assertIsNone(time_remaining())
+
+
+class TestClientTimeouts(unittest.TestCase):
+    def test_client_timeout(self):
+        client = Shift4Client(
+            "sk_test", transport=StubTransport(), timeout=Timeout(connect=2, read=15)
+        )
+
+        client.charges.get("char_1")
+
+        self.assertEqual(sent_timeout(client), (2, 15))
+
+    def test_per_call_timeout(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+
+        client.charges.create({"amount": 100}, request_options={"timeout": (1, 5)})
+
+        self.assertEqual(sent_timeout(client), (1, 5))
+
+    def test_per_call_timeout_for_reads(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+
+        client.charges.get("char_1", request_options={"timeout": 2})
+        client.charges.list({"limit": 1}, request_options={"timeout": (1, 3)})
+        client.customers.delete("cust_1", request_options={"timeout": 4})
+
+        self.assertEqual(client.transport.timeouts, [(2, 2), (1, 3), (4, 4)])
+
+    def test_per_call_timeout_for_uploads_and_tokens(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+
+        client.file_uploads.upload(
+            ("receipt.pdf", b"%PDF"),
+            {"purpose": "dispute_evidence"},
+            request_options={"timeout": (2, 300)},
+        )
+        client.tokens.create({"number": "4242"}, request_options={"timeout": 3})
+
+        self.assertEqual(client.transport.timeouts, [(2, 300), (3, 3)])
+
+    def test_deadline_bounds_timeout(self):
+        client = Shift4Client("sk_test", transport=StubTransport(), timeout=(10, 60))
+
+        with deadline(3):
+            client.charges.get("char_1")
+
+        connect, read = sent_timeout(client)
+        self.assertLessEqual(connect, 3)
+        self.assertLessEqual(read, 3)
+
+    def test_fails_fast_when_deadline_is_spent(self):
+        client = Shift4Client("sk_test", transport=StubTransport())
+
+        with deadline(0.01):
+            time.sleep(0.02)
+            with self.assertRaises(api.Shift4TimeoutException):
+                client.charges.get("char_1")
+
+        self.assertEqual(client.transport.requests, [])
+
+    def test_does_not_wait_for_retry_beyond_deadline(self):
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport((503, {"Retry-After": "30"}, "<html>")),
+        )
+
+        with deadline(1):
+            with self.assertRaises(api.Shift4TimeoutException):
+                client.charges.get("char_1")
+
+    def test_transport_timeout_raises_timeout_exception(self):
+        client = Shift4Client(
+            "sk_test",
+            transport=StubTransport(requests.ReadTimeout("read timed out")),
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+
+        with self.assertRaises(api.Shift4TimeoutException) as context:
+            client.charges.get("char_1")
+
+        self.assertEqual(context.exception.type, "timeout")